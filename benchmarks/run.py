@@ -0,0 +1,400 @@
+"""
+Reproducible benchmarks for the validation, serialization and JSON-schema paths
+of every type. Run ``python -m benchmarks --help`` for usage.
+
+Results are saved as JSON so they can be compared across releases, e.g.::
+
+    python -m benchmarks --output baseline.json
+    # ... upgrade or change things ...
+    python -m benchmarks --compare baseline.json --threshold 0.1
+"""
+
+import json
+import os
+import platform
+import sys
+import timeit
+from argparse import ArgumentParser
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING, Annotated, Any, Optional
+
+from pydantic import BaseModel, TypeAdapter, create_model
+
+from eth_pydantic_types import (
+    Address,
+    AddressList,
+    Bip122Uri,
+    CompactHex,
+    HashIndex,
+    HexBytes,
+    HexStr,
+    hash_type,
+    int_type,
+    to_columns,
+    unpack_words,
+)
+from eth_pydantic_types.serializers import serialize_hex
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+HASH_SIZES = (4, 20, 32, 64)
+CHECKSUM_ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+GENESIS_HASH = "d4e56740f876aef8c010b86a40d5f56745a118d0906a34e69aec8c0db1cb8fa3"
+BLOCK_HASH = "752820c0ad7abc1200f9ad42c4adc6fbb4bd44b5bed4667990e64565102c1ba6"
+BIP122_URI = f"blockchain://{GENESIS_HASH}/block/{BLOCK_HASH}"
+CROSSOVER_SIZES = (1_000, 10_000, 100_000)
+STARTUP_MODELS = 1_000
+LOOKUP_KEYS = 100_000
+INDEX_KEYS = 100_000
+EXPORT_MODELS = 1_000
+
+Benchmark = Callable[[], Callable[[], Any]]
+"""
+A benchmark is a setup function returning the zero-argument function to time.
+"""
+
+
+def _inputs(size: int) -> dict[str, Any]:
+    # The same value in every supported input form.
+    value = bytes(range(1, size + 1))
+    return {
+        "str": f"0x{value.hex()}",
+        "bytes": value,
+        "int": int.from_bytes(value, "big"),
+        "non_canonical": value.hex().upper(),
+        "padded": f"0x{value[1:].hex()}",
+    }
+
+
+def _validate(tp: Any, value: Any) -> Benchmark:
+    def setup():
+        adapter = TypeAdapter(tp)
+        return lambda: adapter.validate_python(value)
+
+    return setup
+
+
+def _serialize(tp: Any, value: Any, context: Optional[dict] = None) -> Benchmark:
+    def setup():
+        adapter = TypeAdapter(tp)
+        validated = adapter.validate_python(value)
+        return lambda: adapter.dump_json(validated, context=context)
+
+    return setup
+
+
+def _json_schema(tp: Any) -> Benchmark:
+    def setup():
+        class Model(BaseModel):
+            value: tp
+
+        return Model.model_json_schema
+
+    return setup
+
+
+def _startup(count: int) -> Benchmark:
+    # Like services creating many (e.g. ABI-derived) models when starting up.
+    fields: dict[str, Any] = {
+        "address": (Address, ...),
+        "data": (HexBytes, ...),
+        "topic": (hash_type(32), ...),
+        "topic_str": (hash_type(32, str), ...),
+        "selector": (hash_type(4), ...),
+        "value": (HexStr, ...),
+        "uri": (Bip122Uri, ...),
+    }
+
+    def create_models():
+        for index in range(count):
+            model = create_model(f"Model{index}", **fields)
+            model.model_json_schema()
+
+    return lambda: create_models
+
+
+def _checksum_many(values: Any) -> Benchmark:
+    return lambda: lambda: Address.to_checksum_addresses(values)
+
+
+def _validate_many_invalid(errors: str) -> Benchmark:
+    # Like untrusted batches full of junk.
+    values = ["0xzz"] * 1000
+    return lambda: lambda: hash_type(32).validate_many(values, errors=errors)
+
+
+def _serialize_hex(value: bytes) -> Benchmark:
+    return lambda: lambda: serialize_hex(value)
+
+
+def _from_word(word: bytes) -> Benchmark:
+    def setup():
+        value = hash_type(32)(word)
+        return lambda: Address.from_word(value)
+
+    return setup
+
+
+def _lookup(convert: Callable[[bytes], Any], count: int = LOOKUP_KEYS) -> Benchmark:
+    # Like a large cache of blocks by hash, looked up with separately validated keys.
+    def setup():
+        values = [index.to_bytes(32, "big") for index in range(count)]
+        table = {convert(value): index for index, value in enumerate(values)}
+        keys = [convert(value) for value in values]
+        return lambda: [table[key] for key in keys]
+
+    return setup
+
+
+def _index_contains(values: list) -> Benchmark:
+    def setup():
+        directory = TemporaryDirectory()
+        path = Path(directory.name) / "hashes.idx"
+        index = HashIndex.build(
+            path, (index.to_bytes(32, "big") for index in range(INDEX_KEYS)), hash_type(32)
+        )
+
+        def contains():
+            # NOTE: Keeps the directory (and the file) alive while timed.
+            assert directory
+            return [value in index for value in values]
+
+        return contains
+
+    return setup
+
+
+def _export(columnar: bool) -> Benchmark:
+    # Like moving validated logs to analytics.
+    def setup():
+        model_type = create_model(
+            "Log", address=(Address, ...), topic=(hash_type(32), ...), data=(HexBytes, ...)
+        )
+        models = [
+            model_type(address=CHECKSUM_ADDRESS, topic=index, data=bytes(64))
+            for index in range(EXPORT_MODELS)
+        ]
+        if columnar:
+            return lambda: to_columns(models)
+
+        return lambda: [model.model_dump(mode="json") for model in models]
+
+    return setup
+
+
+def _unpack_uints(data: bytes) -> Benchmark:
+    return lambda: lambda: unpack_words(data).to_uints()
+
+
+def iter_benchmarks() -> Iterator[tuple[str, Benchmark]]:
+    """
+    Iterate over all the benchmarks as ``(name, setup)`` pairs.
+    """
+    for name, value in _inputs(32).items():
+        yield f"validate/HexBytes/{name}", _validate(HexBytes, value)
+        yield f"validate/HexStr/{name}", _validate(HexStr, value)
+
+    for size in HASH_SIZES:
+        for kind in (bytes, str):
+            tp = hash_type(size, kind)
+            for name, value in _inputs(size).items():
+                yield f"validate/{tp.__name__}/{name}", _validate(tp, value)
+
+            yield f"serialize/{tp.__name__}", _serialize(tp, bytes(size))
+            yield f"json_schema/{tp.__name__}", _json_schema(tp)
+
+    for name, value in _inputs(20).items():
+        yield f"validate/Address/{name}", _validate(Address, value)
+
+    yield "validate/Address/checksummed", _validate(Address, CHECKSUM_ADDRESS)
+    for signed in (False, True):
+        tp = int_type(256, signed)
+        for name in ("str", "bytes", "int"):
+            yield f"validate/{tp.__name__}/{name}", _validate(tp, _inputs(31)[name])
+
+        yield f"serialize/{tp.__name__}", _serialize(tp, 2**200)
+
+    yield "checksum/Address/1000_packed", _checksum_many(bytes(range(20)) * 1000)
+    yield "serialize/AddressList/1000", _serialize(AddressList, bytes(range(20)) * 1000)
+    word = bytes(12) + bytes(range(20))
+    yield "abi/Address/from_word", _from_word(word)
+    yield "abi/WordView/1000_uints", _unpack_uints(word * 1000)
+    hash_bytes = hash_type(32)
+    yield f"lookup/HashBytes32/{LOOKUP_KEYS}", _lookup(hash_bytes.__eth_pydantic_validate__)
+    yield f"lookup/HashKey/{LOOKUP_KEYS}", _lookup(
+        lambda value: hash_bytes.__eth_pydantic_validate__(value).to_key()
+    )
+    hits = [index.to_bytes(32, "big") for index in range(0, INDEX_KEYS, INDEX_KEYS // 1000)]
+    misses = [(INDEX_KEYS + index).to_bytes(32, "big") for index in range(1000)]
+    yield f"index/HashBytes32/{INDEX_KEYS}/1000_hits", _index_contains(hits)
+    yield f"index/HashBytes32/{INDEX_KEYS}/1000_misses", _index_contains(misses)
+    yield f"export/Log/{EXPORT_MODELS}/columns", _export(columnar=True)
+    yield f"export/Log/{EXPORT_MODELS}/json", _export(columnar=False)
+    yield "validate/Bip122Uri/str", _validate(Bip122Uri, BIP122_URI)
+    yield "serialize/HexBytes", _serialize(HexBytes, bytes(32))
+    compact_hex_bytes = Annotated[HexBytes, CompactHex]
+    yield "serialize/HexBytes/compact", _serialize(compact_hex_bytes, bytes(32))
+    yield "serialize/HexBytes/base64", _serialize(
+        compact_hex_bytes, bytes(32), {"hex_format": "base64"}
+    )
+    yield "serialize/Address", _serialize(Address, CHECKSUM_ADDRESS)
+    yield "serialize_hex/32", _serialize_hex(bytes(32))
+    for tp in (HexBytes, HexStr, Address, Bip122Uri):
+        yield f"json_schema/{tp.__name__}", _json_schema(tp)
+
+    for errors in ("report", "codes"):
+        yield f"batch/HashBytes32/1000_invalid/{errors}", _validate_many_invalid(errors)
+
+    yield f"startup/{STARTUP_MODELS}_models", _startup(STARTUP_MODELS)
+
+
+def iter_crossover_benchmarks(
+    executor: "Executor", workers: Optional[int] = None
+) -> Iterator[tuple[str, Benchmark]]:
+    """
+    Compare single-process and process-pool validation of growing batches,
+    to find where ``parallel_validate()`` starts paying off. Every parallel
+    benchmark shares the given pool (of ``workers`` processes), which the
+    caller shuts down.
+    """
+    from eth_pydantic_types.parallel import parallel_validate
+
+    chunks_per_call = (workers or os.cpu_count() or 1) * 4
+    for count in CROSSOVER_SIZES:
+        values = [f"0x{idx:040x}" for idx in range(count)]
+
+        def single(values=values):
+            return lambda: Address.validate_many(values)
+
+        def parallel(values=values):
+            # NOTE: Warm the pool up so only the validation is timed.
+            parallel_validate(Address, values[:1], executor=executor)
+            chunk_size = max(1, len(values) // chunks_per_call)
+            return lambda: parallel_validate(
+                Address, values, chunk_size=chunk_size, executor=executor
+            )
+
+        yield f"crossover/single/{count}", single
+        yield f"crossover/parallel/{count}", parallel
+
+
+def measure(
+    setup: Benchmark, repeat: int = 5, min_time: float = 0.2, number: Optional[int] = None
+) -> dict[str, float]:
+    """
+    Time a benchmark, returning the best time per call out of ``repeat`` runs.
+    Unless given, ``number`` is calibrated so each run takes about ``min_time``.
+    """
+    timer = timeit.Timer(setup())
+    if number is None:
+        calibrated, _ = timer.autorange()
+        number = max(1, int(calibrated * min_time / 0.2))
+
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return {"ns_per_op": best * 1e9, "ops_per_sec": 1 / best, "number": number}
+
+
+def run(
+    name_filter: str = "",
+    repeat: int = 5,
+    min_time: float = 0.2,
+    crossover: bool = False,
+    workers: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Run the benchmarks and return the results as a JSON-serializable dictionary.
+    """
+    benchmarks = list(iter_benchmarks())
+    results = {}
+    with ExitStack() as stack:
+        if crossover:
+            from concurrent.futures import ProcessPoolExecutor
+
+            executor = stack.enter_context(ProcessPoolExecutor(workers))
+            benchmarks.extend(iter_crossover_benchmarks(executor, workers))
+
+        for name, setup in benchmarks:
+            if name_filter in name:
+                results[name] = measure(setup, repeat=repeat, min_time=min_time)
+
+    return {"meta": _get_meta(), "results": results}
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[tuple[str, float]]:
+    """
+    Get the benchmarks that got slower than the baseline by more than
+    ``threshold`` (e.g. ``0.1`` for 10%), with their relative change.
+    """
+    regressions = []
+    for name, result in results["results"].items():
+        if (before := baseline["results"].get(name)) is None:
+            continue
+
+        change = result["ns_per_op"] / before["ns_per_op"] - 1
+        if change > threshold:
+            regressions.append((name, change))
+
+    return regressions
+
+
+def _get_meta() -> dict[str, Any]:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        package_version = version("eth-pydantic-types")
+    except PackageNotFoundError:
+        package_version = "unknown"
+
+    return {
+        "package_version": package_version,
+        "python": sys.version,
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--filter", default="", help="Only run benchmarks containing this.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per benchmark.")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per timing run.")
+    parser.add_argument("--output", type=Path, help="Save the results to this JSON file.")
+    parser.add_argument("--compare", type=Path, help="A results file to compare against.")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="Allowed slowdown when comparing."
+    )
+    parser.add_argument(
+        "--crossover", action="store_true", help="Include the parallel crossover benchmarks."
+    )
+    parser.add_argument("--workers", type=int, help="Processes for the crossover benchmarks.")
+    args = parser.parse_args(argv)
+
+    results = run(
+        name_filter=args.filter,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        crossover=args.crossover,
+        workers=args.workers,
+    )
+    for name, result in results["results"].items():
+        sys.stdout.write(f"{name:<48} {result['ns_per_op']:>14,.0f} ns/op\n")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if regressions := compare(results, baseline, args.threshold):
+            for name, change in regressions:
+                sys.stderr.write(f"REGRESSION {name}: {change:+.1%}\n")
+
+            return 1
+
+    return 0
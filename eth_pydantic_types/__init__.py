@@ -1,4 +1,18 @@
 def __getattr__(name: str):
     import eth_pydantic_types._main as module
 
-    return getattr(module, name)
+    if name.startswith("__"):
+        # e.g. `__path__` lookups by the import system.
+        raise AttributeError(name)
+
+    value = getattr(module, name)
+
+    # Cache on the package so later lookups skip `__getattr__` entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    import eth_pydantic_types._main as module
+
+    return sorted({*globals(), *module.__all__})
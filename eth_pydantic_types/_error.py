@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -10,10 +11,23 @@ if TYPE_CHECKING:
 
 
 def CustomError(fn: Callable, invalid_tag: str, **kwargs) -> "PydanticCustomError":
-    # perf: keep module loading super fast by localizing this import.
+    return _get_error_cls()(fn.__name__, f"Invalid {invalid_tag}", kwargs)
+
+
+@cache
+def _get_error_cls() -> type["PydanticCustomError"]:
+    # perf: keep module loading super fast by localizing this import,
+    #   but only import once, as failures may be many (e.g. in batches).
     from pydantic_core._pydantic_core import PydanticCustomError
 
-    return PydanticCustomError(fn.__name__, f"Invalid {invalid_tag}", kwargs)
+    return PydanticCustomError
+
+
+def get_error_code(err: Exception) -> str:
+    """
+    Get the error type, e.g. ``"HexValueError"``, without formatting its message.
+    """
+    return getattr(err, "type", None) or type(err).__name__
 
 
 def HexValueError(value: Any) -> "PydanticCustomError":
@@ -31,3 +45,19 @@ def Bip122UriFormatError(value: str) -> "PydanticCustomError":
         uri=value,
         format="blockchain://<genesis_hash>/block/<block_hash>.",
     )
+
+
+def IntValueError(value: Any) -> "PydanticCustomError":
+    return CustomError(IntValueError, "integer value", value=value)
+
+
+def IntRangeError(minimum: int, maximum: int, value: Any) -> "PydanticCustomError":
+    return CustomError(IntRangeError, "integer range", min=minimum, max=maximum, value=value)
+
+
+def AddressListError(value: Any) -> "PydanticCustomError":
+    return CustomError(AddressListError, "address list", value=value)
+
+
+def WordPaddingError(abi_type: str, value: Any) -> "PydanticCustomError":
+    return CustomError(WordPaddingError, "ABI word padding", type=abi_type, value=value)
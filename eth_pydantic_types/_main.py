@@ -1,37 +1,179 @@
-from .address import Address, AddressType
-from .bip122 import Bip122Uri
-from .hash import (
-    HashBytes4,
-    HashBytes8,
-    HashBytes16,
-    HashBytes20,
-    HashBytes32,
-    HashBytes64,
-    HashStr4,
-    HashStr8,
-    HashStr16,
-    HashStr20,
-    HashStr32,
-    HashStr64,
-)
-from .hex import HexBytes, HexStr
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .abi import WordView, unpack_words
+    from .address import Address, AddressList, AddressType
+    from .aio import avalidate
+    from .array import AddressArray, HashBytesArray
+    from .batch import BatchResult, BatchValidate
+    from .bip122 import Bip122Uri, StructuredBip122Uri
+    from .canonical import StrictCanonical
+    from .columnar import to_arrow, to_columns
+    from .hash import (
+        HashBytes4,
+        HashBytes8,
+        HashBytes16,
+        HashBytes20,
+        HashBytes32,
+        HashBytes64,
+        HashKey,
+        HashStr4,
+        HashStr8,
+        HashStr16,
+        HashStr20,
+        HashStr32,
+        HashStr64,
+        HashView,
+        hash_type,
+    )
+    from .hex import HexBytes, HexStr
+    from .index import HashIndex
+    from .integer import (
+        Int8,
+        Int16,
+        Int32,
+        Int64,
+        Int128,
+        Int256,
+        UInt8,
+        UInt16,
+        UInt32,
+        UInt64,
+        UInt128,
+        UInt160,
+        UInt256,
+        int_type,
+    )
+    from .parallel import parallel_validate
+    from .serializers import CompactHex
+    from .stream import ErrorRecord, StreamStats, validate_jsonl
+
+# NOTE: Each public name is imported from its module only when first used,
+#   so importing the package only costs the names actually used.
+_MODULES = {
+    "Address": "address",
+    "AddressArray": "array",
+    "AddressList": "address",
+    "AddressType": "address",
+    "BatchResult": "batch",
+    "BatchValidate": "batch",
+    "Bip122Uri": "bip122",
+    "CompactHex": "serializers",
+    "ErrorRecord": "stream",
+    "HashBytes4": "hash",
+    "HashBytes8": "hash",
+    "HashBytes16": "hash",
+    "HashBytes20": "hash",
+    "HashBytes32": "hash",
+    "HashBytes64": "hash",
+    "HashBytesArray": "array",
+    "HashIndex": "index",
+    "HashKey": "hash",
+    "HashStr4": "hash",
+    "HashStr8": "hash",
+    "HashStr16": "hash",
+    "HashStr20": "hash",
+    "HashStr32": "hash",
+    "HashStr64": "hash",
+    "HashView": "hash",
+    "HexBytes": "hex",
+    "HexStr": "hex",
+    "Int8": "integer",
+    "Int16": "integer",
+    "Int32": "integer",
+    "Int64": "integer",
+    "Int128": "integer",
+    "Int256": "integer",
+    "StreamStats": "stream",
+    "StrictCanonical": "canonical",
+    "StructuredBip122Uri": "bip122",
+    "UInt8": "integer",
+    "UInt16": "integer",
+    "UInt32": "integer",
+    "UInt64": "integer",
+    "UInt128": "integer",
+    "UInt160": "integer",
+    "UInt256": "integer",
+    "WordView": "abi",
+    "avalidate": "aio",
+    "hash_type": "hash",
+    "int_type": "integer",
+    "parallel_validate": "parallel",
+    "to_arrow": "columnar",
+    "to_columns": "columnar",
+    "unpack_words": "abi",
+    "validate_jsonl": "stream",
+}
+
+
+def __getattr__(name: str):
+    if name not in _MODULES:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    module = import_module(f"eth_pydantic_types.{_MODULES[name]}")
+    value = getattr(module, name)
+
+    # Cache on the module so later lookups skip `__getattr__` entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_MODULES})
+
 
 __all__ = [
     "Address",
+    "AddressArray",
+    "AddressList",
     "AddressType",
+    "BatchResult",
+    "BatchValidate",
     "Bip122Uri",
+    "CompactHex",
+    "ErrorRecord",
     "HashBytes4",
     "HashBytes8",
     "HashBytes16",
     "HashBytes20",
     "HashBytes32",
     "HashBytes64",
+    "HashBytesArray",
+    "HashIndex",
+    "HashKey",
     "HashStr4",
     "HashStr8",
     "HashStr16",
     "HashStr20",
     "HashStr32",
     "HashStr64",
+    "HashView",
     "HexBytes",
     "HexStr",
+    "Int8",
+    "Int16",
+    "Int32",
+    "Int64",
+    "Int128",
+    "Int256",
+    "StreamStats",
+    "StrictCanonical",
+    "StructuredBip122Uri",
+    "UInt8",
+    "UInt16",
+    "UInt32",
+    "UInt64",
+    "UInt128",
+    "UInt160",
+    "UInt256",
+    "WordView",
+    "avalidate",
+    "hash_type",
+    "int_type",
+    "parallel_validate",
+    "to_arrow",
+    "to_columns",
+    "unpack_words",
+    "validate_jsonl",
 ]
@@ -0,0 +1,53 @@
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from pydantic_core import CoreSchema
+
+_T = TypeVar("_T")
+
+
+def get_cached(cls: type, name: str, build: Callable[[], _T]) -> _T:
+    """
+    Get a value built once per class and stored on the class as ``name``.
+    """
+    # NOTE: Look in the class's own namespace so subclasses, such as `Address`,
+    #   never re-use the value of their parent (which validates differently).
+    value = cls.__dict__.get(name)
+    if value is None:
+        value = build()
+        setattr(cls, name, value)
+
+    return value
+
+
+def get_core_schema(cls: Any) -> "CoreSchema":
+    """
+    Get the class's core schema, as built by its ``__eth_pydantic_core_schema__()``.
+    """
+    schema = get_cached(cls, "_core_schema", cls.__eth_pydantic_core_schema__)
+
+    # Shallow-copy so pydantic's in-place tweaks never leak into other models.
+    return {**schema}
+
+
+def get_canonical_schema(cls: Any) -> "CoreSchema":
+    """
+    Get the class's canonical schema, as built by its ``__eth_pydantic_canonical_schema__()``.
+    """
+    schema = get_cached(cls, "_canonical_schema", cls.__eth_pydantic_canonical_schema__)
+    return {**schema}
+
+
+def update_json_schema(cls: Any, json_schema: dict[str, Any]) -> dict[str, Any]:
+    """
+    Update the JSON schema with the class's extra JSON-schema fields, as built by its
+    ``__eth_pydantic_json_schema_extra__()``.
+    """
+    extra = get_cached(cls, "_json_schema_extra", cls.__eth_pydantic_json_schema_extra__)
+    json_schema.update(extra)
+    if "examples" in extra:
+        # Copy so edits to one JSON schema never leak into another.
+        json_schema["examples"] = [*extra["examples"]]
+
+    return json_schema
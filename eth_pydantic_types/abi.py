@@ -0,0 +1,295 @@
+import re
+from collections.abc import Callable, Iterator, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Union
+
+from eth_pydantic_types._error import SizeError, WordPaddingError
+from eth_pydantic_types.batch import BUFFER_TYPES
+
+if TYPE_CHECKING:
+    from eth_typing import ChecksumAddress
+
+    from eth_pydantic_types.hash import HashBytes, HashView
+
+WORD_SIZE = 32
+"""
+The size (in bytes) of an ABI word, e.g. an event topic or a storage slot.
+"""
+
+_ADDRESS_PADDING = bytes(WORD_SIZE - 20)
+_ABI_TYPE_PATTERN = re.compile(r"(uint|int|bytes)([0-9]*)")
+
+# NOTE: Words are `bytes` or `memoryview` slices of a larger buffer, so decoding
+#   never copies them. Numbers are read straight from any `bytes` subclass, but
+#   slicing `HexBytes` objects creates new ones, so those are wrapped first.
+
+
+def _decode_address(word: Any) -> str:
+    # Returns the unprefixed, lower-case hex of the address.
+    if word[:12] != _ADDRESS_PADDING:
+        raise _padding_error("address", word)
+
+    return word[12:].hex()
+
+
+def _decode_uint(word: Any, bits: int = 256) -> int:
+    value = int.from_bytes(word, "big")
+    if value >> bits:
+        raise _padding_error(f"uint{bits}", word)
+
+    return value
+
+
+def _decode_int(word: Any, bits: int = 256) -> int:
+    # NOTE: Negative values are sign-extended, so their padding is all `0xff` bytes.
+    value = int.from_bytes(word, "big", signed=True)
+    bound = 1 << (bits - 1)
+    if not -bound <= value < bound:
+        raise _padding_error(f"int{bits}", word)
+
+    return value
+
+
+def _decode_bool(word: Any) -> bool:
+    value = int.from_bytes(word, "big")
+    if value > 1:
+        raise _padding_error("bool", word)
+
+    return value == 1
+
+
+def _decode_fixed_bytes(word: Any, size: int = WORD_SIZE) -> "HashBytes":
+    # NOTE: Unlike numbers, `bytesN` values are right-padded.
+    # perf: keep module loading super fast by localizing this import.
+    from eth_pydantic_types.hash import hash_type
+
+    if any(word[size:]):
+        raise _padding_error(f"bytes{size}", word)
+
+    return hash_type(size).__eth_pydantic_validate__(word[:size])
+
+
+def _padding_error(abi_type: str, word: Any):
+    # NOTE: Copies the word, but only when failing.
+    return WordPaddingError(abi_type, bytes(word))
+
+
+def _as_buffer(value: Any) -> Union[bytes, memoryview]:
+    if type(value) is bytes:
+        return value
+
+    elif isinstance(value, BUFFER_TYPES):
+        # NOTE: Including `HexBytes` objects, which create new ones when sliced.
+        return memoryview(value).cast("B")
+
+    # perf: keep module loading super fast by localizing this import.
+    from eth_pydantic_types.hash import HashView
+
+    if isinstance(value, HashView):
+        return value.view
+
+    elif isinstance(value, str):
+        # e.g. the `data` of a log from a JSON-RPC response; decoded once.
+        return bytes.fromhex(value[2:] if value.startswith(("0x", "0X")) else value)
+
+    return memoryview(value).cast("B")
+
+
+def _get_word(value: Any, offset: int = 0) -> Union[bytes, memoryview]:
+    # Returns the 32-byte word at the given offset of any buffer, without copying it.
+    buffer = _as_buffer(value)
+    if offset == 0 and len(buffer) == WORD_SIZE:
+        return buffer
+
+    end = offset + WORD_SIZE
+    if offset < 0 or end > len(buffer):
+        raise SizeError(WORD_SIZE, value)
+
+    return memoryview(buffer)[offset:end]
+
+
+@lru_cache(maxsize=None)
+def _get_decoder(abi_type: str) -> Callable[[Any], Any]:
+    # Returns a function decoding a word of the given (static) ABI type.
+    if abi_type == "address":
+        # perf: keep module loading super fast by localizing this import.
+        from eth_pydantic_types.address import Address
+
+        return lambda word: Address.to_checksum_address(_decode_address(word))
+
+    elif abi_type == "bool":
+        return _decode_bool
+
+    elif (match := _ABI_TYPE_PATTERN.fullmatch(abi_type)) is not None:
+        kind, number = match.groups()
+        if kind == "bytes":
+            if number and 1 <= int(number) <= WORD_SIZE:
+                size = int(number)
+                return lambda word: _decode_fixed_bytes(word, size)
+
+        else:
+            bits = int(number or 256)
+            if bits % 8 == 0 and 8 <= bits <= 256:
+                decode = _decode_uint if kind == "uint" else _decode_int
+                return lambda word: decode(word, bits)
+
+    raise ValueError(f"Unsupported ABI type '{abi_type}'. Expecting a static, single-word type.")
+
+
+class WordView(Sequence):
+    """
+    A read-only view of packed 32-byte ABI words in one buffer, such as raw log
+    data, ``eth_call`` output or a batch of storage slots. Values are decoded
+    straight from offsets into the buffer, checking their padding (e.g. the upper
+    12 zero bytes of an address), without copying the words first. Use
+    :func:`unpack_words` to get one.
+    """
+
+    __slots__ = ("view",)
+
+    def __init__(self, buffer: Any):
+        view = memoryview(_as_buffer(buffer)).cast("B")
+        if len(view) % WORD_SIZE != 0:
+            raise SizeError(WORD_SIZE, buffer)
+
+        self.view = view.toreadonly()
+
+    def __len__(self) -> int:
+        return len(self.view) // WORD_SIZE
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        # perf: keep module loading super fast by localizing this import.
+        from eth_pydantic_types.hash import HashView
+
+        return HashView(self.view, self._offset(index), WORD_SIZE)
+
+    def __iter__(self) -> Iterator["HashView"]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} words)"
+
+    def _offset(self, index: int) -> int:
+        size = len(self)
+        if index < 0:
+            index += size
+
+        if not 0 <= index < size:
+            raise IndexError(f"Word index out of range: {index}.")
+
+        return index * WORD_SIZE
+
+    def _word(self, index: int) -> memoryview:
+        start = self._offset(index)
+        end = start + WORD_SIZE
+        return self.view[start:end]
+
+    def _iter_words(self) -> Iterator[memoryview]:
+        view = self.view
+        for start in range(0, len(view), WORD_SIZE):
+            end = start + WORD_SIZE
+            yield view[start:end]
+
+    def to_address(self, index: int) -> "ChecksumAddress":
+        """
+        Decode the word at the given index as a checksummed address.
+        """
+        # perf: keep module loading super fast by localizing this import.
+        from eth_pydantic_types.address import Address
+
+        return Address.to_checksum_address(_decode_address(self._word(index)))
+
+    def to_uint(self, index: int, bits: int = 256) -> int:
+        """
+        Decode the word at the given index as a ``uint{bits}``.
+        """
+        return _decode_uint(self._word(index), bits)
+
+    def to_int(self, index: int, bits: int = 256) -> int:
+        """
+        Decode the word at the given index as a (two's complement) ``int{bits}``.
+        """
+        return _decode_int(self._word(index), bits)
+
+    def to_bool(self, index: int) -> bool:
+        """
+        Decode the word at the given index as a ``bool``.
+        """
+        return _decode_bool(self._word(index))
+
+    def to_hash_bytes(self, index: int) -> "HashBytes":
+        """
+        Copy the word at the given index into a new ``HashBytes32`` object.
+        """
+        return _decode_fixed_bytes(self._word(index))
+
+    def to_uints(self, bits: int = 256) -> list[int]:
+        """
+        Decode every word as a ``uint{bits}``, e.g. a ``uint256[]`` of balances.
+        """
+        return [_decode_uint(word, bits) for word in self._iter_words()]
+
+    def to_addresses(self) -> list["ChecksumAddress"]:
+        """
+        Decode every word as an address, checksumming them all at once.
+        """
+        # perf: keep module loading super fast by localizing this import.
+        from eth_pydantic_types.address import Address
+
+        return Address._checksum_many([_decode_address(word) for word in self._iter_words()])
+
+    def unpack(self, abi_types: Sequence[str], start: int = 0) -> tuple:
+        """
+        Decode consecutive words by their (static, single-word) ABI types, e.g.
+        ``words.unpack(("address", "uint256", "bool"))``. Supports ``address``,
+        ``bool``, ``uint{n}``, ``int{n}`` and ``bytes{n}``.
+
+        Args:
+            abi_types (Sequence[str]): The ABI type of each word.
+            start (int): The index of the first word to decode. Defaults to ``0``.
+
+        Returns:
+            tuple: The decoded values.
+        """
+        decoders = [_get_decoder(abi_type) for abi_type in abi_types]
+        if not decoders:
+            return ()
+
+        start = self._offset(start) // WORD_SIZE
+        if start + len(decoders) > len(self):
+            raise IndexError(f"Not enough words for {len(decoders)} values.")
+
+        return tuple(decode(self._word(start + index)) for index, decode in enumerate(decoders))
+
+
+def unpack_words(buffer: Any) -> WordView:
+    """
+    Get a view of the packed 32-byte ABI words in the given buffer, e.g. the raw
+    ``data`` of a log. Nothing is copied or decoded until a word is read.
+
+    Usage example::
+
+        from eth_pydantic_types.abi import unpack_words
+
+        words = unpack_words(log_data)
+        owner, balance = words.to_address(0), words.to_uint(1)
+
+    Args:
+        buffer (Any): Any buffer (e.g. ``bytes``, ``memoryview`` or ``mmap``),
+          a ``HashView``, or a hex ``str``, which is decoded once.
+
+    Returns:
+        :class:`~eth_pydantic_types.abi.WordView`
+    """
+    return WordView(buffer)
+
+
+__all__ = [
+    "WORD_SIZE",
+    "WordView",
+    "unpack_words",
+]
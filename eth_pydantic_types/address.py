@@ -1,25 +1,96 @@
+from collections.abc import Iterable
 from functools import cached_property
-from typing import Annotated, Any, ClassVar, Optional
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Optional, Union, cast
 
-from cchecksum import to_checksum_address
-from eth_typing import ChecksumAddress
-from pydantic_core.core_schema import ValidationInfo, str_schema
+from eth_pydantic_types._error import AddressListError
+from eth_pydantic_types._schema import get_core_schema, update_json_schema
+from eth_pydantic_types.abi import _decode_address, _get_word
+from eth_pydantic_types.batch import BUFFER_TYPES, BatchResult
+from eth_pydantic_types.cache import CacheInfo, InternPool, LRUCache
+from eth_pydantic_types.hash import (
+    HashStr20,
+    _intern_many,
+    _iter_chunks,
+    _split_buffer,
+    _validate_hash_str,
+    _validate_hash_str_many,
+)
+from eth_pydantic_types.hex import decode_context
 
-from eth_pydantic_types.hash import HashStr20
+if TYPE_CHECKING:
+    from eth_typing import ChecksumAddress
+    from pydantic_core.core_schema import CoreSchema, ValidationInfo
 
 ADDRESS_PATTERN = "^0x[a-fA-F0-9]{40}$"
 
 
 def address_schema():
-    return str_schema(min_length=42, max_length=42, pattern=ADDRESS_PATTERN)
+    # perf: keep module loading super fast by localizing this import.
+    from pydantic_core.core_schema import str_schema
+
+    return str_schema(min_length=42, max_length=42, pattern=ADDRESS_PATTERN, strict=True)
+
+
+class ChecksumCache(LRUCache[str, "ChecksumAddress"]):
+    """
+    A thread-safe LRU cache of checksummed addresses, keyed by the lowercase
+    hex of the 20-byte address value. Set ``maxsize`` to ``0`` to disable it.
+    Since equal addresses get the same cached ``str`` object, the cache also
+    interns them.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        super().__init__(maxsize)
+
+    def checksum(self, value: Union[str, bytes]) -> "ChecksumAddress":
+        """
+        Get the checksummed version of the given address, computing it only if
+        it is not cached yet.
+
+        Args:
+            value (Union[str, bytes]): The address to checksum.
+
+        Returns:
+            ChecksumAddress
+        """
+        # perf: keep module loading super fast by localizing this import.
+        from cchecksum import to_checksum_address
+
+        key = _get_cache_key(value) if self.maxsize else None
+        if key is None:
+            return to_checksum_address(value)
+
+        elif (checksummed := self._get(key)) is not None:
+            return checksummed
+
+        # NOTE: Compute outside the lock; invalid values raise before being cached.
+        checksummed = to_checksum_address(value)
+        self._set(key, checksummed)
+        return checksummed
+
+
+def _get_cache_key(value: Any) -> Optional[str]:
+    if isinstance(value, str):
+        key = value[2:] if value.startswith(("0x", "0X")) else value
+        return key.lower() if len(key) == 40 else None
+
+    elif isinstance(value, (bytes, bytearray)) and len(value) == 20:
+        return value.hex()
+
+    return None
 
 
 class Address(HashStr20):
     """
     Use for address-types. Validates as a checksummed address. Left-pads zeroes
-    if necessary.
+    if necessary. Checksums are memoized in :attr:`checksum_cache`, so cached
+    addresses are always the same object. Set a size for :attr:`intern_pool`
+    to also share addresses that are checksummed in bulk or not cached.
     """
 
+    checksum_cache: ClassVar[ChecksumCache] = ChecksumCache()
+    intern_pool: ClassVar[InternPool] = InternPool()
+
     schema_pattern: ClassVar[str] = ADDRESS_PATTERN
     schema_examples: ClassVar[tuple[str, ...]] = (
         "0x0000000000000000000000000000000000000000",  # Zero address
@@ -29,18 +100,186 @@ class Address(HashStr20):
     )
 
     @classmethod
-    def __eth_pydantic_validate__(cls, value: Any, info: Optional[ValidationInfo] = None) -> str:
-        value = super().__eth_pydantic_validate__(value)
-        return cls.to_checksum_address(value)
+    def __eth_pydantic_core_schema__(cls) -> "CoreSchema":
+        # perf: keep module loading super fast by localizing this import.
+        from pydantic_core.core_schema import str_schema, with_info_before_validator_function
+
+        # NOTE: Checksummed addresses are already plain `str` objects, interned while validating.
+        return with_info_before_validator_function(
+            cls.__eth_pydantic_validate__, str_schema(max_length=42, min_length=42)
+        )
+
+    @classmethod
+    def __eth_pydantic_validate__(cls, value: Any, info: Optional["ValidationInfo"] = None) -> str:
+        if info is not None and info.context:
+            value = decode_context(value, info)
+
+        return cls.to_checksum_address(
+            cls._validate_canonical(value) or _validate_hash_str(cls, value)
+        )
+
+    @classmethod
+    def __eth_pydantic_canonical_schema__(cls) -> "CoreSchema":
+        # perf: keep module loading super fast by localizing this import.
+        from pydantic_core.core_schema import no_info_after_validator_function
+
+        # Any well-formed address only needs checksumming.
+        return no_info_after_validator_function(cls.to_checksum_address, address_schema())
 
     @classmethod
-    def to_checksum_address(cls, value: str) -> ChecksumAddress:
-        return to_checksum_address(value)
+    def to_checksum_address(cls, value: Union[str, bytes]) -> "ChecksumAddress":
+        return cls.intern_pool.intern(cls.checksum_cache.checksum(value))
+
+    @classmethod
+    def from_word(cls, word: Any, offset: int = 0) -> "ChecksumAddress":
+        """
+        Decode an ABI-encoded address, e.g. an indexed event topic, from a
+        32-byte word, checking that its upper 12 (padding) bytes are zero.
+        Reads straight from the buffer, without intermediate ``HexBytes`` objects.
+
+        Args:
+            word (Any): A ``HashBytes32``, ``HashView`` or any buffer.
+            offset (int): The offset of the word in the buffer. Defaults to ``0``.
+
+        Returns:
+            ChecksumAddress
+        """
+        return cls.to_checksum_address(_decode_address(_get_word(word, offset)))
+
+    @classmethod
+    def validate_many(
+        cls,
+        values: Union[Iterable, bytes],
+        errors: str = "raise",
+        max_errors: Optional[int] = None,
+    ) -> Union[list[str], BatchResult]:
+        """
+        Validate many addresses at once, checksumming all the valid ones in bulk.
+
+        Args:
+            values (Union[Iterable, bytes]): The values to validate. Buffers
+              (e.g. ``bytes`` or ``memoryview``) are read as packed
+              20-byte addresses.
+            errors (str): ``"raise"`` (default), ``"report"`` or ``"codes"``.
+              See :func:`~eth_pydantic_types.batch.validate_many`.
+            max_errors (Optional[int]): Stop validating after this many failures.
+
+        Returns:
+            Union[list[str], :class:`~eth_pydantic_types.batch.BatchResult`]
+        """
+        return _validate_hash_str_many(cls, values, errors, cls._checksum_many, max_errors)
+
+    @classmethod
+    def to_checksum_addresses(
+        cls,
+        values: Union[Iterable, bytes],
+        out: Optional[Union[list, bytearray, memoryview]] = None,
+    ) -> Union[list["ChecksumAddress"], bytearray, memoryview]:
+        """
+        Checksum many already-valid addresses at once, e.g. the rows of a
+        ``HashBytes20`` column. Unlike :meth:`validate_many`, values are not
+        validated first, so this is the fastest way to checksum in bulk.
+
+        Args:
+            values (Union[Iterable, bytes]): 20-byte or 40-character hex
+              addresses, or a buffer of packed 20-byte addresses.
+            out (Optional[Union[list, bytearray, memoryview]]): A preallocated list
+              to put the addresses in, or a writable buffer to write them into as
+              42-byte ASCII strings. Defaults to a new list.
+
+        Returns:
+            Union[list[ChecksumAddress], bytearray, memoryview]: ``out`` when given,
+            else a new list.
+        """
+        if isinstance(values, BUFFER_TYPES):
+            checksummed = cls._checksum_many(_split_buffer(values, cls.size))
+        else:
+            checksummed = cls._checksum_many(
+                [value if isinstance(value, (str, bytes)) else bytes(value) for value in values]
+            )
+
+        if out is None:
+            return checksummed
+
+        elif isinstance(out, list):
+            if len(out) < len(checksummed):
+                raise ValueError(f"Output list too small for {len(checksummed)} addresses.")
+
+            out[: len(checksummed)] = checksummed
+            return out
+
+        data = "".join(checksummed).encode("ascii")
+        view = memoryview(out).cast("B")
+        if view.nbytes < len(data):
+            raise ValueError(f"Output buffer too small for {len(checksummed)} addresses.")
+
+        view[: len(data)] = data
+        return out
+
+    @classmethod
+    def _checksum_many(cls, values: Union[list, memoryview]) -> list["ChecksumAddress"]:
+        # NOTE: `values` is a list of addresses or a buffer of packed 20-byte addresses.
+        try:
+            # perf: keep module loading super fast by localizing this import.
+            from cchecksum import to_checksum_address_many
+        except ImportError:
+            # NOTE: Only available in newer versions of cchecksum.
+            if isinstance(values, memoryview):
+                values = [f"0x{chunk}" for chunk in _iter_chunks(values.hex(), cls.size * 2)]
+
+            return [cls.to_checksum_address(value) for value in values]
+
+        return _intern_many(cls, to_checksum_address_many(values))
+
+
+class AddressList(list):
+    """
+    Use for ``list[Address]`` fields holding many addresses. Validates every
+    address at once with :meth:`Address.validate_many`, which also accepts a
+    buffer of packed 20-byte addresses, and checksums them in bulk when
+    serializing with :meth:`Address.to_checksum_addresses`. Values are
+    plain ``list`` objects of checksummed addresses.
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, value, handler=None) -> "CoreSchema":
+        return get_core_schema(cls)
+
+    @classmethod
+    def __eth_pydantic_core_schema__(cls) -> "CoreSchema":
+        # perf: keep module loading super fast by localizing this import.
+        from pydantic_core.core_schema import (
+            no_info_plain_validator_function,
+            plain_serializer_function_ser_schema,
+        )
+
+        def json_schema(_, json_handler):
+            items = update_json_schema(Address, {"type": "string"})
+            return {"type": "array", "items": items}
+
+        return no_info_plain_validator_function(
+            cls.__eth_pydantic_validate__,
+            serialization=plain_serializer_function_ser_schema(
+                function=Address.to_checksum_addresses
+            ),
+            metadata={"pydantic_js_functions": [json_schema]},
+        )
+
+    @classmethod
+    def __eth_pydantic_validate__(cls, value: Any) -> list[str]:
+        if isinstance(value, str) or not isinstance(value, (Iterable, *BUFFER_TYPES)):
+            # NOTE: A string is iterable, but never a list of addresses.
+            raise AddressListError(value)
+
+        return cast(list[str], Address.validate_many(value))
 
 
 class _AddressTypeFactory:
     @cached_property
     def address_type(self):
+        # perf: keep module loading super fast by localizing this import.
+        from eth_typing import ChecksumAddress
+
         # Lazy define for performance reasons.
         AddressType = Annotated[ChecksumAddress, Address]
         AddressType.__doc__ = """
@@ -65,6 +304,9 @@ def __getattr__(name: str):
 
 
 __all__ = [
+    "AddressList",
     "AddressType",
     "Address",
+    "CacheInfo",
+    "ChecksumCache",
 ]
@@ -0,0 +1,187 @@
+from typing import TYPE_CHECKING, Any, Optional, get_origin
+
+from eth_pydantic_types.stream import _get_adapter
+
+if TYPE_CHECKING:
+    from asyncio import Future
+    from concurrent.futures import Executor
+
+DEFAULT_INLINE_ITEMS = 256
+"""
+Lists of up to this many items are validated inline, in the event loop.
+"""
+
+DEFAULT_INLINE_BYTES = 1 << 16
+"""
+JSON payloads of up to this many bytes (or characters) are validated inline.
+"""
+
+DEFAULT_CHUNK_SIZE = 1000
+"""
+The default number of list items validated per task.
+"""
+
+DEFAULT_MAX_PENDING = 4
+"""
+The default number of tasks submitted to the executor at a time, per call.
+"""
+
+
+async def avalidate(
+    target: Any,
+    payload: Any,
+    executor: Optional["Executor"] = None,
+    inline_items: int = DEFAULT_INLINE_ITEMS,
+    inline_bytes: int = DEFAULT_INLINE_BYTES,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_pending: int = DEFAULT_MAX_PENDING,
+) -> Any:
+    """
+    Validate a payload without stalling the event loop, e.g. large ``eth_getLogs``
+    results in a web-server. Small payloads are validated inline, with no overhead.
+    Large JSON payloads (``str`` or ``bytes``) are validated in the executor, and
+    large lists, when the target is a ``list[...]`` type, are split into chunks
+    validated in the executor, with at most ``max_pending`` chunks in flight.
+    Other payloads (e.g. a ``dict``) are always validated inline.
+
+    If the call is cancelled, chunks not yet started are cancelled and no more
+    are submitted; chunks already running finish in the background.
+
+    Usage example::
+
+        from eth_pydantic_types.aio import avalidate
+
+        logs = await avalidate(list[Log], response["result"])
+
+    Args:
+        target (Any): The pydantic model, or any type supported by
+          ``pydantic.TypeAdapter``, e.g. ``list[Log]``.
+        payload (Any): The Python data, or the JSON ``str`` or ``bytes``.
+        executor (Optional[Executor]): The thread or process pool to use.
+          Defaults to the event loop's default (thread) executor. When using a
+          process pool, the target must be importable by the workers.
+        inline_items (int): Lists of up to this many items are validated inline.
+        inline_bytes (int): JSON of up to this many bytes is validated inline.
+        chunk_size (int): The number of list items validated per task.
+        max_pending (int): The number of tasks in flight at a time.
+
+    Returns:
+        Any: The validated value, as from ``TypeAdapter(target).validate_python()``
+        (or ``validate_json()``).
+    """
+    # perf: keep module loading super fast by localizing this import.
+    from asyncio import get_running_loop
+
+    loop = get_running_loop()
+    if isinstance(payload, (str, bytes, bytearray)):
+        if len(payload) <= inline_bytes:
+            return _get_adapter(target).validate_json(payload)
+
+        result = await loop.run_in_executor(executor, _validate_json, target, payload)
+        return _get_result(target, result)
+
+    elif (
+        isinstance(payload, (list, tuple))
+        and len(payload) > inline_items
+        and get_origin(target) is list
+    ):
+        return await _validate_chunks(target, payload, executor, chunk_size, max(1, max_pending))
+
+    return _get_adapter(target).validate_python(payload)
+
+
+async def _validate_chunks(
+    target: Any, payload: Any, executor: Optional["Executor"], chunk_size: int, max_pending: int
+) -> list:
+    # perf: keep module loading super fast by localizing this import.
+    from asyncio import FIRST_COMPLETED, get_running_loop, wait
+
+    loop = get_running_loop()
+    starts: dict["Future", int] = {}
+    results: dict[int, list] = {}
+    failures: list[dict] = []
+
+    def collect(done):
+        for future in done:
+            start = starts.pop(future)
+            ok, value = future.result()
+            if ok:
+                results[start] = value
+            else:
+                # Report the item's index in the whole payload.
+                failures.extend(
+                    {**detail, "loc": (start + detail["loc"][0], *detail["loc"][1:])}
+                    for detail in value
+                )
+
+    try:
+        for start in range(0, len(payload), chunk_size):
+            if len(starts) >= max_pending:
+                # Backpressure: wait for a free slot before submitting more.
+                done, _ = await wait(starts, return_when=FIRST_COMPLETED)
+                collect(done)
+
+            end = start + chunk_size
+            future = loop.run_in_executor(executor, _validate_python, target, payload[start:end])
+            starts[future] = start
+
+        if starts:
+            done, _ = await wait(starts)
+            collect(done)
+
+    except BaseException:
+        # e.g. cancelled: drop the chunks not started yet.
+        for future in starts:
+            future.cancel()
+
+        raise
+
+    if failures:
+        # perf: keep module loading super fast by localizing this import.
+        from eth_pydantic_types.parallel import _rebuild_error
+
+        # NOTE: Chunks finish in any order.
+        failures.sort(key=lambda detail: detail["loc"][0])
+        raise _rebuild_error(target, failures)
+
+    return [value for start in sorted(results) for value in results[start]]
+
+
+def _validate_python(target: Any, value: Any) -> tuple[bool, Any]:
+    # NOTE: Runs in the executor, possibly in another process.
+    return _validate(target, value, json=False)
+
+
+def _validate_json(target: Any, value: Any) -> tuple[bool, Any]:
+    # NOTE: Runs in the executor, possibly in another process.
+    return _validate(target, value, json=True)
+
+
+def _validate(target: Any, value: Any, json: bool) -> tuple[bool, Any]:
+    # perf: keep module loading super fast by localizing this import.
+    from pydantic import ValidationError
+
+    adapter = _get_adapter(target)
+    try:
+        return True, adapter.validate_json(value) if json else adapter.validate_python(value)
+    except ValidationError as err:
+        # perf: keep module loading super fast by localizing this import.
+        from eth_pydantic_types.parallel import _get_error_details
+
+        return False, _get_error_details(err)
+
+
+def _get_result(target: Any, result: tuple[bool, Any]) -> Any:
+    ok, value = result
+    if ok:
+        return value
+
+    # perf: keep module loading super fast by localizing this import.
+    from eth_pydantic_types.parallel import _rebuild_error
+
+    raise _rebuild_error(target, value)
+
+
+__all__ = [
+    "avalidate",
+]
@@ -0,0 +1,285 @@
+from collections.abc import Iterable, Iterator
+from threading import Lock
+from typing import TYPE_CHECKING, Any, ClassVar, Optional, Union, cast
+
+from eth_pydantic_types._error import SizeError
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.batch import BUFFER_TYPES
+from eth_pydantic_types.hash import HashBytes, _iter_chunks, hash_type
+
+if TYPE_CHECKING:
+    from pydantic_core import CoreSchema
+
+_array_types_lock = Lock()
+
+
+def _get_numpy():
+    # NOTE: NumPy is optional; without it, the pure-Python fallbacks are used.
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+
+class HashBytesArray:
+    """
+    A compact array of same-sized hashes, stored in a single contiguous buffer of
+    ``len(array) * size`` bytes instead of one Python object per hash. Items are
+    only turned into ``HashBytes{size}`` objects when accessed. When NumPy is
+    installed, comparisons, sorting and de-duplication are vectorized.
+
+    Use ``HashBytesArray[size]`` to get the array class for a hash size, e.g.
+    ``HashBytesArray[32]`` for an array of ``HashBytes32``.
+    """
+
+    item_type: ClassVar[Any] = HashBytes
+    hash_bytes_type: ClassVar[type[HashBytes]] = HashBytes
+    size: ClassVar[int] = 1
+
+    _array_types: ClassVar[dict[int, type["HashBytesArray"]]] = {}
+    _data: bytearray
+
+    def __init__(self, values: Union[Iterable, bytes] = ()):
+        if isinstance(values, HashBytesArray):
+            if values.size != self.size:
+                raise ValueError(
+                    f"Cannot create {type(self).__name__} from {type(values).__name__}."
+                )
+
+            self._data = bytearray(values._data)
+
+        elif isinstance(values, BUFFER_TYPES):
+            # NOTE: Any `size` bytes are a valid item.
+            self._data = bytearray(memoryview(values).cast("B"))
+            if len(self._data) % self.size != 0:
+                raise SizeError(self.size, values)
+
+        else:
+            validated = cast(list[bytes], self.hash_bytes_type.validate_many(values))
+            self._data = bytearray(b"".join(validated))
+
+    def __class_getitem__(cls, size: int) -> type["HashBytesArray"]:
+        if (array_type := cls._array_types.get(size)) is not None:
+            return array_type
+
+        with _array_types_lock:
+            # NOTE: Check again, as another thread may have made the class while waiting.
+            if (array_type := cls._array_types.get(size)) is None:
+                item_type = hash_type(size)
+                array_type = cls._array_types[size] = type(
+                    f"{cls.__name__}{size}",
+                    (cls,),
+                    dict(item_type=item_type, hash_bytes_type=item_type, size=size),
+                )
+
+        return array_type
+
+    @classmethod
+    def frombuffer(cls, buffer: Union[bytes, bytearray, memoryview]):
+        """
+        Create an array from a buffer of packed ``size``-byte values without
+        validating each value.
+        """
+        array = cls.__new__(cls)
+        array._data = bytearray(buffer)
+        if len(array._data) % cls.size != 0:
+            raise SizeError(cls.size, buffer)
+
+        return array
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, value, handler=None) -> "CoreSchema":
+        # perf: keep module loading super fast by localizing this import.
+        from pydantic_core.core_schema import (
+            no_info_plain_validator_function,
+            plain_serializer_function_ser_schema,
+        )
+
+        def json_schema(_, json_handler):
+            item_schema = cls.item_type.__get_pydantic_core_schema__(cls.item_type)
+            items = cls.item_type.__get_pydantic_json_schema__(item_schema, json_handler)
+            return {"type": "array", "items": items}
+
+        return no_info_plain_validator_function(
+            cls.__eth_pydantic_validate__,
+            serialization=plain_serializer_function_ser_schema(function=cls.serialize),
+            metadata={"pydantic_js_functions": [json_schema]},
+        )
+
+    @classmethod
+    def __eth_pydantic_validate__(cls, value: Any) -> "HashBytesArray":
+        return value if type(value) is cls else cls(value)
+
+    def serialize(self) -> list[str]:
+        """
+        Serialize the array to a list of hex strings.
+        """
+        return [f"0x{chunk}" for chunk in _iter_chunks(self._data.hex(), self.size * 2)]
+
+    def __len__(self) -> int:
+        return len(self._data) // self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            rows = [self._row(idx) for idx in range(len(self))[index]]
+            return self.frombuffer(b"".join(rows))
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError(f"{type(self).__name__} index out of range.")
+
+        return self._to_item(self._row(index))
+
+    def __iter__(self) -> Iterator:
+        for index in range(len(self)):
+            yield self._to_item(self._row(index))
+
+    def __contains__(self, value: Any) -> bool:
+        return self.index(value) is not None
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, HashBytesArray):
+            return self.size == other.size and self._data == other._data
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.serialize()})"
+
+    def _row(self, index: int) -> bytes:
+        start = index * self.size
+        end = start + self.size
+        return bytes(self._data[start:end])
+
+    def _to_item(self, value: bytes) -> Any:
+        return bytes.__new__(self.item_type, value)
+
+    def _to_bytes(self, value: Any) -> bytes:
+        return bytes(self.hash_bytes_type.__eth_pydantic_validate__(value))
+
+    def _as_numpy(self, numpy):
+        return numpy.frombuffer(self._data, dtype=numpy.uint8).reshape(-1, self.size)
+
+    def _as_numpy_keys(self, numpy):
+        # NOTE: Fixed-width byte-strings compare like the raw bytes.
+        return numpy.frombuffer(self._data, dtype=f"S{self.size}")
+
+    def tobytes(self) -> bytes:
+        """
+        Get the packed values as bytes.
+        """
+        return bytes(self._data)
+
+    def to_numpy(self):
+        """
+        Get a ``(len(array), size)`` ``uint8`` NumPy array that shares
+        this array's memory. Requires NumPy.
+        """
+        if (numpy := _get_numpy()) is None:
+            raise ImportError("NumPy is required for `to_numpy()`.")
+
+        return self._as_numpy(numpy)
+
+    def equals(self, value: Any):
+        """
+        Compare every item to the given value.
+
+        Args:
+            value (Any): A value of the item type.
+
+        Returns:
+            A NumPy boolean array when NumPy is installed, else a list of bools.
+        """
+        needle = self._to_bytes(value)
+        if (numpy := _get_numpy()) is not None:
+            rows = self._as_numpy(numpy)
+            return (rows == numpy.frombuffer(needle, dtype=numpy.uint8)).all(axis=1)
+
+        return [self._row(index) == needle for index in range(len(self))]
+
+    def isin(self, values: Iterable):
+        """
+        Check every item for membership in the given values.
+
+        Args:
+            values (Iterable): Values of the item type.
+
+        Returns:
+            A NumPy boolean array when NumPy is installed, else a list of bools.
+        """
+        needles = {self._to_bytes(value) for value in values}
+        if (numpy := _get_numpy()) is not None:
+            keys = numpy.array(sorted(needles), dtype=f"S{self.size}")
+            return numpy.isin(self._as_numpy_keys(numpy), keys)
+
+        return [self._row(index) in needles for index in range(len(self))]
+
+    def index(self, value: Any) -> Optional[int]:
+        """
+        Get the index of the first item matching the given value, or ``None``.
+        """
+        try:
+            needle = self._to_bytes(value)
+        except (ValueError, TypeError):
+            return None
+
+        start = self._data.find(needle)
+        while start != -1:
+            if start % self.size == 0:
+                return start // self.size
+
+            start = self._data.find(needle, start + 1)
+
+        return None
+
+    def sort(self):
+        """
+        Sort the items in-place by their byte value.
+        """
+        if (numpy := _get_numpy()) is not None:
+            ordered = numpy.sort(self._as_numpy_keys(numpy), kind="stable").tobytes()
+        else:
+            ordered = b"".join(sorted(self._row(index) for index in range(len(self))))
+
+        self._data[:] = ordered
+
+    def unique(self) -> "HashBytesArray":
+        """
+        Get a new, sorted array without duplicates.
+        """
+        if (numpy := _get_numpy()) is not None:
+            return self.frombuffer(numpy.unique(self._as_numpy_keys(numpy)).tobytes())
+
+        return self.frombuffer(b"".join(sorted({self._row(idx) for idx in range(len(self))})))
+
+
+class AddressArray(HashBytesArray):
+    """
+    A compact array of addresses. Items are checksummed when accessed
+    or serialized.
+    """
+
+    item_type: ClassVar[Any] = Address
+    hash_bytes_type: ClassVar[type[HashBytes]] = hash_type(20)
+    size: ClassVar[int] = 20
+
+    def __class_getitem__(cls, size: int):
+        raise TypeError(f"{cls.__name__} is not sizable.")
+
+    def serialize(self) -> list[str]:
+        return cast(list[str], Address.to_checksum_addresses(self._data))
+
+    def _to_item(self, value: bytes) -> Any:
+        return Address(Address.to_checksum_address(value))
+
+
+__all__ = [
+    "AddressArray",
+    "HashBytesArray",
+]
@@ -0,0 +1,226 @@
+from collections.abc import Callable, Iterable
+from mmap import mmap
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, TypeVar, Union, get_args, get_origin
+
+from eth_pydantic_types._error import get_error_code
+
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
+    from pydantic_core import CoreSchema, ErrorDetails, InitErrorDetails, ValidationError
+
+_T = TypeVar("_T")
+
+BUFFER_TYPES = (bytes, bytearray, memoryview, mmap)
+"""
+Buffer-protocol types. ``validate_many()`` treats these as a packed buffer
+of same-sized values rather than as an iterable of values.
+"""
+
+ERROR_MODES = ("raise", "report", "codes")
+"""
+The supported values of ``validate_many()``'s ``errors`` argument.
+"""
+
+
+class BatchResult(NamedTuple):
+    """
+    The per-index report returned by ``validate_many(..., errors="report")``
+    (or ``errors="codes"``).
+    """
+
+    values: list
+    """
+    The validated values, with ``None`` at every index that failed.
+    """
+
+    errors: dict[int, Any]
+    """
+    The errors by index; only their error codes (e.g. ``"HexValueError"``)
+    when using ``errors="codes"``.
+    """
+
+    truncated: bool = False
+    """
+    Whether validation stopped after ``max_errors`` failures, in which case
+    ``values`` only covers the values validated until then.
+    """
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def validate_many(
+    validate: Callable[[Any], _T],
+    values: Iterable,
+    errors: str = "raise",
+    title: str = "list",
+    convert: Optional[Callable[[list[_T]], list]] = None,
+    max_errors: Optional[int] = None,
+) -> Union[list, BatchResult]:
+    """
+    Validate each value and either raise all the failures at once or report them.
+
+    Args:
+        validate (Callable): Validates and returns a single value.
+        values (Iterable): The values to validate.
+        errors (str): ``"raise"`` to raise a ``pydantic_core.ValidationError``
+          when any value is invalid, ``"report"`` to return a
+          :class:`~eth_pydantic_types.batch.BatchResult` instead, or ``"codes"``
+          to return a ``BatchResult`` with only the error codes, without keeping
+          the errors or the invalid values (cheapest for mostly-junk input).
+        title (str): The title to use in the raised ``ValidationError``.
+        convert (Optional[Callable]): Converts all the valid values at once,
+          e.g. to checksum addresses in bulk.
+        max_errors (Optional[int]): Stop validating after this many failures,
+          e.g. ``1`` to fail fast. Defaults to validating every value.
+
+    Returns:
+        Union[list, :class:`~eth_pydantic_types.batch.BatchResult`]
+    """
+    check_errors_mode(errors)
+    results: list = []
+    failures: dict[int, Any] = {}
+    inputs: dict[int, Any] = {}
+    truncated = False
+    for index, value in enumerate(values):
+        try:
+            results.append(validate(value))
+        except (ValueError, TypeError) as err:
+            results.append(None)
+            if errors == "codes":
+                failures[index] = get_error_code(err)
+            else:
+                failures[index] = err if isinstance(err, ValueError) else ValueError(str(err))
+                inputs[index] = value
+
+            if max_errors is not None and len(failures) >= max_errors:
+                truncated = True
+                break
+
+    if convert is not None:
+        converted = iter(convert([value for value in results if value is not None]))
+        results = [None if value is None else next(converted) for value in results]
+
+    return finish_many(results, failures, errors, title, inputs, truncated=truncated)
+
+
+def check_errors_mode(errors: str):
+    if errors not in ERROR_MODES:
+        raise ValueError(f"Unknown errors mode '{errors}'. Expecting one of {ERROR_MODES}.")
+
+
+def finish_many(
+    results: list,
+    failures: dict[int, Any],
+    errors: str,
+    title: str,
+    inputs: Optional[dict[int, Any]] = None,
+    truncated: bool = False,
+) -> Union[list, BatchResult]:
+    if errors in ("report", "codes"):
+        return BatchResult(results, failures, truncated)
+
+    elif failures:
+        raise _to_validation_error(title, failures, inputs or {})
+
+    return results
+
+
+def _to_validation_error(
+    title: str, failures: dict[int, ValueError], inputs: dict[int, Any]
+) -> "ValidationError":
+    # perf: keep module loading super fast by localizing this import.
+    from pydantic_core import PydanticCustomError, ValidationError
+
+    line_errors: list = []
+    for index, err in failures.items():
+        value = inputs.get(index)
+        if isinstance(err, PydanticCustomError):
+            line_errors.append({"type": err, "loc": (index,), "input": value})
+        elif isinstance(err, ValidationError):
+            # Nest the item's own errors under its index.
+            line_errors.extend(
+                _to_line_error(detail, (index, *detail["loc"])) for detail in err.errors()
+            )
+        else:
+            line_errors.append(
+                {"type": "value_error", "loc": (index,), "input": value, "ctx": {"error": err}}
+            )
+
+    return ValidationError.from_exception_data(title, line_errors)
+
+
+def _to_line_error(detail: "ErrorDetails", loc: tuple) -> "InitErrorDetails":
+    # Rebuilds an error from its `ValidationError.errors()` details, keeping its type and context.
+    # perf: keep module loading super fast by localizing this import.
+    from pydantic_core import PydanticCustomError, PydanticKnownError
+
+    error_type, ctx = detail["type"], detail.get("ctx") or {}
+    try:
+        # Only pydantic's own error types, with all the context they need, are known.
+        PydanticKnownError(error_type, ctx or None)  # type: ignore[arg-type]
+    except (KeyError, TypeError, ValueError):
+        # NOTE: The message is already rendered and may contain braces (e.g. a regex),
+        #   so it is passed through the context rather than used as the template.
+        custom_error = PydanticCustomError(error_type, "{msg}", {**ctx, "msg": detail["msg"]})
+        return {"type": custom_error, "loc": loc, "input": detail["input"]}
+
+    line_error: "InitErrorDetails" = {"type": error_type, "loc": loc, "input": detail["input"]}
+    if ctx:
+        line_error["ctx"] = ctx
+
+    return line_error
+
+
+class BatchValidate:
+    """
+    Annotate a ``list`` of ``HashBytes{n}``, ``HashStr{n}`` or ``Address`` with this
+    marker to validate the whole list with the type's ``validate_many()`` classmethod
+    instead of item by item. Invalid lists fall back to the regular validation so
+    the reported errors are unchanged.
+
+    Usage example::
+
+        from typing import Annotated
+        from pydantic import BaseModel
+        from eth_pydantic_types import Address, BatchValidate
+
+        class Block(BaseModel):
+            miners: Annotated[list[Address], BatchValidate]
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: "GetCoreSchemaHandler"
+    ) -> "CoreSchema":
+        item_types = get_args(source)
+        validate_items = (
+            getattr(item_types[0], "validate_many", None) if len(item_types) == 1 else None
+        )
+        if get_origin(source) is not list or validate_items is None:
+            raise TypeError(f"'{source}' does not support {cls.__name__} validation.")
+
+        def validate(value, list_handler):
+            if isinstance(value, (list, tuple)):
+                # NOTE: Stop at the first failure; the fallback reports all of them.
+                result = validate_items(value, errors="codes", max_errors=1)
+                if result.ok:
+                    return result.values
+
+            # Let pydantic produce the detailed per-item errors.
+            return list_handler(value)
+
+        # perf: keep module loading super fast by localizing this import.
+        from pydantic_core.core_schema import no_info_wrap_validator_function
+
+        # NOTE: The wrapped schema also provides the serialization and JSON schema.
+        return no_info_wrap_validator_function(validate, handler(source))
+
+
+__all__ = [
+    "ERROR_MODES",
+    "BatchResult",
+    "BatchValidate",
+    "validate_many",
+]
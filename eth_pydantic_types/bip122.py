@@ -1,18 +1,14 @@
 from enum import Enum
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Optional, Union
 
-from pydantic_core.core_schema import (
-    ValidationInfo,
-    str_schema,
-    with_info_before_validator_function,
-)
-
-from eth_pydantic_types._error import Bip122UriFormatError
-from eth_pydantic_types.hex import validate_hex_str
+from eth_pydantic_types._error import Bip122UriFormatError, SizeError
+from eth_pydantic_types._schema import get_core_schema, update_json_schema
+from eth_pydantic_types.hex import validate_hex_bytes
 
 if TYPE_CHECKING:
     from pydantic_core import CoreSchema
+    from pydantic_core.core_schema import ValidationInfo
 
 
 class Bip122UriType(Enum):
@@ -21,53 +17,75 @@ class Bip122UriType(Enum):
     ADDRESS = "address"
 
 
+_URI_TYPES = {uri_type.value: uri_type for uri_type in Bip122UriType}
+
+# The size of the hash (or address) in bytes, for each URI type.
+_HASH_SIZES = {Bip122UriType.TX: 32, Bip122UriType.BLOCK: 32, Bip122UriType.ADDRESS: 20}
+
+GENESIS_HASH_SIZE = 32
+
+
+def _parse(prefix: str, value: Any) -> tuple[bytes, Bip122UriType, bytes]:
+    # Parses the URI in a single pass, decoding each hash only once.
+    if not isinstance(value, str) or not value.startswith(prefix):
+        raise Bip122UriFormatError(value)
+
+    protocol_parsed = value.removeprefix(prefix).split("/")
+    if len(protocol_parsed) != 3:
+        raise Bip122UriFormatError(value)
+
+    genesis_hash, keyword, hash_value = protocol_parsed
+    if (uri_type := _URI_TYPES.get(keyword.lower())) is None:
+        raise Bip122UriFormatError(value)
+
+    return validate_hex_bytes(genesis_hash), uri_type, validate_hex_bytes(hash_value)
+
+
+def _get_json_schema_extra(prefix: str) -> dict[str, Any]:
+    example = (
+        f"{prefix}d4e56740f876aef8c010b86a40d5f56745a118d0906a34e69aec8c0db1cb8fa3"
+        f"/{Bip122UriType.BLOCK.value}/"
+        f"752820c0ad7abc1200f9ad42c4adc6fbb4bd44b5bed4667990e64565102c1ba6"
+    )
+    hashes = "|".join(
+        f"{uri_type.value}/[0-9a-f]{{{size * 2}}}" for uri_type, size in _HASH_SIZES.items()
+    )
+    pattern = f"^{prefix}[0-9a-f]{{{GENESIS_HASH_SIZE * 2}}}/({hashes})$"
+    return dict(examples=[example], pattern=pattern)
+
+
 class Bip122Uri(str):
     prefix: str = "blockchain://"
 
     @classmethod
     def __get_pydantic_json_schema__(cls, core_schema, handler):
-        json_schema = handler(core_schema)
-        example = (
-            f"{cls.prefix}d4e56740f876aef8c010b86a40d5f56745a118d0906a34e69aec8c0db1cb8fa3"
-            f"/{Bip122UriType.BLOCK.value}/"
-            f"752820c0ad7abc1200f9ad42c4adc6fbb4bd44b5bed4667990e64565102c1ba6"
-        )
-        pattern = f"^{cls.prefix}[0-9a-f]{{64}}/{Bip122UriType.BLOCK.value}/[0-9a-f]{{64}}$"
-        json_schema.update(examples=[example], pattern=pattern)
-        return json_schema
+        return update_json_schema(cls, handler(core_schema))
+
+    @classmethod
+    def __eth_pydantic_json_schema_extra__(cls) -> dict[str, Any]:
+        # Built once per class; see `update_json_schema()`.
+        return _get_json_schema_extra(cls.prefix)
 
     @classmethod
     def __get_pydantic_core_schema__(cls, value, handler=None) -> "CoreSchema":
-        return with_info_before_validator_function(
-            value.__eth_pydantic_validate__,
-            str_schema(),
-        )
+        return get_core_schema(cls)
 
     @classmethod
-    def __eth_pydantic_validate__(cls, value: Any, info: Optional[ValidationInfo] = None) -> str:
-        if not value.startswith(cls.prefix):
-            raise Bip122UriFormatError(value)
+    def __eth_pydantic_core_schema__(cls) -> "CoreSchema":
+        # perf: keep module loading super fast by localizing this import.
+        from pydantic_core.core_schema import str_schema, with_info_before_validator_function
+
+        return with_info_before_validator_function(cls.__eth_pydantic_validate__, str_schema())
 
-        genesis_hash, block_keyword, block_hash = cls.parse(value)
-        return f"{cls.prefix}{genesis_hash[2:]}/{block_keyword.value}/{block_hash[2:]}"
+    @classmethod
+    def __eth_pydantic_validate__(cls, value: Any, info: Optional["ValidationInfo"] = None) -> str:
+        genesis_hash, uri_type, hash_value = _parse(cls.prefix, value)
+        return f"{cls.prefix}{genesis_hash.hex()}/{uri_type.value}/{hash_value.hex()}"
 
     @classmethod
     def parse(cls, value: str) -> tuple[str, Bip122UriType, str]:
-        protocol_suffix = value.replace(cls.prefix, "")
-        protocol_parsed = protocol_suffix.split("/")
-        if len(protocol_parsed) != 3:
-            raise Bip122UriFormatError(value)
-
-        genesis_hash, block_keyword, block_hash = protocol_parsed
-        block_keyword = block_keyword.lower()
-        if block_keyword not in [x.value for x in Bip122UriType]:
-            raise Bip122UriFormatError(value)
-
-        return (
-            validate_hex_str(genesis_hash),
-            Bip122UriType(block_keyword),
-            validate_hex_str(block_hash),
-        )
+        genesis_hash, uri_type, hash_value = _parse(cls.prefix, value)
+        return f"0x{genesis_hash.hex()}", uri_type, f"0x{hash_value.hex()}"
 
     @cached_property
     def parsed(self) -> tuple[str, Bip122UriType, str]:
@@ -84,3 +102,97 @@ class Bip122Uri(str):
     @property
     def hash(self) -> str:
         return self.parsed[2]
+
+
+class StructuredBip122Uri:
+    """
+    A BIP-122 URI parsed once into its binary parts: the 32-byte genesis hash,
+    the URI type and the 32-byte transaction or block hash (or 20-byte address).
+    Unlike :class:`~eth_pydantic_types.bip122.Bip122Uri`, the parts are kept after
+    validation, so reading them never re-parses the URI. Instances are immutable,
+    and hash and compare by their parts. Serializes to the canonical URI string.
+    """
+
+    __slots__ = ("genesis_hash", "uri_type", "hash")
+
+    prefix: ClassVar[str] = Bip122Uri.prefix
+
+    genesis_hash: bytes
+    uri_type: Bip122UriType
+    hash: bytes
+
+    def __init__(self, value: str):
+        genesis_hash, uri_type, hash_value = _parse(self.prefix, value)
+        if len(genesis_hash) != GENESIS_HASH_SIZE:
+            raise SizeError(GENESIS_HASH_SIZE, genesis_hash)
+
+        elif len(hash_value) != _HASH_SIZES[uri_type]:
+            raise SizeError(_HASH_SIZES[uri_type], hash_value)
+
+        self._set_parts(genesis_hash, uri_type, hash_value)
+
+    @classmethod
+    def from_parts(
+        cls, genesis_hash: bytes, uri_type: Union[Bip122UriType, str], hash: bytes
+    ) -> "StructuredBip122Uri":
+        """
+        Create a URI from its parts, without validating them.
+        """
+        uri = cls.__new__(cls)
+        uri._set_parts(bytes(genesis_hash), Bip122UriType(uri_type), bytes(hash))
+        return uri
+
+    def _set_parts(self, genesis_hash: bytes, uri_type: Bip122UriType, hash_value: bytes):
+        object.__setattr__(self, "genesis_hash", genesis_hash)
+        object.__setattr__(self, "uri_type", uri_type)
+        object.__setattr__(self, "hash", hash_value)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, value, handler=None) -> "CoreSchema":
+        return get_core_schema(cls)
+
+    @classmethod
+    def __eth_pydantic_core_schema__(cls) -> "CoreSchema":
+        # perf: keep module loading super fast by localizing this import.
+        from pydantic_core.core_schema import (
+            no_info_plain_validator_function,
+            plain_serializer_function_ser_schema,
+        )
+
+        def json_schema(_, json_handler):
+            return {"type": "string", **_get_json_schema_extra(cls.prefix)}
+
+        return no_info_plain_validator_function(
+            cls.__eth_pydantic_validate__,
+            serialization=plain_serializer_function_ser_schema(function=str),
+            metadata={"pydantic_js_functions": [json_schema]},
+        )
+
+    @classmethod
+    def __eth_pydantic_validate__(cls, value: Any) -> "StructuredBip122Uri":
+        return value if type(value) is cls else cls(value)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable.")
+
+    def __str__(self) -> str:
+        return f"{self.prefix}{self.genesis_hash.hex()}/{self.uri_type.value}/{self.hash.hex()}"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self}')"
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, StructuredBip122Uri):
+            return (self.genesis_hash, self.uri_type, self.hash) == (
+                other.genesis_hash,
+                other.uri_type,
+                other.hash,
+            )
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.genesis_hash, self.uri_type, self.hash))
+
+    def __reduce__(self):
+        return type(self).from_parts, (self.genesis_hash, self.uri_type, self.hash)
@@ -0,0 +1,118 @@
+from collections import OrderedDict
+from collections.abc import Iterable
+from threading import Lock
+from typing import Any, Generic, NamedTuple, Optional, TypeVar
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[_K, _V]):
+    """
+    A thread-safe, size-limited LRU cache with hit statistics.
+    A ``maxsize`` of ``0`` disables it.
+    """
+
+    def __init__(self, maxsize: int):
+        self._lock = Lock()
+        self._data: OrderedDict[_K, _V] = OrderedDict()
+        self.maxsize = max(0, maxsize)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+    def clear(self):
+        """
+        Remove all cached values and reset the counters.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def resize(self, maxsize: int):
+        """
+        Change the size limit, evicting the least-recently used values
+        if necessary. A ``maxsize`` of ``0`` disables the cache.
+        """
+        with self._lock:
+            self.maxsize = max(0, maxsize)
+            self._evict()
+
+    def _get(self, key: _K) -> Optional[_V]:
+        # Counts a hit or a miss.
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def _set(self, key: _K, value: _V):
+        with self._lock:
+            self._data[key] = value
+            self._evict()
+
+    def _evict(self):
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+
+class InternPool(LRUCache[Any, Any]):
+    """
+    A pool of canonical values, so equal values validated many times are all
+    the same object. That saves memory when the same hashes or addresses are
+    kept in memory many times, and makes equality checks and dict lookups hit
+    the identity fast-path. Disabled (``maxsize=0``) by default.
+
+    **NOTE**: Neither ``str`` nor ``bytes`` values support weak references, so the
+    pool keeps the most-recently used ``maxsize`` values alive.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize)
+
+    def intern(self, value: _V) -> _V:
+        """
+        Get the pooled value equal to the given one, adding it if there is none.
+        """
+        if not self.maxsize:
+            return value
+
+        elif (pooled := self._get(value)) is not None:
+            return pooled
+
+        self._set(value, value)
+        return value
+
+    def intern_many(self, values: Iterable[_V]) -> list[_V]:
+        """
+        Intern every value; ``None`` values are kept as-is.
+        """
+        return [value if value is None else self.intern(value) for value in values]
+
+
+__all__ = [
+    "CacheInfo",
+    "InternPool",
+    "LRUCache",
+]
@@ -0,0 +1,55 @@
+from typing import TYPE_CHECKING, Any
+
+from eth_pydantic_types._schema import get_canonical_schema
+
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
+    from pydantic_core import CoreSchema
+
+
+class StrictCanonical:
+    """
+    Annotate a hex-str type (e.g. ``HexStr``, ``HashStr{n}`` or ``Address``) with this
+    marker to validate already-canonical values entirely in pydantic-core, using only
+    its length and pattern constraints. Values that fail the fast check fall back to
+    the regular (Python) validation, so the same inputs are accepted as before.
+    **NOTE**: When both fail, the errors of both attempts are reported.
+
+    Usage example::
+
+        from typing import Annotated
+        from pydantic import BaseModel
+        from eth_pydantic_types import Address, HashStr32, StrictCanonical
+
+        class Log(BaseModel):
+            address: Annotated[Address, StrictCanonical]
+            topic: Annotated[HashStr32, StrictCanonical]
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: "GetCoreSchemaHandler"
+    ) -> "CoreSchema":
+        if not hasattr(source, "__eth_pydantic_canonical_schema__"):
+            raise TypeError(f"'{source}' does not support {cls.__name__} validation.")
+
+        # perf: keep module loading super fast by localizing this import.
+        from pydantic_core.core_schema import union_schema
+
+        schema = handler(source)
+
+        def json_schema(_, json_handler):
+            # Document the regular schema rather than the internal union.
+            return source.__get_pydantic_json_schema__(schema, json_handler)
+
+        return union_schema(
+            [get_canonical_schema(source), schema],
+            mode="left_to_right",
+            serialization=schema.get("serialization"),
+            metadata={"pydantic_js_functions": [json_schema]},
+        )
+
+
+__all__ = [
+    "StrictCanonical",
+]
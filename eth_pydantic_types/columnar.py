@@ -0,0 +1,266 @@
+from array import array
+from collections.abc import Sequence
+from itertools import accumulate
+from typing import TYPE_CHECKING, Annotated, Any, NamedTuple, Optional, Union, get_args, get_origin
+
+from eth_pydantic_types.hash import HashBytes, HashStr
+from eth_pydantic_types.hex import BaseHexStr, HexBytes
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from pydantic.fields import FieldInfo
+
+Column = Union["FixedSizeBinaryColumn", "BinaryColumn", list]
+"""
+An exported column: binary buffers for hex fields, else a list of the values.
+"""
+
+
+class FixedSizeBinaryColumn(NamedTuple):
+    """
+    A column of ``size``-byte values, e.g. a ``HashBytes32`` or ``Address`` field,
+    laid out like an Arrow ``fixed_size_binary[size]`` array.
+    """
+
+    size: int
+    """
+    The size of every value, from the type's ``size`` (``20`` for addresses).
+    """
+
+    length: int
+    """
+    The number of values, including nulls.
+    """
+
+    data: bytes
+    """
+    The packed values; nulls are zeroes.
+    """
+
+    validity: Optional[bytearray] = None
+    """
+    The Arrow validity bitmap (least-significant bit first, ``1`` for a value),
+    or ``None`` when there are no nulls.
+    """
+
+    @property
+    def buffers(self) -> list[Optional[Any]]:
+        """
+        The buffers, in Arrow order.
+        """
+        return [self.validity, self.data]
+
+
+class BinaryColumn(NamedTuple):
+    """
+    A column of variable-length values, e.g. a ``HexBytes`` field, laid out
+    like an Arrow ``binary`` array.
+    """
+
+    length: int
+    """
+    The number of values, including nulls.
+    """
+
+    offsets: array
+    """
+    The ``length + 1`` (``int32``) offsets of the values in ``data``.
+    """
+
+    data: bytes
+    """
+    The concatenated values; nulls are empty.
+    """
+
+    validity: Optional[bytearray] = None
+    """
+    The Arrow validity bitmap (least-significant bit first, ``1`` for a value),
+    or ``None`` when there are no nulls.
+    """
+
+    @property
+    def buffers(self) -> list[Optional[Any]]:
+        """
+        The buffers, in Arrow order.
+        """
+        return [self.validity, self.offsets, self.data]
+
+
+def to_columns(
+    models: Sequence["BaseModel"],
+    fields: Optional[Sequence[str]] = None,
+    model_type: Optional[type["BaseModel"]] = None,
+) -> dict[str, Column]:
+    """
+    Export validated models as columns, writing their hex fields straight into
+    binary buffers, without serializing them to hex strings first. Fixed-size
+    fields (``HashBytes{n}``, ``HashStr{n}``, ``Address``) become
+    :class:`FixedSizeBinaryColumn` objects and ``HexBytes`` (or ``HexStr``)
+    fields :class:`BinaryColumn` objects. Other fields are lists of their values.
+
+    Args:
+        models (Sequence[BaseModel]): Models of the same type.
+        fields (Optional[Sequence[str]]): The fields to export. Defaults to all.
+        model_type (Optional[type[BaseModel]]): The type of the models.
+          Defaults to the type of the first model.
+
+    Returns:
+        dict[str, Column]: The columns by field name.
+    """
+    if model_type is None:
+        if not models:
+            return {}
+
+        model_type = type(models[0])
+
+    model_fields = model_type.model_fields
+    columns: dict[str, Column] = {}
+    for name in fields or model_fields:
+        values = [getattr(model, name) for model in models]
+        kind, size = _get_field_kind(model_fields[name])
+        if kind is bytes:
+            columns[name] = _to_fixed_size_column(values, size)
+        elif kind is str:
+            columns[name] = _to_fixed_size_column(values, size, from_hex=True)
+        elif kind is HexBytes:
+            columns[name] = _to_binary_column(values)
+        elif kind is BaseHexStr:
+            columns[name] = _to_binary_column(values, from_hex=True)
+        else:
+            columns[name] = values
+
+    return columns
+
+
+def to_arrow(
+    models: Sequence["BaseModel"],
+    fields: Optional[Sequence[str]] = None,
+    model_type: Optional[type["BaseModel"]] = None,
+):
+    """
+    Export validated models as a ``pyarrow.Table``, building its binary columns
+    from the buffers of :func:`to_columns` without copying them again.
+    Requires ``pyarrow``.
+
+    Args:
+        models (Sequence[BaseModel]): Models of the same type.
+        fields (Optional[Sequence[str]]): The fields to export. Defaults to all.
+        model_type (Optional[type[BaseModel]]): The type of the models.
+          Defaults to the type of the first model.
+
+    Returns:
+        pyarrow.Table
+    """
+    if (pyarrow := _get_pyarrow()) is None:
+        raise ImportError("pyarrow is required for `to_arrow()`.")
+
+    columns = to_columns(models, fields=fields, model_type=model_type)
+    return pyarrow.table(
+        {name: _to_arrow_array(pyarrow, column) for name, column in columns.items()}
+    )
+
+
+def _get_pyarrow():
+    # NOTE: pyarrow is optional; only `to_arrow()` needs it.
+    try:
+        import pyarrow
+    except ImportError:
+        return None
+
+    return pyarrow
+
+
+def _to_arrow_array(pyarrow, column: Column):
+    if isinstance(column, FixedSizeBinaryColumn):
+        arrow_type = pyarrow.binary(column.size)
+    elif isinstance(column, BinaryColumn):
+        arrow_type = pyarrow.binary()
+    else:
+        return pyarrow.array(column)
+
+    buffers = [None if buffer is None else pyarrow.py_buffer(buffer) for buffer in column.buffers]
+    return pyarrow.Array.from_buffers(arrow_type, column.length, buffers)
+
+
+def _get_field_kind(field: "FieldInfo") -> tuple[Optional[type], int]:
+    # Returns `bytes` or `str` (fixed-size, with the size), `HexBytes` or `BaseHexStr`
+    # (variable-size), or `None` for other fields.
+    annotation = field.annotation
+    if get_origin(annotation) is Union:
+        # e.g. `Optional[HashBytes32]`.
+        annotation = next((arg for arg in get_args(annotation) if arg is not type(None)), None)
+
+    candidates = [annotation, *field.metadata]
+    if get_origin(annotation) is Annotated:
+        # e.g. `Optional[AddressType]`.
+        candidates.extend(get_args(annotation)[1:])
+
+    for candidate in candidates:
+        # NOTE: Generic aliases, e.g. `list[int]`, pass `isinstance(..., type)` on Python < 3.11.
+        if get_origin(candidate) is not None or not isinstance(candidate, type):
+            continue
+
+        elif issubclass(candidate, HashBytes):
+            return bytes, candidate.size
+
+        elif issubclass(candidate, HashStr):
+            # Including `Address`.
+            return str, candidate.size
+
+        elif issubclass(candidate, HexBytes):
+            return HexBytes, 0
+
+        elif issubclass(candidate, BaseHexStr):
+            return BaseHexStr, 0
+
+    return None, 0
+
+
+def _get_validity(values: list) -> Optional[bytearray]:
+    if None not in values:
+        return None
+
+    validity = bytearray((len(values) + 7) // 8)
+    for index, value in enumerate(values):
+        if value is not None:
+            validity[index >> 3] |= 1 << (index & 7)
+
+    return validity
+
+
+def _to_fixed_size_column(values: list, size: int, from_hex: bool = False) -> FixedSizeBinaryColumn:
+    validity = _get_validity(values)
+    if from_hex:
+        # NOTE: Hex digits never contain an `x`, so only the `0x` prefixes are removed.
+        zero = f"0x{'00' * size}"
+        hex_str = "".join(zero if value is None else value for value in values)
+        data = bytes.fromhex(hex_str.replace("0x", ""))
+    else:
+        zero_bytes = bytes(size)
+        data = b"".join(zero_bytes if value is None else value for value in values)
+
+    if len(data) != len(values) * size:
+        raise ValueError(f"Values are not all {size} bytes.")
+
+    return FixedSizeBinaryColumn(size, len(values), data, validity)
+
+
+def _to_binary_column(values: list, from_hex: bool = False) -> BinaryColumn:
+    validity = _get_validity(values)
+    if from_hex:
+        items = [b"" if value is None else bytes.fromhex(value[2:]) for value in values]
+    else:
+        items = [b"" if value is None else value for value in values]
+
+    offsets = array("i", [0])
+    offsets.extend(accumulate(map(len, items)))
+    return BinaryColumn(len(values), offsets, b"".join(items), validity)
+
+
+__all__ = [
+    "BinaryColumn",
+    "Column",
+    "FixedSizeBinaryColumn",
+    "to_arrow",
+    "to_columns",
+]
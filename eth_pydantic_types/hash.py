@@ -1,19 +1,110 @@
-from typing import TYPE_CHECKING, Any, ClassVar, Optional
+import re
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from threading import Lock
+from typing import TYPE_CHECKING, Any, ClassVar, Optional, Union
 
-from pydantic_core.core_schema import bytes_schema, str_schema, with_info_before_validator_function
-
-from eth_pydantic_types.hex import BaseHexStr, HexBytes
-from eth_pydantic_types.serializers import hex_serializer
+from eth_pydantic_types._error import SizeError
+from eth_pydantic_types.abi import _decode_bool, _decode_int, _decode_uint
+from eth_pydantic_types.batch import (
+    BUFFER_TYPES,
+    BatchResult,
+    check_errors_mode,
+    finish_many,
+    validate_many,
+)
+from eth_pydantic_types.cache import InternPool
+from eth_pydantic_types.hex import BaseHexStr, HexBytes, decode_context
 from eth_pydantic_types.validators import validate_bytes_size, validate_str_size
 
 if TYPE_CHECKING:
     from pydantic_core.core_schema import CoreSchema, ValidationInfo
 
+MAX_HASH_SIZE = 128
+"""
+The largest size (in bytes) supported by the ``HashBytes{n}`` and ``HashStr{n}`` types.
+"""
+
+
+HashKey = bytes
+"""
+The compact, plain ``bytes`` form of a ``HashBytes{n}`` value, for the keys of
+large dicts and sets. See :meth:`HashBytes.to_key`.
+"""
+
 
 def _get_hash_pattern(str_size: int) -> str:
     return f"^0x[a-fA-F0-9]{{{str_size}}}$"
 
 
+def _get_canonical_hash_pattern(str_size: int) -> str:
+    return f"^0x[0-9a-f]{{{str_size}}}$"
+
+
+@lru_cache(maxsize=None)
+def _get_hex_regex(str_size: int) -> re.Pattern:
+    # Matches sized hex values that need no coercion besides lower-casing.
+    return re.compile(f"(?:0x)?([0-9a-fA-F]{{{str_size}}})")
+
+
+def _make_bytes_validator(size: int) -> Callable[[Any], Any]:
+    # Specialized per size, so the common inputs need no generic coercion chain.
+    fullmatch = _get_hex_regex(size * 2).fullmatch
+
+    def validate_canonical(value: Any) -> Any:
+        # Returns the value's buffer, or `None` when the value needs coercion.
+        if isinstance(value, BUFFER_TYPES):
+            return value if _get_num_bytes(value) == size else None
+
+        elif isinstance(value, str) and (match := fullmatch(value)) is not None:
+            return bytes.fromhex(match.group(1))
+
+        return None
+
+    return validate_canonical
+
+
+def _make_str_validator(size: int) -> Callable[[Any], Optional[str]]:
+    # Specialized per size, so the common inputs need no generic coercion chain.
+    str_size = size * 2 + 2
+    fullmatch = _get_hex_regex(size * 2).fullmatch
+
+    def validate_canonical(value: Any) -> Optional[str]:
+        # Returns the lower-case, `0x`-prefixed value, or `None` when the value needs coercion.
+        if isinstance(value, str) and (match := fullmatch(value)) is not None:
+            # NOTE: Only `0x`-prefixed matches are this long.
+            if len(value) == str_size and value.islower():
+                return value
+
+            return f"0x{match.group(1).lower()}"
+
+        elif isinstance(value, (bytes, bytearray)) and len(value) == size:
+            # NOTE: Not `value.hex()`, which some `bytes` subclasses override.
+            return f"0x{bytes.hex(value)}"
+
+        return None
+
+    return validate_canonical
+
+
+def _split_buffer(value: Any, size: int) -> memoryview:
+    view = memoryview(value).cast("B")
+    if len(view) % size != 0:
+        raise SizeError(size, value)
+
+    return view
+
+
+def _iter_chunks(value, size: int):
+    for start in range(0, len(value), size):
+        end = start + size
+        yield value[start:end]
+
+
+def _get_num_bytes(value: Any) -> int:
+    return memoryview(value).nbytes if isinstance(value, memoryview) else len(value)
+
+
 def _get_hash_examples(str_size: int) -> tuple[str, str, str, str]:
     zero_hash = f"0x{'0' * str_size}"
     leading_zero = f"0x01{'1e' * ((str_size - 1) // 2)}"
@@ -28,14 +119,24 @@ class HashBytes(HexBytes):
     This type is meant to be overridden by the larger hash types with a new size.
     The class variable "size" is overridden in subclasses for each byte-size,
     e.g. HashBytes20, HashBytes32.
+    Set a size for the class's :attr:`intern_pool` (e.g.
+    ``HashBytes32.intern_pool.resize(100_000)``) to get the same object
+    for equal values.
     """
 
     size: ClassVar[int] = 1
+    intern_pool: ClassVar[InternPool] = InternPool()
     schema_pattern: ClassVar[str] = _get_hash_pattern(1)
     schema_examples: ClassVar[tuple[str, ...]] = _get_hash_examples(1)
+    _validate_canonical = staticmethod(_make_bytes_validator(1))
 
     @classmethod
-    def __get_pydantic_core_schema__(cls, value, handler=None) -> "CoreSchema":
+    def __eth_pydantic_core_schema__(cls) -> "CoreSchema":
+        # perf: keep module loading super fast by localizing this import.
+        from pydantic_core.core_schema import bytes_schema, with_info_before_validator_function
+
+        from eth_pydantic_types.serializers import hex_serializer
+
         schema = with_info_before_validator_function(
             cls.__eth_pydantic_validate__,
             bytes_schema(max_length=cls.size, min_length=cls.size),
@@ -47,42 +148,378 @@ class HashBytes(HexBytes):
     def __eth_pydantic_validate__(
         cls, value: Any, info: Optional["ValidationInfo"] = None
     ) -> HexBytes:
-        return cls(cls.validate_size(HexBytes(value)))
+        if info is not None and info.context:
+            value = decode_context(value, info)
+
+        return cls.intern_pool.intern(cls._validate(value))
+
+    @classmethod
+    def _validate(cls, value: Any) -> "HashBytes":
+        if isinstance(value, HashView):
+            value = value.view
+
+        if (canonical := cls._validate_canonical(value)) is not None:
+            # perf: the common, exact-size case copies straight from the buffer, only once.
+            return bytes.__new__(cls, canonical)
+
+        return bytes.__new__(cls, cls.validate_size(HexBytes.__eth_pydantic_validate__(value)))
 
     @classmethod
     def validate_size(cls, value: bytes) -> bytes:
         return validate_bytes_size(value, cls.size)
 
+    def to_uint(self, bits: Optional[int] = None) -> int:
+        """
+        Decode as a big-endian unsigned integer, e.g. a ``uint256`` storage slot.
+        When given ``bits`` (e.g. ``8`` for a ``uint8``), the value must fit in
+        them, i.e. its (ABI) padding must be zero.
+        """
+        return _decode_uint(self, bits or self.size * 8)
+
+    def to_int(self, bits: Optional[int] = None) -> int:
+        """
+        Decode as a big-endian, two's complement signed integer. When given
+        ``bits``, the value must fit in them, i.e. be correctly sign-extended.
+        """
+        return _decode_int(self, bits or self.size * 8)
+
+    def to_bool(self) -> bool:
+        """
+        Decode as an ABI ``bool``, which must be ``0`` or ``1``.
+        """
+        return _decode_bool(self)
+
+    def to_key(self) -> HashKey:
+        """
+        Copy the value into a plain ``bytes`` object, the compact form for the
+        keys of large dicts and sets. Hash values hash and compare natively,
+        like ``bytes``, and equal to their keys, but are bigger objects.
+        """
+        return bytes(self)
+
+    @classmethod
+    def to_keys(cls, values: Union[Iterable, bytes]) -> list[HashKey]:
+        """
+        Get the plain ``bytes`` keys of many already-valid values at once.
+
+        Args:
+            values (Union[Iterable, bytes]): The values, e.g. ``HashBytes{size}``
+              or ``HashView`` objects, or a buffer of packed ``size``-byte values.
+
+        Returns:
+            list[HashKey]
+        """
+        if isinstance(values, BUFFER_TYPES):
+            view = _split_buffer(values, cls.size)
+            # NOTE: Slicing plain `bytes` (unlike `HexBytes`) gives plain `bytes`.
+            data = values if type(values) is bytes else view.tobytes()
+            return list(_iter_chunks(data, cls.size))
+
+        return [bytes(value) for value in values]
+
+    @classmethod
+    def validate_many(
+        cls,
+        values: Union[Iterable, bytes],
+        errors: str = "raise",
+        max_errors: Optional[int] = None,
+    ) -> Union[list["HashBytes"], BatchResult]:
+        """
+        Validate many values at once, without going through pydantic per value.
+
+        Args:
+            values (Union[Iterable, bytes]): The values to validate. Buffers
+              (e.g. ``bytes`` or ``memoryview``) are read as packed
+              ``size``-byte values.
+            errors (str): ``"raise"`` (default), ``"report"`` or ``"codes"``.
+              See :func:`~eth_pydantic_types.batch.validate_many`.
+            max_errors (Optional[int]): Stop validating after this many failures.
+
+        Returns:
+            Union[list[HashBytes], :class:`~eth_pydantic_types.batch.BatchResult`]
+        """
+        check_errors_mode(errors)
+        size = cls.size
+        title = f"list[{cls.__name__}]"
+        if isinstance(values, BUFFER_TYPES):
+            view = _split_buffer(values, size)
+            results = [bytes.__new__(cls, chunk) for chunk in _iter_chunks(view, size)]
+            return finish_many(_intern_many(cls, results), {}, errors, title)
+
+        validate = cls._validate
+        convert = cls.intern_pool.intern_many if cls.intern_pool.enabled else None
+        return validate_many(
+            validate, values, errors=errors, title=title, convert=convert, max_errors=max_errors
+        )
+
 
 class HashStr(BaseHexStr):
     """
     Represents a single-slot static hash as a str.
     This type is meant to be overridden by the larger hash types with a new size.
     e.g. HashStr20, HashStr32.
+    Set a size for the class's :attr:`intern_pool` (e.g.
+    ``HashStr32.intern_pool.resize(100_000)``) to get the same object
+    for equal values.
     """
 
     size: ClassVar[int] = 1
+    intern_pool: ClassVar[InternPool] = InternPool()
     schema_pattern: ClassVar[str] = _get_hash_pattern(1)
     schema_examples: ClassVar[tuple[str, ...]] = _get_hash_examples(1)
+    _validate_canonical = staticmethod(_make_str_validator(1))
 
     @classmethod
-    def __get_pydantic_core_schema__(cls, value, handler=None) -> "CoreSchema":
+    def __eth_pydantic_core_schema__(cls) -> "CoreSchema":
+        # perf: keep module loading super fast by localizing this import.
+        from pydantic_core.core_schema import (
+            no_info_after_validator_function,
+            str_schema,
+            with_info_before_validator_function,
+        )
+
         str_size = cls.size * 2 + 2
-        return with_info_before_validator_function(
+        validate = with_info_before_validator_function(
             cls.__eth_pydantic_validate__, str_schema(max_length=str_size, min_length=str_size)
         )
+        # NOTE: Interned again after the `str` schema, which copies `str` subclasses into
+        #   new objects; this finds the value pooled by `__eth_pydantic_validate__()`.
+        return no_info_after_validator_function(cls._intern_field, validate)
+
+    @classmethod
+    def __eth_pydantic_canonical_schema__(cls) -> "CoreSchema":
+        # perf: keep module loading super fast by localizing this import.
+        from pydantic_core.core_schema import no_info_after_validator_function, str_schema
+
+        str_size = cls.size * 2 + 2
+        schema = str_schema(
+            max_length=str_size,
+            min_length=str_size,
+            pattern=_get_canonical_hash_pattern(cls.size * 2),
+            strict=True,
+        )
+        return no_info_after_validator_function(cls._intern_field, schema)
 
     @classmethod
     def __eth_pydantic_validate__(cls, value: Any, info: Optional["ValidationInfo"] = None) -> str:
-        hex_str = cls.validate_hex(value)
-        hex_value = hex_str[2:] if hex_str.startswith("0x") else hex_str
-        sized_value = cls.validate_size(hex_value)
-        return cls(f"0x{sized_value}")
+        return cls.intern_pool.intern(cls(cls._validate_field(value, info)))
+
+    @classmethod
+    def _validate_field(cls, value: Any, info: Optional["ValidationInfo"] = None) -> str:
+        # Validates to the canonical, plain `str` value, without interning it.
+        if info is not None and info.context:
+            value = decode_context(value, info)
+
+        return cls._validate_canonical(value) or _validate_hash_str(cls, value)
+
+    @classmethod
+    def _intern_field(cls, value: str) -> str:
+        pool = cls.intern_pool
+        return pool.intern(cls(value)) if pool.maxsize else value
 
     @classmethod
     def validate_size(cls, value: str) -> str:
         return validate_str_size(value, cls.size * 2)
 
+    @classmethod
+    def validate_many(
+        cls,
+        values: Union[Iterable, bytes],
+        errors: str = "raise",
+        max_errors: Optional[int] = None,
+    ) -> Union[list[str], BatchResult]:
+        """
+        Validate many values at once, without going through pydantic per value.
+
+        Args:
+            values (Union[Iterable, bytes]): The values to validate. Buffers
+              (e.g. ``bytes`` or ``memoryview``) are read as packed
+              ``size``-byte values.
+            errors (str): ``"raise"`` (default), ``"report"`` or ``"codes"``.
+              See :func:`~eth_pydantic_types.batch.validate_many`.
+            max_errors (Optional[int]): Stop validating after this many failures.
+
+        Returns:
+            Union[list[str], :class:`~eth_pydantic_types.batch.BatchResult`]
+        """
+        return _validate_hash_str_many(cls, values, errors, cls._from_canonical_many, max_errors)
+
+    def to_key(self) -> str:
+        """
+        Copy the value into a plain ``str`` object, the compact form for the
+        keys of large dicts and sets, which also gets the faster lookups of
+        ``str``-only dicts.
+        """
+        return str.__str__(self)
+
+    @classmethod
+    def _from_canonical_many(cls, values: list[str]) -> list:
+        return _intern_many(cls, [cls(value) for value in values])
+
+
+class HashView:
+    """
+    A read-only view of a ``size``-byte hash inside a larger buffer, such as a
+    topic inside raw log or RLP data, that does not copy the bytes. Views compare
+    and hash like ``bytes``. Use :meth:`to_hash_bytes` to copy the value into a
+    ``HashBytes{size}`` when it needs to outlive the buffer.
+    """
+
+    __slots__ = ("view",)
+
+    def __init__(self, buffer: Any, offset: int = 0, size: int = 32):
+        view = memoryview(buffer).cast("B")
+        end = offset + size
+        if offset < 0 or size < 1 or end > len(view):
+            raise SizeError(size, buffer)
+
+        self.view = view[offset:end].toreadonly()
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def __bytes__(self) -> bytes:
+        return self.view.tobytes()
+
+    def __getitem__(self, index):
+        return self.view[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, HashView):
+            return self.view == other.view
+
+        elif isinstance(other, BUFFER_TYPES):
+            return self.view == other
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        # NOTE: Hash a copy, as the underlying buffer may be mutable.
+        return hash(self.view.tobytes())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self.to_0x_hex()}')"
+
+    @property
+    def size(self) -> int:
+        return len(self.view)
+
+    def hex(self) -> str:
+        return self.view.hex()
+
+    def to_0x_hex(self) -> str:
+        return f"0x{self.view.hex()}"
+
+    def tobytes(self) -> bytes:
+        return self.view.tobytes()
+
+    def to_hash_bytes(self) -> HashBytes:
+        """
+        Copy the value into a new ``HashBytes{size}`` object.
+        """
+        return hash_type(self.size).__eth_pydantic_validate__(self.view)
+
+    def to_uint(self, bits: Optional[int] = None) -> int:
+        """
+        Decode as a big-endian unsigned integer. See :meth:`HashBytes.to_uint`.
+        """
+        return _decode_uint(self.view, bits or self.size * 8)
+
+    def to_int(self, bits: Optional[int] = None) -> int:
+        """
+        Decode as a big-endian, two's complement signed integer.
+        See :meth:`HashBytes.to_int`.
+        """
+        return _decode_int(self.view, bits or self.size * 8)
+
+    def to_bool(self) -> bool:
+        """
+        Decode as an ABI ``bool``, which must be ``0`` or ``1``.
+        """
+        return _decode_bool(self.view)
+
+
+def _validate_hash_str(cls, value: Any) -> str:
+    hex_str = cls.validate_hex(value)
+    hex_value = hex_str[2:] if hex_str.startswith("0x") else hex_str
+    sized_value = cls.validate_size(hex_value)
+    return f"0x{sized_value}"
+
+
+def _intern_many(cls, values: list) -> list:
+    return cls.intern_pool.intern_many(values) if cls.intern_pool.enabled else values
+
+
+def _validate_hash_str_many(
+    cls,
+    values: Union[Iterable, bytes],
+    errors: str,
+    convert: Callable[[list[str]], list],
+    max_errors: Optional[int] = None,
+) -> Union[list, BatchResult]:
+    # Validates to canonical (lower-case) hex and then converts all the valid values at once.
+    check_errors_mode(errors)
+    size = cls.size
+    title = f"list[{cls.__name__}]"
+    if isinstance(values, BUFFER_TYPES):
+        hex_value = _split_buffer(values, size).hex()
+        canonical = [f"0x{chunk}" for chunk in _iter_chunks(hex_value, size * 2)]
+        return finish_many(convert(canonical), {}, errors, title)
+
+    validate_canonical = cls._validate_canonical
+
+    def validate(value):
+        return validate_canonical(value) or _validate_hash_str(cls, value)
+
+    return validate_many(
+        validate, values, errors=errors, title=title, convert=convert, max_errors=max_errors
+    )
+
+
+_hash_types: dict[tuple[str, int], type] = {}
+_hash_types_lock = Lock()
+
+
+def hash_type(size: int, kind: Union[type, str] = bytes) -> type[Any]:
+    """
+    Get the sized hash class for the given size, e.g. ``hash_type(32)``
+    is ``HashBytes32`` and ``hash_type(20, str)`` is ``HashStr20``.
+    The same class is returned every time it is requested.
+
+    Args:
+        size (int): The size of the hash in bytes.
+        kind (Union[type, str]): ``bytes`` for ``HashBytes{size}``
+          or ``str`` for ``HashStr{size}``. Defaults to ``bytes``.
+
+    Returns:
+        type: The ``HashBytes{size}`` or ``HashStr{size}`` class.
+    """
+    if kind in ("bytes", "Bytes"):
+        kind = bytes
+    elif kind in ("str", "Str"):
+        kind = str
+
+    if not isinstance(kind, type) or not issubclass(kind, (bytes, str)):
+        raise TypeError(f"Unknown hash kind '{kind}'. Expecting 'bytes' or 'str'.")
+
+    elif isinstance(size, bool) or not isinstance(size, int):
+        raise TypeError(f"Hash size must be an int, not '{type(size).__name__}'.")
+
+    elif not 1 <= size <= MAX_HASH_SIZE:
+        raise ValueError(f"Hash size must be between 1 and {MAX_HASH_SIZE}, got {size}.")
+
+    suffix = "Bytes" if issubclass(kind, bytes) else "Str"
+    key = (suffix, size)
+    if (cls := _hash_types.get(key)) is not None:
+        return cls
+
+    with _hash_types_lock:
+        # NOTE: Check again, as another thread may have made the class while waiting.
+        if (cls := _hash_types.get(key)) is None:
+            cls = _hash_types[key] = _make_hash_cls(size, kind)
+
+    return cls
+
 
 def _make_hash_cls(size: int, base_type: type):
     if issubclass(base_type, bytes):
@@ -93,16 +530,23 @@ def _make_hash_cls(size: int, base_type: type):
         base_type = HashStr
 
     str_size = size * 2
-    return type(
+    make_validator = _make_bytes_validator if suffix == "Bytes" else _make_str_validator
+    cls = type(
         f"Hash{suffix}{size}",
         (base_type,),
         dict(
             size=size,
             schema_pattern=_get_hash_pattern(str_size),
             schema_examples=_get_hash_examples(str_size),
+            # Every size gets its own pool.
+            intern_pool=InternPool(),
+            # With the size baked in.
+            _validate_canonical=staticmethod(make_validator(size)),
         ),
     )
 
+    return cls
+
 
 def __getattr__(name: str):
     _type: type
@@ -115,13 +559,20 @@ def __getattr__(name: str):
     else:
         raise AttributeError(name)
 
-    if not number.isnumeric():
+    if not number.isnumeric() or not 1 <= int(number) <= MAX_HASH_SIZE:
         raise AttributeError(name)
 
-    return _make_hash_cls(int(number), _type)
+    cls = hash_type(int(number), _type)
+
+    # Cache on the module so later lookups skip `__getattr__` entirely.
+    globals()[name] = cls
+    return cls
 
 
 __all__ = [
+    "MAX_HASH_SIZE",
+    "HashKey",
+    "HashView",
     "HashBytes4",
     "HashBytes8",
     "HashBytes16",
@@ -134,4 +585,5 @@ __all__ = [
     "HashStr20",
     "HashStr32",
     "HashStr64",
+    "hash_type",
 ]
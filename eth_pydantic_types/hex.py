@@ -1,22 +1,19 @@
 from typing import TYPE_CHECKING, Any, ClassVar, Optional, Union
 
 from hexbytes import HexBytes as BaseHexBytes
-from pydantic_core.core_schema import (
-    ValidationInfo,
-    bytes_schema,
-    no_info_before_validator_function,
-    str_schema,
-    with_info_before_validator_function,
-)
 
 from eth_pydantic_types._error import HexValueError
-from eth_pydantic_types.serializers import hex_serializer
+from eth_pydantic_types._schema import get_core_schema, update_json_schema
+from eth_pydantic_types.batch import BUFFER_TYPES
+from eth_pydantic_types.serializers import get_hex_format
 
 if TYPE_CHECKING:
     from pydantic_core import CoreSchema
+    from pydantic_core.core_schema import ValidationInfo
 
 
 schema_pattern = "^0x([0-9a-f][0-9a-f])*$"
+canonical_pattern = schema_pattern
 schema_examples = (
     "0x",  # empty bytes
     "0xd4",
@@ -34,11 +31,12 @@ class BaseHex:
 
     @classmethod
     def __get_pydantic_json_schema__(cls, core_schema, handler):
-        json_schema = handler(core_schema)
-        json_schema.update(
-            format="binary", pattern=cls.schema_pattern, examples=list(cls.schema_examples)
-        )
-        return json_schema
+        return update_json_schema(cls, handler(core_schema))
+
+    @classmethod
+    def __eth_pydantic_json_schema_extra__(cls) -> dict[str, Any]:
+        # Built once per class; see `update_json_schema()`.
+        return dict(format="binary", pattern=cls.schema_pattern, examples=list(cls.schema_examples))
 
 
 class HexBytes(BaseHexBytes, BaseHex):
@@ -49,6 +47,15 @@ class HexBytes(BaseHexBytes, BaseHex):
 
     @classmethod
     def __get_pydantic_core_schema__(cls, value, handle=None) -> "CoreSchema":
+        return get_core_schema(cls)
+
+    @classmethod
+    def __eth_pydantic_core_schema__(cls) -> "CoreSchema":
+        # perf: keep module loading super fast by localizing this import.
+        from pydantic_core.core_schema import bytes_schema, with_info_before_validator_function
+
+        from eth_pydantic_types.serializers import hex_serializer
+
         schema = with_info_before_validator_function(cls.__eth_pydantic_validate__, bytes_schema())
         schema["serialization"] = hex_serializer
         return schema
@@ -60,20 +67,50 @@ class HexBytes(BaseHexBytes, BaseHex):
 
     @classmethod
     def __eth_pydantic_validate__(
-        cls, value: Any, info: Optional[ValidationInfo] = None
+        cls, value: Any, info: Optional["ValidationInfo"] = None
     ) -> BaseHexBytes:
+        if info is not None and info.context:
+            value = decode_context(value, info)
+
+        if isinstance(value, BUFFER_TYPES):
+            # perf: copy straight from the buffer, only once.
+            return bytes.__new__(BaseHexBytes, value)
+
+        elif isinstance(value, str):
+            return bytes.__new__(BaseHexBytes, validate_hex_bytes(value))
+
+        elif not isinstance(value, int) and hasattr(type(value), "__bytes__"):
+            # e.g. `HashView` objects.
+            return bytes.__new__(BaseHexBytes, bytes(value))
+
         return BaseHexBytes(value)
 
 
 class BaseHexStr(str, BaseHex):
     @classmethod
-    def __get_pydantic_core_schema__(cls, value, handler=None):
-        return no_info_before_validator_function(cls.__eth_pydantic_validate__, str_schema())
+    def __get_pydantic_core_schema__(cls, value, handler=None) -> "CoreSchema":
+        return get_core_schema(cls)
 
     @classmethod
-    def __eth_pydantic_validate__(cls, value):
+    def __eth_pydantic_core_schema__(cls) -> "CoreSchema":
+        # perf: keep module loading super fast by localizing this import.
+        from pydantic_core.core_schema import str_schema, with_info_before_validator_function
+
+        return with_info_before_validator_function(cls.__eth_pydantic_validate__, str_schema())
+
+    @classmethod
+    def __eth_pydantic_validate__(cls, value, info: Optional["ValidationInfo"] = None):
         return value  # Override.
 
+    @classmethod
+    def __eth_pydantic_canonical_schema__(cls) -> "CoreSchema":
+        # Used by `StrictCanonical`; accepts only values needing no coercion.
+        # Strict, so e.g. `bytes` are not decoded here but left to the regular validator.
+        # perf: keep module loading super fast by localizing this import.
+        from pydantic_core.core_schema import str_schema
+
+        return str_schema(pattern=canonical_pattern, strict=True)
+
     @classmethod
     def from_bytes(cls, data: bytes) -> "BaseHexStr":
         hex_value = data.hex()
@@ -105,7 +142,10 @@ class HexStr(BaseHexStr):
     """A hex string value, typically from a hash."""
 
     @classmethod
-    def __eth_pydantic_validate__(cls, value):
+    def __eth_pydantic_validate__(cls, value, info: Optional["ValidationInfo"] = None):
+        if info is not None and info.context:
+            value = decode_context(value, info)
+
         return cls.validate_hex(value)
 
     @classmethod
@@ -116,12 +156,63 @@ class HexStr(BaseHexStr):
 
 
 def validate_hex_str(value: str) -> str:
-    hex_value = (value[2:] if value.startswith("0x") else value).lower()
-    if set(hex_value) - set("1234567890abcdef"):
-        raise HexValueError(value)
+    """
+    Validate a hex string, returning it as lowercase, ``0x``-prefixed
+    and zero-padded to a whole number of bytes.
+    """
+    if value.startswith("0x"):
+        data = _decode_hex(value, value[2:])
+        if len(value) % 2 == 0 and value.islower():
+            # Already canonical.
+            return value
+
+    else:
+        data = _decode_hex(value, value)
+
+    return f"0x{data.hex()}"
+
+
+def validate_hex_bytes(value: str) -> bytes:
+    """
+    Validate a hex string (with or without a ``0x`` prefix) and return its bytes.
+    Use instead of :func:`validate_hex_str` when the bytes are needed, to avoid
+    decoding twice.
+    """
+    return _decode_hex(value, value[2:] if value.startswith(("0x", "0X")) else value)
+
 
-    # Missing zero padding.
+def decode_context(value: Any, info: "ValidationInfo") -> Any:
+    """
+    Decode a base64 ``str`` when the validation context's ``hex_format`` is
+    ``"base64"``, e.g. ``Model.model_validate(data, context={"hex_format": "base64"})``.
+    Other values are returned as-is; raw bytes are always accepted.
+    """
+    # NOTE: Base64 is only decoded when asked for, as it may also be valid hex.
+    if not isinstance(value, str) or get_hex_format(info) != "base64":
+        return value
+
+    # perf: keep module loading super fast by localizing this import.
+    from base64 import b64decode
+    from binascii import Error
+
+    try:
+        return b64decode(value, validate=True)
+    except Error:
+        raise HexValueError(value) from None
+
+
+def _decode_hex(value: str, hex_value: str) -> bytes:
     if len(hex_value) % 2 != 0:
+        # Missing zero padding.
         hex_value = f"0{hex_value}"
 
-    return f"0x{hex_value}"
+    try:
+        data = bytes.fromhex(hex_value)
+    except ValueError:
+        raise HexValueError(value) from None
+
+    # NOTE: `bytes.fromhex()` skips whitespace, which is not valid here.
+    if len(data) * 2 != len(hex_value):
+        raise HexValueError(value)
+
+    return data
@@ -0,0 +1,509 @@
+import os
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from hashlib import blake2b
+from heapq import merge as merge_sorted
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from struct import Struct
+from tempfile import TemporaryFile, mkstemp
+from typing import IO, Any, Optional, Union
+
+from eth_pydantic_types.batch import BUFFER_TYPES
+from eth_pydantic_types.hash import (
+    HashBytes,
+    HashStr,
+    _get_num_bytes,
+    _iter_chunks,
+    _split_buffer,
+    _validate_hash_str,
+    hash_type,
+)
+
+MAGIC = b"EPTHIDX\x00"
+"""
+The first bytes of every index file.
+"""
+
+VERSION = 1
+"""
+The version of the index file format.
+"""
+
+HEADER_SIZE = 64
+"""
+The size (in bytes) of the header, which the sorted values follow.
+"""
+
+DEFAULT_BITS_PER_VALUE = 10
+"""
+The default size of the bloom filter, in bits per value (~1% false positives).
+"""
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+"""
+The default number of values sorted in memory at a time when building an index.
+"""
+
+# Magic, version, value size, type name, count, bloom filter bits,
+# bloom filter hashes and bits per value; zero-padded up to `HEADER_SIZE`.
+_HEADER = Struct("<8sHH16sQQBB")
+
+# The number of values read (and decoded) at a time when iterating.
+_BLOCK_SIZE = 4096
+
+PathLike = Union[str, os.PathLike]
+
+
+class HashIndex:
+    """
+    A sorted, memory-mapped, on-disk set of ``HashBytes{n}``, ``HashStr{n}`` or
+    ``Address`` values, e.g. known transaction hashes or contract addresses that
+    do not fit in memory. Membership checks hit a bloom filter first, and only
+    binary-search the values when it is a (probable) match.
+
+    The file is a header, recording the value type and its ``size``, followed by
+    the sorted, unique values as packed ``size``-byte records, and then the bloom
+    filter. Values are only turned into objects of the value type when read.
+
+    Usage example::
+
+        from eth_pydantic_types import Address, HashIndex
+
+        index = HashIndex.build("contracts.idx", addresses, Address)
+        assert addresses[0] in index
+
+        with HashIndex("contracts.idx") as index:
+            index.append(new_addresses)
+    """
+
+    def __init__(self, path: PathLike):
+        self.path = Path(path)
+        self._open()
+
+    def _open(self):
+        with open(self.path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < HEADER_SIZE:
+                raise ValueError(f"'{self.path}' is not a hash index.")
+
+            self._mmap = mmap(file.fileno(), 0, access=ACCESS_READ)
+
+        magic, version, size, name, count, bloom_bits, bloom_hashes, bits_per_value = (
+            _HEADER.unpack_from(self._mmap)
+        )
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"'{self.path}' is not a version {VERSION} hash index.")
+
+        try:
+            type_name = name.rstrip(b"\x00").decode("ascii")
+            value_type = _get_value_type(type_name, size)
+        except (TypeError, ValueError):
+            value_type = None
+
+        bloom_offset = HEADER_SIZE + count * size
+        if (
+            value_type is None
+            or _get_type_name(value_type) != type_name
+            or bloom_bits < 64
+            or bloom_bits % 8
+            or bloom_hashes < 1
+            # NOTE: Check the length so a truncated file fails here, not on lookups.
+            or len(self._mmap) < bloom_offset + bloom_bits // 8
+        ):
+            self.close()
+            raise ValueError(f"'{self.path}' is a truncated or corrupt hash index.")
+
+        self.value_type = value_type
+        self.size: int = size
+        self.bits_per_value: int = bits_per_value
+        self._count: int = count
+        self._bloom_bits: int = bloom_bits
+        self._bloom_hashes: int = bloom_hashes
+        self._bloom_offset = bloom_offset
+
+    @classmethod
+    def build(
+        cls,
+        path: PathLike,
+        values: Union[Iterable, bytes],
+        value_type: type[Any],
+        bits_per_value: int = DEFAULT_BITS_PER_VALUE,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> "HashIndex":
+        """
+        Validate the values and write them to a new index file, replacing any
+        existing one. Values are sorted ``chunk_size`` at a time and the sorted
+        chunks merged through temporary files, so they do not need to fit in
+        memory.
+
+        Args:
+            path (PathLike): The file to write.
+            values (Union[Iterable, bytes]): The values, or a buffer of
+              packed ``size``-byte values.
+            value_type (type): A ``HashBytes{n}``, ``HashStr{n}`` or ``Address``.
+            bits_per_value (int): The size of the bloom filter.
+              Defaults to ``10`` (~1% false positives).
+            chunk_size (int): The number of values sorted in memory at a time.
+
+        Returns:
+            :class:`~eth_pydantic_types.index.HashIndex`
+        """
+        name = _get_type_name(value_type)
+        size = value_type.size
+        with ExitStack() as stack:
+            runs: list[Iterator[bytes]] = []
+            total = 0
+            for chunk in _iter_key_chunks(value_type, values, max(1, chunk_size)):
+                keys = sorted(set(chunk))
+                total += len(keys)
+                if not runs and len(chunk) < chunk_size:
+                    # The only chunk; no need to spill it.
+                    runs.append(iter(keys))
+                    break
+
+                file = stack.enter_context(TemporaryFile(dir=Path(path).parent))
+                file.write(b"".join(keys))
+                file.seek(0)
+                runs.append(_read_keys(file, size))
+
+            temp_path = _write(
+                path, name, size, _unique(merge_sorted(*runs)), total, bits_per_value
+            )
+
+        _replace(temp_path, path)
+        return cls(path)
+
+    @classmethod
+    def merge(
+        cls,
+        path: PathLike,
+        indexes: Iterable[Union["HashIndex", PathLike]],
+        bits_per_value: Optional[int] = None,
+    ) -> "HashIndex":
+        """
+        Merge indexes of the same value type into a new index file.
+
+        Args:
+            path (PathLike): The file to write. May be one of the merged files;
+              given indexes of it are then reopened on the merged file.
+            indexes (Iterable[Union[HashIndex, PathLike]]): The indexes, or their files.
+            bits_per_value (Optional[int]): The size of the bloom filter.
+              Defaults to the largest of the merged indexes.
+
+        Returns:
+            :class:`~eth_pydantic_types.index.HashIndex`
+        """
+        indexes = list(indexes)
+        with ExitStack() as stack:
+            sources = [
+                index if isinstance(index, HashIndex) else stack.enter_context(HashIndex(index))
+                for index in indexes
+            ]
+            if not sources:
+                raise ValueError("Nothing to merge.")
+
+            first = sources[0]
+            if any(source.value_type is not first.value_type for source in sources):
+                raise ValueError("Cannot merge indexes of different value types.")
+
+            keys_iter = _unique(merge_sorted(*(source._iter_keys() for source in sources)))
+            temp_path = _write(
+                path,
+                _get_type_name(first.value_type),
+                first.size,
+                keys_iter,
+                sum(len(source) for source in sources),
+                bits_per_value or max(source.bits_per_value for source in sources),
+            )
+
+        # NOTE: The given indexes of `path` (if any) are reopened on the merged file.
+        _replace(temp_path, path, [index for index in indexes if isinstance(index, HashIndex)])
+        return cls(path)
+
+    def append(self, values: Union[Iterable, bytes]) -> "HashIndex":
+        """
+        Add the values to the index, rewriting its file (atomically) with the
+        merged values. Prefer appending in large batches.
+
+        Args:
+            values (Union[Iterable, bytes]): The values, or a buffer of
+              packed ``size``-byte values.
+
+        Returns:
+            :class:`~eth_pydantic_types.index.HashIndex`: This index.
+        """
+        keys = sorted({key for chunk in _iter_key_chunks(self.value_type, values) for key in chunk})
+        temp_path = _write(
+            self.path,
+            _get_type_name(self.value_type),
+            self.size,
+            _unique(merge_sorted(self._iter_keys(), keys)),
+            len(self) + len(keys),
+            self.bits_per_value,
+        )
+        _replace(temp_path, self.path, [self])
+        return self
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self) -> "HashIndex":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} '{self.path}' {self.value_type.__name__} x {len(self)}>"
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._count
+
+        if not 0 <= index < self._count:
+            raise IndexError(f"{type(self).__name__} index out of range.")
+
+        return self._decode(self._key(index))[0]
+
+    def __iter__(self) -> Iterator:
+        # Decodes a block at a time, only as far as iterated.
+        block_size = _BLOCK_SIZE * self.size
+        for start in range(HEADER_SIZE, self._bloom_offset, block_size):
+            end = min(start + block_size, self._bloom_offset)
+            yield from self._decode(self._mmap[start:end])
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            key = _to_key(self.value_type, value)
+        except (TypeError, ValueError):
+            return False
+
+        return self._contains_key(key)
+
+    def contains_many(self, values: Iterable) -> list[bool]:
+        """
+        Check the membership of many values at once.
+        """
+        return [value in self for value in values]
+
+    def might_contain(self, value: Any) -> bool:
+        """
+        Check the bloom filter only: ``False`` means the value is certainly not
+        in the index, ``True`` that it probably is.
+        """
+        try:
+            key = _to_key(self.value_type, value)
+        except (TypeError, ValueError):
+            return False
+
+        return self._might_contain_key(key)
+
+    def _contains_key(self, key: bytes) -> bool:
+        if not self._might_contain_key(key):
+            return False
+
+        # perf: binary-search inline; this runs ~log2(count) times per lookup.
+        data, size = self._mmap, self.size
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            start = HEADER_SIZE + middle * size
+            end = start + size
+            if data[start:end] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low < self._count and self._key(low) == key
+
+    def _might_contain_key(self, key: bytes) -> bool:
+        data, offset, bits = self._mmap, self._bloom_offset, self._bloom_bits
+        position, step = _bloom_hash(key)
+        for _ in range(self._bloom_hashes):
+            # NOTE: Most misses stop at the first or second unset bit.
+            index = position % bits
+            if not data[offset + (index >> 3)] >> (index & 7) & 1:
+                return False
+
+            position += step
+
+        return True
+
+    def _key(self, index: int) -> bytes:
+        start = HEADER_SIZE + index * self.size
+        end = start + self.size
+        return self._mmap[start:end]
+
+    def _iter_keys(self) -> Iterator[bytes]:
+        block_size = _BLOCK_SIZE * self.size
+        for start in range(HEADER_SIZE, self._bloom_offset, block_size):
+            end = min(start + block_size, self._bloom_offset)
+            yield from _iter_chunks(self._mmap[start:end], self.size)
+
+    def _decode(self, data: bytes) -> list:
+        value_type = self.value_type
+        if issubclass(value_type, HashBytes):
+            return [bytes.__new__(value_type, chunk) for chunk in _iter_chunks(data, self.size)]
+
+        elif hasattr(value_type, "to_checksum_addresses"):
+            return list(value_type.to_checksum_addresses(data))
+
+        return [value_type(f"0x{chunk}") for chunk in _iter_chunks(data.hex(), self.size * 2)]
+
+
+def _get_type_name(value_type: Any) -> str:
+    # perf: keep module loading super fast by localizing this import.
+    from eth_pydantic_types.address import Address
+
+    if isinstance(value_type, type) and issubclass(value_type, Address):
+        return "Address"
+
+    elif isinstance(value_type, type) and issubclass(value_type, HashBytes):
+        return f"HashBytes{value_type.size}"
+
+    elif isinstance(value_type, type) and issubclass(value_type, HashStr):
+        return f"HashStr{value_type.size}"
+
+    raise TypeError(f"Unsupported value type '{value_type}'. Expecting a hash or address type.")
+
+
+def _get_value_type(name: str, size: int) -> type[Any]:
+    if name == "Address":
+        # perf: keep module loading super fast by localizing this import.
+        from eth_pydantic_types.address import Address
+
+        return Address
+
+    return hash_type(size, "str" if name.startswith("HashStr") else "bytes")
+
+
+def _to_key(value_type: Any, value: Any) -> bytes:
+    if isinstance(value, BUFFER_TYPES) and _get_num_bytes(value) == value_type.size:
+        return bytes(value)
+
+    elif issubclass(value_type, HashBytes):
+        return bytes(value_type._validate(value))
+
+    hex_str = value_type._validate_canonical(value) or _validate_hash_str(value_type, value)
+    return bytes.fromhex(hex_str[2:])
+
+
+def _iter_key_chunks(
+    value_type: Any, values: Union[Iterable, bytes], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[list[bytes]]:
+    size = value_type.size
+    if isinstance(values, BUFFER_TYPES):
+        # NOTE: Any `size` bytes are a valid value.
+        view = _split_buffer(values, size)
+        for start in range(0, len(view), chunk_size * size):
+            end = start + chunk_size * size
+            yield list(_iter_chunks(view[start:end].tobytes(), size))
+
+        return
+
+    chunk: list[bytes] = []
+    for value in values:
+        chunk.append(_to_key(value_type, value))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+
+    yield chunk
+
+
+def _read_keys(file: IO[bytes], size: int) -> Iterator[bytes]:
+    while data := file.read(_BLOCK_SIZE * size):
+        yield from _iter_chunks(data, size)
+
+
+def _unique(keys: Iterable[bytes]) -> Iterator[bytes]:
+    # The keys are sorted, so duplicates are consecutive.
+    previous = None
+    for key in keys:
+        if key != previous:
+            yield key
+            previous = key
+
+
+def _bloom_hash(key: bytes) -> tuple[int, int]:
+    # Double hashing: the i-th bit is `(position + i * step) % bits`.
+    digest = blake2b(key, digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+def _write(
+    path: PathLike,
+    name: str,
+    size: int,
+    keys: Iterable[bytes],
+    max_count: int,
+    bits_per_value: int,
+) -> str:
+    # Writes the index to a new temporary file next to `path` and returns its path;
+    # see `_replace()`. Readers never see a partial index.
+    # NOTE: The bloom filter is sized by the count before removing duplicates.
+    bits_per_value = max(1, min(bits_per_value, 255))
+    bloom_bits = max(64, -(-max_count * bits_per_value // 64) * 64)
+    bloom_hashes = max(1, round(bits_per_value * 0.693))
+    bloom = bytearray(bloom_bits // 8)
+
+    path = Path(path)
+    fd, temp_path = mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    count = 0
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(bytes(HEADER_SIZE))
+            block: list[bytes] = []
+            for key in keys:
+                position, step = _bloom_hash(key)
+                for _ in range(bloom_hashes):
+                    index = position % bloom_bits
+                    bloom[index >> 3] |= 1 << (index & 7)
+                    position += step
+
+                block.append(key)
+                if len(block) >= _BLOCK_SIZE:
+                    file.write(b"".join(block))
+                    count += len(block)
+                    block.clear()
+
+            file.write(b"".join(block))
+            count += len(block)
+            file.write(bloom)
+            file.seek(0)
+            header = (MAGIC, VERSION, size, name.encode("ascii"), count, bloom_bits)
+            file.write(_HEADER.pack(*header, bloom_hashes, bits_per_value))
+
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+    return temp_path
+
+
+def _replace(temp_path: str, path: PathLike, indexes: Iterable[HashIndex] = ()):
+    # NOTE: Windows cannot replace a memory-mapped file, so the given indexes
+    #   of `path` are closed first and reopened on the new file.
+    target = Path(path).resolve()
+    reopen = [index for index in indexes if index.path.resolve() == target]
+    for index in reopen:
+        index.close()
+
+    try:
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    finally:
+        for index in reopen:
+            index._open()
+
+
+__all__ = [
+    "HEADER_SIZE",
+    "HashIndex",
+]
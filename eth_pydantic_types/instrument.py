@@ -0,0 +1,283 @@
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
+from functools import wraps
+from threading import Lock, local
+from time import perf_counter_ns
+from typing import Any
+
+INPUT_TYPES = {str: "str", bytes: "bytes", bytearray: "bytes", memoryview: "bytes", int: "int"}
+
+MetricCallback = Callable[[str, float, dict[str, str]], Any]
+"""
+Receives each exported metric as ``(name, value, labels)``,
+e.g. ``("eth_pydantic_types_validate_calls", 10, {"type": "HashBytes32"})``.
+"""
+
+
+class Instrumentation:
+    """
+    Optional counters and timers for the validation and serialization hot paths.
+    Nothing is measured until :meth:`enable` is called, and disabling restores the
+    original functions, so there is no cost at all while disabled.
+
+    Counts, per type, calls to ``__eth_pydantic_validate__``, the types of their
+    inputs (``str``, ``bytes``, ``int`` or ``other``), their failures by error type
+    (e.g. ``HexValueError``) and their cumulative time. A value validated through
+    another type (e.g. ``HashBytes32`` through ``HexBytes``) is only counted once,
+    for the outermost type. Also counts size padding and odd-length hex
+    coercions, and times ``serialize_hex`` and the ``CompactHex`` serializers.
+    The counters are safe to update from many threads.
+
+    **NOTE**: Core schemas are cached per class and hold on to the functions they
+    call, so only models (and ``TypeAdapter`` objects) created after enabling (or
+    disabling) are affected. Enable it at start-up, before defining models. Fast
+    bulk paths, such as ``validate_many()``, are not measured.
+
+    Usage example::
+
+        from eth_pydantic_types.instrument import instrumentation
+
+        instrumentation.enable()
+        ...  # Define and use models.
+        print(instrumentation.as_dict())
+    """
+
+    def __init__(self):
+        self._originals: list[tuple[Any, str, Any]] = []
+        # NOTE: Counters are updated under the lock, as `+=` is not atomic across threads.
+        self._lock = Lock()
+        # Whether a measured validate call is running, per thread.
+        self._local = local()
+        self.reset()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._originals)
+
+    def reset(self):
+        """
+        Reset all the counters and timers.
+        """
+        with self._lock:
+            self.calls: Counter[str] = Counter()
+            self.nanoseconds: Counter[str] = Counter()
+            self.inputs: defaultdict[str, Counter[str]] = defaultdict(Counter)
+            self.failures: defaultdict[str, Counter[str]] = defaultdict(Counter)
+            self.coercions: Counter[str] = Counter()
+            self.serialize_calls: Counter[str] = Counter()
+            self.serialize_nanoseconds: Counter[str] = Counter()
+
+    def enable(self):
+        """
+        Start measuring. Does nothing if already enabled.
+        """
+        if self.enabled:
+            return
+
+        # perf: keep module loading super fast by localizing these imports.
+        import eth_pydantic_types.hex as hex_module
+        import eth_pydantic_types.serializers as serializers
+        import eth_pydantic_types.validators as validators
+
+        for cls in _iter_validated_classes():
+            if "__eth_pydantic_validate__" in cls.__dict__:
+                method = cls.__dict__["__eth_pydantic_validate__"]
+                self._patch(cls, "__eth_pydantic_validate__", self._wrap_validate(method))
+
+        for name in ("serialize_hex", "serialize_compact_hex", "serialize_compact_hex_str"):
+            self._patch(serializers, name, self._wrap_serialize(getattr(serializers, name)))
+
+        for module, name, kind in (
+            (validators, "_coerce_hexstr_size", "str_size"),
+            (validators, "_coerce_hexbytes_size", "bytes_size"),
+        ):
+            self._patch(module, name, self._wrap_coerce(getattr(module, name), kind))
+
+        self._patch(hex_module, "_decode_hex", self._wrap_decode_hex(hex_module._decode_hex))
+        _clear_schemas()
+
+    def disable(self):
+        """
+        Stop measuring and restore the original functions. Keeps the data.
+        """
+        while self._originals:
+            target, name, original = self._originals.pop()
+            setattr(target, name, original)
+
+        _clear_schemas()
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Get all the data as a ``dict``; times are in seconds.
+        """
+        return {
+            "validate": {
+                name: {
+                    "calls": calls,
+                    "seconds": self.nanoseconds[name] / 1e9,
+                    "inputs": dict(self.inputs[name]),
+                    "failures": dict(self.failures[name]),
+                }
+                for name, calls in self.calls.items()
+            },
+            "serialize": {
+                name: {"calls": calls, "seconds": self.serialize_nanoseconds[name] / 1e9}
+                for name, calls in self.serialize_calls.items()
+            },
+            "coercions": dict(self.coercions),
+        }
+
+    def export(self, callback: MetricCallback, prefix: str = "eth_pydantic_types"):
+        """
+        Send every metric to the given callback, e.g. to set Prometheus
+        counters or send StatsD metrics.
+
+        Args:
+            callback (MetricCallback): Called with ``(name, value, labels)``.
+            prefix (str): The prefix of the metric names.
+        """
+        for name, value, labels in self._iter_metrics():
+            callback(f"{prefix}_{name}", value, labels)
+
+    def _iter_metrics(self) -> Iterator[tuple[str, float, dict[str, str]]]:
+        for type_name, calls in self.calls.items():
+            yield "validate_calls", calls, {"type": type_name}
+            yield "validate_seconds", self.nanoseconds[type_name] / 1e9, {"type": type_name}
+            for input_type, count in self.inputs[type_name].items():
+                yield "validate_inputs", count, {"type": type_name, "input_type": input_type}
+
+            for error, count in self.failures[type_name].items():
+                yield "validate_failures", count, {"type": type_name, "error": error}
+
+        for function, calls in self.serialize_calls.items():
+            yield "serialize_calls", calls, {"function": function}
+            seconds = self.serialize_nanoseconds[function] / 1e9
+            yield "serialize_seconds", seconds, {"function": function}
+
+        for kind, count in self.coercions.items():
+            yield "coercions", count, {"kind": kind}
+
+    def _patch(self, target: Any, name: str, value: Any):
+        self._originals.append((target, name, target.__dict__[name]))
+        setattr(target, name, value)
+
+    def _wrap_validate(self, method: classmethod) -> classmethod:
+        func = method.__func__
+
+        @wraps(func)
+        def __eth_pydantic_validate__(cls, value, *args, **kwargs):
+            state = self._local
+            if getattr(state, "active", False):
+                # Called while validating another value (e.g. `HashBytes32` validates
+                # through `HexBytes`), so only the outermost call is counted.
+                return func(cls, value, *args, **kwargs)
+
+            name = cls.__name__
+            error = None
+            state.active = True
+            start = perf_counter_ns()
+            try:
+                return func(cls, value, *args, **kwargs)
+            except Exception as err:
+                error = getattr(err, "type", type(err).__name__)
+                raise
+            finally:
+                elapsed = perf_counter_ns() - start
+                state.active = False
+                with self._lock:
+                    self.nanoseconds[name] += elapsed
+                    self.calls[name] += 1
+                    self.inputs[name][INPUT_TYPES.get(type(value), "other")] += 1
+                    if error is not None:
+                        self.failures[name][error] += 1
+
+        return classmethod(__eth_pydantic_validate__)
+
+    def _wrap_serialize(self, func: Callable) -> Callable:
+        name = func.__name__
+
+        @wraps(func)
+        def serialize(value, *args):
+            start = perf_counter_ns()
+            try:
+                return func(value, *args)
+            finally:
+                elapsed = perf_counter_ns() - start
+                with self._lock:
+                    self.serialize_nanoseconds[name] += elapsed
+                    self.serialize_calls[name] += 1
+
+        return serialize
+
+    def _wrap_coerce(self, func: Callable, kind: str) -> Callable:
+        @wraps(func)
+        def coerce(value, size):
+            # NOTE: Only called for values of the wrong size.
+            with self._lock:
+                self.coercions[kind] += 1
+
+            return func(value, size)
+
+        return coerce
+
+    def _wrap_decode_hex(self, func: Callable) -> Callable:
+        @wraps(func)
+        def decode_hex(value, hex_value):
+            if len(hex_value) % 2 != 0:
+                with self._lock:
+                    self.coercions["odd_length"] += 1
+
+            return func(value, hex_value)
+
+        return decode_hex
+
+
+def _iter_validated_classes() -> Iterator[type]:
+    # perf: keep module loading super fast by localizing these imports.
+    from eth_pydantic_types.address import AddressList
+    from eth_pydantic_types.array import HashBytesArray
+    from eth_pydantic_types.bip122 import Bip122Uri, StructuredBip122Uri
+    from eth_pydantic_types.hex import BaseHexStr, HexBytes
+    from eth_pydantic_types.integer import BaseInt
+
+    seen: set[type] = set()
+    stack: list[type] = [
+        AddressList,
+        BaseHexStr,
+        BaseInt,
+        Bip122Uri,
+        HashBytesArray,
+        HexBytes,
+        StructuredBip122Uri,
+    ]
+    while stack:
+        cls = stack.pop()
+        if cls not in seen:
+            seen.add(cls)
+            stack.extend(cls.__subclasses__())
+            yield cls
+
+
+def _clear_schemas():
+    # perf: keep module loading super fast by localizing this import.
+    import eth_pydantic_types.serializers as serializers
+
+    # NOTE: Cached schemas hold the functions they call, so they are rebuilt on next use.
+    for cls in _iter_validated_classes():
+        if "_core_schema" in cls.__dict__:
+            delattr(cls, "_core_schema")
+
+    serializers.__dict__.pop("hex_serializer", None)
+
+
+instrumentation = Instrumentation()
+"""
+The instrumentation of all the types. Disabled by default.
+"""
+
+
+__all__ = [
+    "Instrumentation",
+    "MetricCallback",
+    "instrumentation",
+]
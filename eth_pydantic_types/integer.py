@@ -0,0 +1,268 @@
+import re
+from threading import Lock
+from typing import TYPE_CHECKING, Any, ClassVar, Union
+
+from eth_pydantic_types._error import IntRangeError, IntValueError, SizeError
+from eth_pydantic_types._schema import get_core_schema, update_json_schema
+from eth_pydantic_types.batch import BUFFER_TYPES
+
+if TYPE_CHECKING:
+    from pydantic_core import CoreSchema
+
+    from eth_pydantic_types.hash import HashBytes
+
+MAX_INT_BITS = 256
+"""
+The largest size (in bits) supported by the ``UInt{n}`` and ``Int{n}`` types.
+"""
+
+JSON_FORMATS = ("hex", "decimal")
+"""
+The supported values of ``json_format``.
+"""
+
+# Hex (`0x`-prefixed) or decimal, optionally negative. Signs are checked by range.
+_INT_STR_PATTERN = re.compile(r"(-?)(?:0[xX]([0-9a-fA-F]+)|([0-9]+))")
+
+
+class BaseInt(int):
+    """
+    A fixed-size integer, such as a ``uint256`` balance or storage value.
+    This type is meant to be overridden by the sized integer types, e.g.
+    ``UInt256``, ``Int256`` or ``UInt160``; use :func:`int_type` to get one.
+
+    Validates from ``int``, hex (``0x``-prefixed) or decimal ``str``, and
+    big-endian bytes of up to ``size`` bytes. Bytes of exactly ``size`` bytes
+    are read as two's complement for signed types. Values out of range are
+    rejected, never wrapped.
+
+    Serializes to a hex string in JSON (e.g. ``"0x1f"``), or to a JSON number when
+    ``json_format`` is ``"decimal"``, e.g.::
+
+        class Balance(UInt256):
+            json_format = "decimal"
+    """
+
+    bits: ClassVar[int] = MAX_INT_BITS
+    size: ClassVar[int] = MAX_INT_BITS // 8
+    signed: ClassVar[bool] = False
+    min_value: ClassVar[int] = 0
+    max_value: ClassVar[int] = 2**MAX_INT_BITS - 1
+    json_format: ClassVar[str] = "hex"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, value, handler=None) -> "CoreSchema":
+        return get_core_schema(cls)
+
+    @classmethod
+    def __eth_pydantic_core_schema__(cls) -> "CoreSchema":
+        # perf: keep module loading super fast by localizing this import.
+        from pydantic_core.core_schema import (
+            no_info_plain_validator_function,
+            plain_serializer_function_ser_schema,
+            simple_ser_schema,
+        )
+
+        if cls.json_format not in JSON_FORMATS:
+            raise ValueError(
+                f"Unknown json_format '{cls.json_format}'. Expecting one of {JSON_FORMATS}."
+            )
+
+        def json_schema(_, json_handler):
+            return update_json_schema(cls, {})
+
+        return no_info_plain_validator_function(
+            cls.__eth_pydantic_validate__,
+            serialization=(
+                plain_serializer_function_ser_schema(function=hex, when_used="json")
+                if cls.json_format == "hex"
+                else simple_ser_schema("int")
+            ),
+            metadata={"pydantic_js_functions": [json_schema]},
+        )
+
+    @classmethod
+    def __eth_pydantic_json_schema_extra__(cls) -> dict[str, Any]:
+        if cls.json_format == "decimal":
+            return {"type": "integer", "minimum": cls.min_value, "maximum": cls.max_value}
+
+        sign = "-?" if cls.signed else ""
+        return {
+            "type": "string",
+            "pattern": f"^{sign}0x[0-9a-fA-F]{{1,{cls.bits // 4}}}$",
+            "examples": [hex(0), hex(cls.max_value)],
+        }
+
+    @classmethod
+    def __eth_pydantic_validate__(cls, value: Any) -> "BaseInt":
+        if type(value) is cls:
+            return value
+
+        elif isinstance(value, int) and not isinstance(value, bool):
+            number = int(value)
+
+        elif isinstance(value, str):
+            number = _parse_int_str(value)
+
+        elif isinstance(value, BUFFER_TYPES) or hasattr(type(value), "__bytes__"):
+            number = cls._from_buffer(value)
+
+        else:
+            raise IntValueError(value)
+
+        if not cls.min_value <= number <= cls.max_value:
+            raise IntRangeError(cls.min_value, cls.max_value, value)
+
+        return cls(number)
+
+    @classmethod
+    def _from_buffer(cls, value: Any) -> int:
+        view = memoryview(value if isinstance(value, BUFFER_TYPES) else bytes(value))
+        if view.nbytes > cls.size:
+            raise SizeError(cls.size, value)
+
+        # NOTE: Shorter values are zero-padded, so only full-size ones can be negative.
+        return int.from_bytes(view, "big", signed=cls.signed and view.nbytes == cls.size)
+
+    @classmethod
+    def from_hash_bytes(cls, value: bytes) -> "BaseInt":
+        """
+        Convert a ``HashBytes{n}`` (or any big-endian bytes of up to ``size`` bytes).
+        """
+        return cls.__eth_pydantic_validate__(value)
+
+    @classmethod
+    def from_address(cls, value: Union[str, bytes]) -> "BaseInt":
+        """
+        Convert an already-validated address, e.g. an ``Address`` or 20 bytes.
+        """
+        number = int(value, 16) if isinstance(value, str) else int.from_bytes(value, "big")
+        if number > cls.max_value:
+            raise IntRangeError(cls.min_value, cls.max_value, value)
+
+        return cls(number)
+
+    def to_hash_bytes(self) -> "HashBytes":
+        """
+        Convert to a ``HashBytes{size}``, e.g. ``HashBytes32`` for ``UInt256``.
+        Negative values use two's complement.
+        """
+        # perf: keep module loading super fast by localizing this import.
+        from eth_pydantic_types.hash import hash_type
+
+        data = int.to_bytes(self, self.size, "big", signed=self.signed)
+        return bytes.__new__(hash_type(self.size), data)
+
+    def to_address(self) -> str:
+        """
+        Convert to a checksummed address. The value must fit in 20 bytes.
+        """
+        # perf: keep module loading super fast by localizing this import.
+        from eth_pydantic_types.address import Address
+
+        if not 0 <= self < 1 << 160:
+            raise IntRangeError(0, (1 << 160) - 1, self)
+
+        return Address.to_checksum_address(int.to_bytes(self, 20, "big"))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({int(self)})"
+
+
+def _parse_int_str(value: str) -> int:
+    if (match := _INT_STR_PATTERN.fullmatch(value)) is None:
+        raise IntValueError(value)
+
+    sign, hex_digits, digits = match.groups()
+    number = int(hex_digits, 16) if hex_digits is not None else int(digits)
+    return -number if sign else number
+
+
+_int_types: dict[tuple[int, bool], type] = {}
+_int_types_lock = Lock()
+
+
+def int_type(bits: int, signed: bool = False) -> type[Any]:
+    """
+    Get the sized integer class for the given size, e.g. ``int_type(256)``
+    is ``UInt256`` and ``int_type(256, signed=True)`` is ``Int256``.
+    The same class is returned every time it is requested.
+
+    Args:
+        bits (int): The size in bits; a multiple of 8 up to 256.
+        signed (bool): Whether the integer is signed. Defaults to ``False``.
+
+    Returns:
+        type: The ``UInt{bits}`` or ``Int{bits}`` class.
+    """
+    if isinstance(bits, bool) or not isinstance(bits, int):
+        raise TypeError(f"Integer size must be an int, not '{type(bits).__name__}'.")
+
+    elif bits % 8 != 0 or not 8 <= bits <= MAX_INT_BITS:
+        raise ValueError(f"Integer size must be a multiple of 8 up to {MAX_INT_BITS}, got {bits}.")
+
+    key = (bits, bool(signed))
+    if (cls := _int_types.get(key)) is not None:
+        return cls
+
+    with _int_types_lock:
+        # NOTE: Check again, as another thread may have made the class while waiting.
+        if (cls := _int_types.get(key)) is None:
+            cls = _int_types[key] = _make_int_cls(bits, bool(signed))
+
+    return cls
+
+
+def _make_int_cls(bits: int, signed: bool):
+    min_value, max_value = (-(2 ** (bits - 1)), 2 ** (bits - 1) - 1) if signed else (0, 2**bits - 1)
+    return type(
+        f"{'Int' if signed else 'UInt'}{bits}",
+        (BaseInt,),
+        dict(
+            bits=bits,
+            signed=signed,
+            min_value=min_value,
+            max_value=max_value,
+            size=bits // 8,
+        ),
+    )
+
+
+def __getattr__(name: str):
+    if name.startswith("UInt"):
+        number = name.replace("UInt", "")
+        signed = False
+    elif name.startswith("Int"):
+        number = name.replace("Int", "")
+        signed = True
+    else:
+        raise AttributeError(name)
+
+    if not number.isnumeric() or int(number) % 8 != 0 or not 8 <= int(number) <= MAX_INT_BITS:
+        raise AttributeError(name)
+
+    cls = int_type(int(number), signed)
+
+    # Cache on the module so later lookups skip `__getattr__` entirely.
+    globals()[name] = cls
+    return cls
+
+
+__all__ = [
+    "MAX_INT_BITS",
+    "BaseInt",
+    "Int8",
+    "Int16",
+    "Int32",
+    "Int64",
+    "Int128",
+    "Int256",
+    "UInt8",
+    "UInt16",
+    "UInt32",
+    "UInt64",
+    "UInt128",
+    "UInt160",
+    "UInt256",
+    "int_type",
+]
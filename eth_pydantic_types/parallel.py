@@ -0,0 +1,176 @@
+from collections.abc import Iterable, Iterator
+from itertools import islice, repeat
+from typing import TYPE_CHECKING, Any, Optional, Union, get_origin
+
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.batch import BatchResult, _to_line_error, finish_many
+from eth_pydantic_types.hash import HashBytes, HashStr, _iter_chunks
+from eth_pydantic_types.stream import _get_adapter
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from pydantic import ValidationError
+
+DEFAULT_CHUNK_SIZE = 10_000
+"""
+The default number of items sent to a worker at a time.
+"""
+
+
+def parallel_validate(
+    target: Any,
+    items: Iterable,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    errors: str = "raise",
+    executor: Optional["Executor"] = None,
+) -> Union[list, BatchResult]:
+    """
+    Validate many items across a process pool.
+
+    For ``HashBytes{n}``, ``HashStr{n}`` and ``Address``, each worker uses the
+    type's ``validate_many()`` and sends back one packed ``bytes`` or ``str``
+    object per chunk, which the parent cheaply splits back into values. Any other
+    target (e.g. a pydantic model) is validated with a ``pydantic.TypeAdapter``.
+
+    **NOTE**: Starting and feeding processes has a fixed cost, so this only
+    pays off for large inputs; see the benchmarks for the crossover point.
+
+    Args:
+        target (Any): A hash type, ``Address``, or any type supported by
+          ``pydantic.TypeAdapter``. It must be importable by the workers.
+        items (Iterable): The items to validate.
+        workers (Optional[int]): The number of processes. Defaults to the
+          number of CPUs. Ignored when ``executor`` is given.
+        chunk_size (int): The number of items sent to a worker at a time.
+        errors (str): ``"raise"`` (default) or ``"report"``.
+          See :func:`~eth_pydantic_types.batch.validate_many`.
+        executor (Optional[Executor]): An existing pool to use, e.g. to avoid
+          paying the start-up cost on every call.
+
+    Returns:
+        Union[list, :class:`~eth_pydantic_types.batch.BatchResult`]
+    """
+    if errors not in ("raise", "report"):
+        raise ValueError(f"Unknown errors mode '{errors}'. Expecting 'raise' or 'report'.")
+
+    chunks = _iter_item_chunks(items, chunk_size)
+    if executor is None:
+        # perf: keep module loading super fast by localizing this import.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return _collect(target, pool.map(_validate_chunk, repeat(target), chunks), errors)
+
+    return _collect(target, executor.map(_validate_chunk, repeat(target), chunks), errors)
+
+
+def _iter_item_chunks(items: Iterable, chunk_size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _validate_chunk(target: Any, chunk: list) -> tuple[Any, int, dict, dict]:
+    # NOTE: Runs in the worker processes.
+    if _is_hash_type(target):
+        result = target.validate_many(chunk, errors="report")
+        valid = [value for value in result.values if value is not None]
+        packed: Any = b"".join(valid) if issubclass(target, bytes) else "".join(valid)
+    else:
+        result = _validate_items(target, chunk)
+        packed = [value for value in result.values if value is not None]
+
+    inputs = {index: chunk[index] for index in result.errors}
+    return packed, len(chunk), result.errors, inputs
+
+
+def _validate_items(target: Any, chunk: list) -> BatchResult:
+    # perf: keep module loading super fast by localizing this import.
+    from pydantic import ValidationError
+
+    # NOTE: Cached, so each worker builds the schema once rather than for every chunk.
+    adapter = _get_adapter(target)
+    values: list = []
+    failures: dict[int, Any] = {}
+    for index, item in enumerate(chunk):
+        try:
+            values.append(adapter.validate_python(item))
+        except ValidationError as err:
+            values.append(None)
+            failures[index] = _get_error_details(err)
+
+    return BatchResult(values, failures)
+
+
+def _get_error_details(err: "ValidationError") -> list:
+    # NOTE: `ValidationError` objects with custom error types cannot be unpickled,
+    #   so send the details instead, with a picklable context.
+    details = err.errors(include_url=False)
+    for detail in details:
+        if ctx := detail.get("ctx"):
+            detail["ctx"] = {
+                key: value if isinstance(value, (str, int, float, bool)) else str(value)
+                for key, value in ctx.items()
+            }
+
+    return details
+
+
+def _rebuild_error(target: Any, details: list) -> ValueError:
+    # perf: keep module loading super fast by localizing this import.
+    from pydantic_core import ValidationError
+
+    line_errors = [_to_line_error(detail, detail["loc"]) for detail in details]
+    return ValidationError.from_exception_data(
+        getattr(target, "__name__", str(target)), line_errors
+    )
+
+
+def _collect(target: Any, results: Iterable, errors: str) -> Union[list, BatchResult]:
+    values: list = []
+    failures: dict[int, ValueError] = {}
+    inputs: dict[int, Any] = {}
+    for packed, count, chunk_errors, chunk_inputs in results:
+        offset = len(values)
+        valid = iter(_unpack(target, packed) if _is_hash_type(target) else packed)
+        values.extend(None if idx in chunk_errors else next(valid) for idx in range(count))
+        for idx, err in chunk_errors.items():
+            # NOTE: Model errors come back as error details; see `_validate_items()`.
+            failures[offset + idx] = (
+                err if isinstance(err, ValueError) else _rebuild_error(target, err)
+            )
+
+        inputs.update({offset + idx: value for idx, value in chunk_inputs.items()})
+
+    title = f"list[{getattr(target, '__name__', target)}]"
+    return finish_many(values, failures, errors, title, inputs)
+
+
+def _unpack(target: Any, packed: Union[bytes, str]) -> list:
+    if isinstance(packed, bytes):
+        # NOTE: Buffers are split without re-validating.
+        return target.validate_many(packed)
+
+    # NOTE: Every validated str has the same width, e.g. 42 for addresses.
+    values = list(_iter_chunks(packed, target.size * 2 + 2))
+    if issubclass(target, Address):
+        # Already checksummed.
+        return values
+
+    return target._from_canonical_many(values)
+
+
+def _is_hash_type(target: Any) -> bool:
+    # NOTE: Generic aliases, e.g. `list[int]`, pass `isinstance(..., type)` on Python < 3.11.
+    return (
+        get_origin(target) is None
+        and isinstance(target, type)
+        and issubclass(target, (HashBytes, HashStr))
+    )
+
+
+__all__ = [
+    "parallel_validate",
+]
@@ -1,4 +1,31 @@
-from pydantic_core.core_schema import plain_serializer_function_ser_schema
+from binascii import b2a_base64
+from typing import TYPE_CHECKING, Any, Optional, cast, get_origin
+
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
+    from pydantic_core import CoreSchema
+    from pydantic_core.core_schema import PlainSerializerFunctionSerSchema
+
+HEX_FORMATS = ("hex", "bytes", "base64")
+"""
+The supported values of the ``hex_format`` serialization (and validation) context key.
+"""
+
+
+def get_hex_format(info: Any) -> str:
+    """
+    Get the ``hex_format`` from the serialization or validation context, e.g.
+    ``model.model_dump(context={"hex_format": "base64"})``. Defaults to ``"hex"``.
+    """
+    context = getattr(info, "context", None)
+    if not isinstance(context, dict):
+        return "hex"
+
+    hex_format = context.get("hex_format", "hex")
+    if hex_format not in HEX_FORMATS:
+        raise ValueError(f"Unknown hex_format '{hex_format}'. Expecting one of {HEX_FORMATS}.")
+
+    return hex_format
 
 
 def serialize_hex(value: bytes):
@@ -6,4 +33,114 @@ def serialize_hex(value: bytes):
     return hex_value if hex_value.startswith("0x") else f"0x{hex_value}"
 
 
-hex_serializer = plain_serializer_function_ser_schema(function=serialize_hex)
+def serialize_compact_hex(value: bytes, info: Any):
+    """
+    Serialize a hex-bytes value per the ``hex_format`` serialization context.
+    Used by fields annotated with :class:`CompactHex`.
+    """
+    # NOTE: `SerializationInfo.context` is only available from pydantic 2.7.
+    if hex_format := _get_compact_format(info):
+        return serialize_compact(bytes(value), hex_format)
+
+    return serialize_hex(value)
+
+
+def serialize_compact_hex_str(value: str, info: Any):
+    """
+    Serialize a hex-str value per the ``hex_format`` serialization context.
+    Used by fields annotated with :class:`CompactHex`.
+    """
+    if hex_format := _get_compact_format(info):
+        return serialize_compact(bytes.fromhex(value[2:]), hex_format)
+
+    return value
+
+
+def serialize_compact(data: bytes, hex_format: str):
+    """
+    Serialize to raw bytes (``"bytes"``), e.g. for msgpack or CBOR,
+    or to a base64 string (``"base64"``).
+    """
+    if hex_format == "bytes":
+        return data
+
+    return b2a_base64(data, newline=False).decode("ascii")
+
+
+def _get_compact_format(info: Any) -> Optional[str]:
+    # The `hex_format` to serialize to, or `None` for hex.
+    hex_format = get_hex_format(info)
+    if hex_format == "hex":
+        return None
+
+    elif hex_format == "bytes" and getattr(info, "mode", None) == "json":
+        raise ValueError("hex_format 'bytes' cannot be serialized to JSON. Use 'base64' instead.")
+
+    return hex_format
+
+
+def get_hex_serializer() -> "PlainSerializerFunctionSerSchema":
+    # perf: keep module loading super fast by localizing this import.
+    from pydantic_core.core_schema import plain_serializer_function_ser_schema
+
+    return plain_serializer_function_ser_schema(function=serialize_hex)
+
+
+class CompactHex:
+    """
+    Annotate a hex type (e.g. ``HexBytes``, ``HashBytes{n}``, ``HashStr{n}`` or
+    ``Address``) with this marker to serialize it per the ``hex_format``
+    serialization context: ``"hex"`` (default), ``"bytes"`` or ``"base64"``.
+    Other fields skip the context lookup entirely.
+
+    Usage example::
+
+        from typing import Annotated
+        from pydantic import BaseModel
+        from eth_pydantic_types import CompactHex, HashBytes32
+
+        class Log(BaseModel):
+            topic: Annotated[HashBytes32, CompactHex]
+
+        Log(topic=1).model_dump(context={"hex_format": "bytes"})
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: "GetCoreSchemaHandler"
+    ) -> "CoreSchema":
+        # perf: keep module loading super fast by localizing these imports.
+        from pydantic_core.core_schema import plain_serializer_function_ser_schema
+
+        from eth_pydantic_types.hex import BaseHexStr, HexBytes
+
+        if (
+            get_origin(source) is not None
+            or not isinstance(source, type)
+            or not issubclass(source, (BaseHexStr, HexBytes))
+        ):
+            raise TypeError(f"'{source}' does not support {cls.__name__} serialization.")
+
+        function = (
+            serialize_compact_hex if issubclass(source, HexBytes) else serialize_compact_hex_str
+        )
+        # NOTE: Copied, as the schemas of the types themselves are cached.
+        schema = {
+            **handler(source),
+            "serialization": plain_serializer_function_ser_schema(function, info_arg=True),
+        }
+        return cast("CoreSchema", schema)
+
+
+def __getattr__(name: str):
+    if name == "hex_serializer":
+        # Lazy define for performance reasons.
+        globals()[name] = serializer = get_hex_serializer()
+        return serializer
+
+    raise AttributeError(name)
+
+
+__all__ = [
+    "CompactHex",
+]
@@ -0,0 +1,239 @@
+import os
+from collections import deque
+from collections.abc import Iterator
+from functools import lru_cache
+from pathlib import Path
+from time import perf_counter
+from typing import IO, TYPE_CHECKING, Any, NamedTuple, Optional, Union
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from pydantic import TypeAdapter
+    from pydantic_core import ErrorDetails
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+"""
+The default number of bytes read from the source at a time.
+"""
+
+DEFAULT_BATCH_SIZE = 1000
+"""
+The default number of lines validated per task when using an executor.
+"""
+
+DEFAULT_MAX_PENDING = 2 * (os.cpu_count() or 1)
+"""
+The default number of batches submitted to the executor at a time,
+i.e. two per worker of a default-sized pool.
+"""
+
+
+class ErrorRecord(NamedTuple):
+    """
+    A line that failed validation.
+    """
+
+    line_number: int
+    """
+    The 1-based line number in the source.
+    """
+
+    line: bytes
+    """
+    The raw line.
+    """
+
+    errors: list["ErrorDetails"]
+    """
+    The pydantic errors, as from ``ValidationError.errors()``.
+    """
+
+
+class StreamStats:
+    """
+    Throughput statistics, updated while a stream is consumed.
+    """
+
+    def __init__(self):
+        self.lines = 0
+        self.valid = 0
+        self.invalid = 0
+        self.bytes_read = 0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} lines={self.lines} valid={self.valid} "
+            f"invalid={self.invalid} lines_per_second={self.lines_per_second:.0f}>"
+        )
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+
+        return (self.finished or perf_counter()) - self.started
+
+    @property
+    def lines_per_second(self) -> float:
+        return self.lines / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_read / self.elapsed if self.elapsed else 0.0
+
+
+def validate_jsonl(
+    source: Union[str, Path, IO[bytes]],
+    model: Any,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional["Executor"] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    stats: Optional[StreamStats] = None,
+    max_pending: int = DEFAULT_MAX_PENDING,
+) -> Iterator[Any]:
+    """
+    Validate a JSON-lines file or binary stream one line at a time, in constant memory.
+    Blank lines are skipped.
+
+    Usage example::
+
+        from eth_pydantic_types.stream import StreamStats, validate_jsonl
+
+        stats = StreamStats()
+        for log in validate_jsonl("logs.jsonl", Log, stats=stats):
+            ...
+
+    Args:
+        source (Union[str, Path, IO[bytes]]): A path or a binary stream.
+        model (Any): The pydantic model (or any type supported by
+          ``pydantic.TypeAdapter``) to validate each line as.
+        chunk_size (int): The number of bytes to read at a time.
+        executor (Optional[Executor]): An optional thread or process pool to
+          validate batches of lines in. Results are still yielded in order.
+          When using a process pool, the model must be importable by the workers.
+        batch_size (int): The number of lines per task when using an executor.
+        stats (Optional[:class:`~eth_pydantic_types.stream.StreamStats`]): Statistics
+          to update while the stream is consumed.
+        max_pending (int): The number of batches in flight at a time when using
+          an executor, bounding memory. Defaults to twice the number of CPUs;
+          about twice the executor's workers is best.
+
+    Returns:
+        Iterator: The validated values, or an
+        :class:`~eth_pydantic_types.stream.ErrorRecord` for every invalid line.
+    """
+    stats = stats if stats is not None else StreamStats()
+    stats.started = perf_counter()
+    stats.finished = None
+    lines = _iter_lines(source, chunk_size, stats)
+    results = (
+        _validate_lines(model, lines)
+        if executor is None
+        else _validate_lines_in_executor(model, lines, executor, batch_size, max(1, max_pending))
+    )
+    for result in results:
+        stats.lines += 1
+        if isinstance(result, ErrorRecord):
+            stats.invalid += 1
+        else:
+            stats.valid += 1
+
+        yield result
+
+    stats.finished = perf_counter()
+
+
+def _iter_lines(
+    source: Union[str, Path, IO[bytes]], chunk_size: int, stats: StreamStats
+) -> Iterator[tuple[int, bytes]]:
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as file:
+            yield from _iter_lines(file, chunk_size, stats)
+
+        return
+
+    line_number = 0
+    # The pieces of the current line, joined once it ends, so that lines
+    # spanning many chunks are not copied again on every read.
+    pieces: list[bytes] = []
+    while chunk := source.read(chunk_size):
+        stats.bytes_read += len(chunk)
+        *lines, last = chunk.split(b"\n")
+        if lines and pieces:
+            pieces.append(lines[0])
+            lines[0] = b"".join(pieces)
+            pieces = []
+
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield line_number, line
+
+        if last:
+            pieces.append(last)
+
+    if (remainder := b"".join(pieces)).strip():
+        yield line_number + 1, remainder
+
+
+def _validate_lines(model: Any, lines) -> Iterator[Any]:
+    # perf: keep module loading super fast by localizing this import.
+    from pydantic import ValidationError
+
+    adapter = _get_adapter(model)
+    for line_number, line in lines:
+        try:
+            yield adapter.validate_json(line)
+        except ValidationError as err:
+            yield ErrorRecord(line_number, line, err.errors(include_url=False))
+
+
+def _validate_batch(model: Any, batch: list[tuple[int, bytes]]) -> list[Any]:
+    return list(_validate_lines(model, batch))
+
+
+def _validate_lines_in_executor(
+    model: Any, lines, executor: "Executor", batch_size: int, max_pending: int
+) -> Iterator[Any]:
+    # NOTE: Bound the number of pending batches to keep memory constant.
+    pending: deque = deque()
+    batch: list[tuple[int, bytes]] = []
+    try:
+        for line in lines:
+            batch.append(line)
+            if len(batch) < batch_size:
+                continue
+
+            pending.append(executor.submit(_validate_batch, model, batch))
+            batch = []
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+
+        if batch:
+            pending.append(executor.submit(_validate_batch, model, batch))
+
+        while pending:
+            yield from pending.popleft().result()
+
+    finally:
+        # e.g. closed early: drop the batches not started yet.
+        for future in pending:
+            future.cancel()
+
+
+@lru_cache(maxsize=32)
+def _get_adapter(model: Any) -> "TypeAdapter":
+    # perf: keep module loading super fast by localizing this import.
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(model)
+
+
+__all__ = [
+    "ErrorRecord",
+    "StreamStats",
+    "validate_jsonl",
+]
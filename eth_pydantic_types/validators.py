@@ -18,7 +18,13 @@ def validate_size(value: "__SIZED_T", size: int, coerce: Optional[Callable] = No
 
 
 def validate_bytes_size(value: bytes, size: int) -> bytes:
-    return validate_size(value, size, coerce=lambda v: _coerce_hexbytes_size(v, size))
+    if len(value) == size:
+        return value
+
+    elif len(coerced := _coerce_hexbytes_size(value, size)) == size:
+        return coerced
+
+    raise SizeError(size, coerced)
 
 
 def validate_address_size(value: str) -> str:
@@ -26,7 +32,13 @@ def validate_address_size(value: str) -> str:
 
 
 def validate_str_size(value: str, size: int) -> str:
-    return validate_size(value, size, coerce=lambda v: _coerce_hexstr_size(v, size))
+    if len(value) == size:
+        return value
+
+    elif len(coerced := _coerce_hexstr_size(value, size)) == size:
+        return coerced
+
+    raise SizeError(size, coerced)
 
 
 def _coerce_hexstr_size(val: str, length: int) -> str:
@@ -13,6 +13,8 @@ extras_require = {
         "hypothesis>=6.2.0,<7.0",  # Strategy-based fuzzer
         "hypothesis-jsonschema==0.19.0",  # JSON Schema fuzzer extension
         "eth-hash[pycryptodome]",  # For backends to work
+        "numpy",  # For testing the vectorized array operations
+        "pyarrow",  # For testing the Arrow export
     ],
     "lint": [
         "black>=24.10.0,<25",  # Auto-formatter and linter
@@ -89,7 +91,7 @@ setup(
     license="Apache-2.0",
     zip_safe=False,
     keywords="ethereum",
-    packages=find_packages(exclude=["tests", "tests.*"]),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*", "tests", "tests.*"]),
     package_data={"eth_pydantic_types": ["py.typed"]},
     classifiers=[
         "Development Status :: 5 - Production/Stable",
@@ -0,0 +1,114 @@
+import pytest
+from pydantic_core import PydanticCustomError
+
+from eth_pydantic_types.abi import WORD_SIZE, WordView, unpack_words
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.hash import HashBytes20, HashBytes32, HashView
+
+ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+ADDRESS_WORD = bytes(12) + bytes.fromhex(ADDRESS[2:])
+
+
+def word(value: int) -> bytes:
+    return value.to_bytes(WORD_SIZE, "big", signed=value < 0)
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        ADDRESS_WORD,
+        HashBytes32(ADDRESS_WORD),
+        bytearray(ADDRESS_WORD),
+        memoryview(ADDRESS_WORD),
+        HashView(ADDRESS_WORD),
+        f"0x{ADDRESS_WORD.hex()}",
+    ),
+)
+def test_address_from_word(value):
+    assert Address.from_word(value) == ADDRESS
+
+
+def test_address_from_word_offset():
+    data = bytes(32) + ADDRESS_WORD
+    assert Address.from_word(data, offset=32) == ADDRESS
+    with pytest.raises(PydanticCustomError):
+        Address.from_word(data, offset=33)
+
+
+@pytest.mark.parametrize("value", (b"\x01" + ADDRESS_WORD[1:], ADDRESS_WORD[1:]))
+def test_address_from_word_invalid(value):
+    with pytest.raises(PydanticCustomError):
+        Address.from_word(value)
+
+
+def test_hash_bytes_to_uint():
+    value = HashBytes32(word(2**200))
+    assert value.to_uint() == 2**200
+    assert value.to_uint(bits=208) == 2**200
+    assert HashBytes20(b"\x01" * 20).to_uint() == int("01" * 20, 16)
+    with pytest.raises(PydanticCustomError):
+        value.to_uint(bits=8)
+
+
+def test_hash_bytes_to_int():
+    assert HashBytes32(word(-3)).to_int() == -3
+    assert HashBytes32(word(-3)).to_int(bits=8) == -3
+    assert HashBytes32(word(127)).to_int(bits=8) == 127
+    with pytest.raises(PydanticCustomError):
+        HashBytes32(word(128)).to_int(bits=8)
+
+
+def test_hash_bytes_to_bool():
+    assert HashBytes32(word(1)).to_bool() is True
+    assert HashBytes32(word(0)).to_bool() is False
+    assert HashView(word(1)).to_bool() is True
+    with pytest.raises(PydanticCustomError):
+        HashBytes32(word(2)).to_bool()
+
+
+def test_unpack_words():
+    data = ADDRESS_WORD + word(5) + word(1) + word(-3) + b"ab" + bytes(30)
+    words = unpack_words(data)
+    assert isinstance(words, WordView)
+    assert len(words) == 5
+    assert words.to_address(0) == ADDRESS
+    assert words.to_uint(1) == 5
+    assert words.to_bool(2) is True
+    assert words.to_int(-2) == -3
+    assert words[1] == word(5)
+    assert words[1:3] == [word(5), word(1)]
+    assert words.to_hash_bytes(1) == word(5)
+    assert words.unpack(("address", "uint8", "bool", "int16", "bytes2")) == (
+        ADDRESS,
+        5,
+        True,
+        -3,
+        b"ab",
+    )
+    assert words.unpack(("uint", "bool"), start=1) == (5, True)
+
+
+def test_unpack_words_bulk():
+    words = unpack_words(ADDRESS_WORD * 3)
+    assert words.to_addresses() == [ADDRESS] * 3
+    assert words.to_uints(bits=160) == [int(ADDRESS, 16)] * 3
+    with pytest.raises(PydanticCustomError):
+        words.to_uints(bits=8)
+
+
+def test_unpack_words_invalid():
+    with pytest.raises(PydanticCustomError):
+        unpack_words(bytes(33))
+
+    words = unpack_words(word(2) + b"ab\x01" + bytes(29))
+    with pytest.raises(IndexError):
+        words.to_uint(2)
+
+    with pytest.raises(IndexError):
+        words.unpack(("uint256",) * 3)
+
+    with pytest.raises(ValueError, match="Unsupported ABI type"):
+        words.unpack(("string",))
+
+    with pytest.raises(PydanticCustomError):
+        words.unpack(("uint256", "bytes2"))
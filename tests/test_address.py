@@ -1,7 +1,9 @@
 import pytest
 from pydantic import BaseModel, ValidationError
 
-from eth_pydantic_types.address import Address, AddressType
+from eth_pydantic_types.address import Address, AddressList, AddressType, ChecksumCache
+from eth_pydantic_types.cache import InternPool
+from eth_pydantic_types.hash import HashBytes20
 from eth_pydantic_types.hex import HexBytes
 
 # NOTE: This address purposely is the wrong length (missing left zero),
@@ -63,3 +65,119 @@ def test_model_dump():
     actual = model.model_dump()
     expected = {"address": CHECKSUM_ADDRESS, "address_type": CHECKSUM_ADDRESS}
     assert actual == expected
+
+
+@pytest.fixture
+def checksum_cache(monkeypatch):
+    cache = ChecksumCache(maxsize=2)
+    monkeypatch.setattr(Address, "checksum_cache", cache)
+    return cache
+
+
+def test_checksum_cache(checksum_cache):
+    for _ in range(3):
+        Model(address=ADDRESS, address_type=CHECKSUM_ADDRESS.lower())
+
+    info = checksum_cache.info()
+    assert info.misses == 1
+    assert info.hits == 5
+    assert info.currsize == 1
+    assert Address.to_checksum_address(HexBytes(CHECKSUM_ADDRESS)) == CHECKSUM_ADDRESS
+    assert checksum_cache.info().hits == 6
+
+
+def test_checksum_cache_evicts(checksum_cache):
+    for value in range(1, 4):
+        Address.to_checksum_address(f"0x{value:040x}")
+
+    info = checksum_cache.info()
+    assert info.evictions == 1
+    assert info.currsize == info.maxsize == 2
+
+    checksum_cache.resize(1)
+    assert checksum_cache.info().evictions == 2
+
+    checksum_cache.clear()
+    assert checksum_cache.info() == (0, 0, 0, 1, 0)
+
+
+def test_checksum_cache_disabled(checksum_cache):
+    checksum_cache.resize(0)
+    assert not checksum_cache.enabled
+    assert Address.to_checksum_address(ADDRESS.rjust(40, "0")) == CHECKSUM_ADDRESS
+    assert checksum_cache.info() == (0, 0, 0, 0, 0)
+
+
+def test_checksum_cache_does_not_store_invalid(checksum_cache):
+    with pytest.raises(ValueError):
+        Address.to_checksum_address("0x" + "Z" * 40)
+
+    assert checksum_cache.info().currsize == 0
+
+
+def test_intern_pool(checksum_cache, monkeypatch):
+    monkeypatch.setattr(Address, "intern_pool", InternPool(maxsize=10))
+    checksum_cache.resize(0)
+    first = Model(address=ADDRESS, address_type=ADDRESS)
+    second = Model(address=ADDRESS.upper().replace("0X", "0x"), address_type=CHECKSUM_ADDRESS)
+    assert first.address is second.address is first.address_type
+    assert Address.validate_many([ADDRESS])[0] is first.address
+    assert Address.intern_pool.info().hits == 4
+
+
+def test_to_checksum_addresses():
+    raw = bytes.fromhex(CHECKSUM_ADDRESS[2:])
+    expected = [CHECKSUM_ADDRESS, "0x0000000000000000000000000000000000000000"]
+    packed = raw + bytes(20)
+    assert Address.to_checksum_addresses(packed) == expected
+    assert Address.to_checksum_addresses(memoryview(packed)) == expected
+    assert Address.to_checksum_addresses([HashBytes20(raw), CHECKSUM_ADDRESS.lower()]) == [
+        CHECKSUM_ADDRESS,
+        CHECKSUM_ADDRESS,
+    ]
+    with pytest.raises(ValueError):
+        Address.to_checksum_addresses(packed[:-1])
+
+
+def test_to_checksum_addresses_out():
+    packed = bytes.fromhex(CHECKSUM_ADDRESS[2:]) * 2
+    out = [None] * 3
+    assert Address.to_checksum_addresses(packed, out=out) is out
+    assert out == [CHECKSUM_ADDRESS, CHECKSUM_ADDRESS, None]
+
+    buffer = bytearray(84)
+    assert Address.to_checksum_addresses(packed, out=buffer) is buffer
+    assert buffer.decode() == CHECKSUM_ADDRESS * 2
+    with pytest.raises(ValueError):
+        Address.to_checksum_addresses(packed, out=bytearray(83))
+
+    with pytest.raises(ValueError):
+        Address.to_checksum_addresses(packed, out=[None])
+
+
+class ListModel(BaseModel):
+    addresses: AddressList
+
+
+def test_address_list():
+    packed = bytes.fromhex(CHECKSUM_ADDRESS[2:]) * 2
+    model = ListModel(addresses=packed)
+    assert model.addresses == [CHECKSUM_ADDRESS, CHECKSUM_ADDRESS]
+    assert ListModel(addresses=[ADDRESS, int(ADDRESS, 16)]) == model
+    assert model.model_dump_json() == f'{{"addresses":["{CHECKSUM_ADDRESS}","{CHECKSUM_ADDRESS}"]}}'
+
+    # Values set without validation are checksummed when serializing.
+    constructed = ListModel.model_construct(addresses=AddressList([HashBytes20(packed[:20])]))
+    assert constructed.model_dump() == {"addresses": [CHECKSUM_ADDRESS]}
+
+
+@pytest.mark.parametrize("value", (CHECKSUM_ADDRESS, 1, ["0xzz"]))
+def test_address_list_invalid(value):
+    with pytest.raises(ValidationError):
+        ListModel(addresses=value)
+
+
+def test_address_list_schema():
+    schema = ListModel.model_json_schema()["properties"]["addresses"]
+    assert schema["type"] == "array"
+    assert schema["items"]["pattern"] == Address.schema_pattern
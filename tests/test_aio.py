@@ -0,0 +1,112 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Event
+from typing import Annotated
+
+import pytest
+from pydantic import BaseModel, StringConstraints, ValidationError
+
+from eth_pydantic_types import Address, HashBytes32, avalidate
+
+CHECKSUM_ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+
+
+class Log(BaseModel):
+    address: Address
+    topic: HashBytes32
+
+
+def _logs(count: int) -> list[dict]:
+    return [{"address": CHECKSUM_ADDRESS.lower(), "topic": idx} for idx in range(count)]
+
+
+def test_avalidate_inline():
+    payload = _logs(3)
+    expected = [Log.model_validate(item) for item in payload]
+    assert asyncio.run(avalidate(list[Log], payload)) == expected
+    assert asyncio.run(avalidate(Log, payload[0])) == expected[0]
+
+
+@pytest.mark.parametrize("executor_cls", (ThreadPoolExecutor, ProcessPoolExecutor))
+def test_avalidate_chunks(executor_cls):
+    payload = _logs(25)
+    with executor_cls(2) as executor:
+        actual = asyncio.run(
+            avalidate(
+                list[Log], payload, executor=executor, inline_items=0, chunk_size=4, max_pending=2
+            )
+        )
+
+    assert actual == [Log.model_validate(item) for item in payload]
+
+
+def test_avalidate_json():
+    payload = f'[{{"address": "{CHECKSUM_ADDRESS}", "topic": "0x{"00" * 32}"}}]'
+    actual = asyncio.run(avalidate(list[Log], payload, inline_bytes=0))
+    assert actual[0].address == CHECKSUM_ADDRESS
+
+    with pytest.raises(ValidationError):
+        asyncio.run(avalidate(list[Log], payload.replace("0x00", "0xzz"), inline_bytes=0))
+
+
+def test_avalidate_errors():
+    payload = _logs(10)
+    payload[1]["address"] = "foo"
+    payload[7]["topic"] = "bar"
+    with pytest.raises(ValidationError) as err:
+        asyncio.run(avalidate(list[Log], payload, inline_items=0, chunk_size=3))
+
+    assert [e["loc"] for e in err.value.errors()] == [(1, "address"), (7, "topic")]
+
+
+def test_avalidate_cancel():
+    started = Event()
+    release = Event()
+    calls = []
+
+    class Blocking(BaseModel):
+        value: int
+
+        def model_post_init(self, __context):
+            calls.append(self.value)
+            started.set()
+            release.wait(5)
+
+    async def run(executor):
+        task = asyncio.ensure_future(
+            avalidate(
+                list[Blocking],
+                [{"value": idx} for idx in range(10)],
+                executor=executor,
+                inline_items=0,
+                chunk_size=1,
+                max_pending=2,
+            )
+        )
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        release.set()
+
+    with ThreadPoolExecutor(1) as executor:
+        asyncio.run(run(executor))
+
+    # Only the running chunk ran; the pending one was cancelled, and no more were submitted.
+    assert calls == [0]
+
+
+def test_avalidate_error_details():
+    pattern = "^0x[a-f]{40}$"
+    target = list[Annotated[str, StringConstraints(pattern=pattern)]]
+    with ThreadPoolExecutor(2) as executor:
+        with pytest.raises(ValidationError) as err:
+            asyncio.run(avalidate(target, ["0x01"], executor=executor, inline_items=0))
+
+    detail = err.value.errors()[0]
+    assert detail["type"] == "string_pattern_mismatch"
+    assert detail["ctx"] == {"pattern": pattern}
+    assert detail["msg"] == f"String should match pattern '{pattern}'"
@@ -0,0 +1,109 @@
+import pytest
+from pydantic import BaseModel, ValidationError
+
+import eth_pydantic_types.array as array_module
+from eth_pydantic_types import Address, AddressArray, HashBytes32, HashBytesArray
+
+CHECKSUM_ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+
+
+class Model(BaseModel):
+    addresses: AddressArray
+    hashes: HashBytesArray[32]
+
+
+@pytest.fixture(params=("numpy", "python"), autouse=True)
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(array_module, "_get_numpy", lambda: None)
+
+    return request.param
+
+
+def test_class_getitem():
+    assert HashBytesArray[32] is HashBytesArray[32]
+    assert HashBytesArray[32].item_type is HashBytes32
+    with pytest.raises(TypeError):
+        AddressArray[20]
+
+
+def test_class_getitem_is_memoized_across_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import Barrier
+
+    barrier = Barrier(8)
+
+    def get_cls(_):
+        barrier.wait()
+        return HashBytesArray[61]
+
+    with ThreadPoolExecutor(8) as executor:
+        classes = set(executor.map(get_cls, range(8)))
+
+    assert len(classes) == 1
+
+
+def test_getitem():
+    array = AddressArray([CHECKSUM_ADDRESS.lower(), 1])
+    assert len(array) == 2
+    assert array[0] == CHECKSUM_ADDRESS
+    assert isinstance(array[-1], Address)
+    assert list(array[1:]) == [Address.to_checksum_address(f"0x{1:040x}")]
+    with pytest.raises(IndexError):
+        array[2]
+
+
+def test_buffer():
+    buffer = b"\x01" * 64
+    array = HashBytesArray[32](buffer)
+    assert array.tobytes() == buffer
+    assert array == HashBytesArray[32].frombuffer(buffer)
+    assert all(isinstance(item, HashBytes32) for item in array)
+    with pytest.raises(ValueError):
+        HashBytesArray[32](b"\x01" * 33)
+
+
+def test_equals_and_membership():
+    array = HashBytesArray[32]([1, 2, 1, 3])
+    assert list(array.equals(1)) == [True, False, True, False]
+    assert list(array.isin([2, 3])) == [False, True, False, True]
+    assert 3 in array
+    assert 4 not in array
+    assert "foo" not in array
+    assert array.index(2) == 1
+
+
+def test_membership_is_aligned():
+    # The needle only appears across the boundary of two items.
+    array = HashBytesArray[2]([b"\x00\x01", b"\x02\x00"])
+    assert b"\x01\x02" not in array
+
+
+def test_sort_and_unique():
+    array = HashBytesArray[32]([3, 1, 2, 1])
+    assert array.unique() == HashBytesArray[32]([1, 2, 3])
+    array.sort()
+    assert array == HashBytesArray[32]([1, 1, 2, 3])
+
+
+def test_model():
+    model = Model(addresses=[CHECKSUM_ADDRESS.lower()], hashes=[5])
+    assert isinstance(model.addresses, AddressArray)
+    assert model.model_dump() == {
+        "addresses": [CHECKSUM_ADDRESS],
+        "hashes": [f"0x{5:064x}"],
+    }
+    assert Model.model_validate_json(model.model_dump_json()) == model
+
+
+def test_model_invalid():
+    with pytest.raises(ValidationError):
+        Model(addresses=["foo"], hashes=[])
+
+
+def test_schema():
+    prop = Model.model_json_schema()["properties"]["addresses"]
+    assert prop["type"] == "array"
+    assert prop["items"]["pattern"] == "^0x[a-fA-F0-9]{40}$"
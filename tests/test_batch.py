@@ -0,0 +1,120 @@
+from typing import Annotated, Any
+
+import pytest
+from pydantic import BaseModel, StringConstraints, TypeAdapter, ValidationError
+
+from eth_pydantic_types import Address, BatchValidate, HashBytes20, HashBytes32, HashStr32
+from eth_pydantic_types.batch import validate_many
+from eth_pydantic_types.hex import HexBytes
+
+CHECKSUM_ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+VALUES = (
+    CHECKSUM_ADDRESS,
+    CHECKSUM_ADDRESS.lower(),
+    "837207e343277cbd6c114a45ec0e9ec56a1ad84",
+    int(CHECKSUM_ADDRESS, 16),
+    HexBytes(CHECKSUM_ADDRESS),
+)
+
+
+def validate_each(cls: type[Any], values) -> list:
+    # Validates like a `list[cls]` field, one value at a time.
+    adapter = TypeAdapter(cls)
+    return [adapter.validate_python(value) for value in values]
+
+
+class Model(BaseModel):
+    addresses: Annotated[list[Address], BatchValidate]
+    hashes: Annotated[list[HashBytes32], BatchValidate]
+
+
+@pytest.mark.parametrize("cls", (Address, HashBytes20, HashStr32, HashBytes32))
+def test_validate_many_matches_type_adapter(cls):
+    expected = validate_each(cls, VALUES)
+    assert cls.validate_many(VALUES) == expected
+    assert cls.validate_many(iter(VALUES)) == expected
+
+
+@pytest.mark.parametrize("cls", (Address, HashBytes20, HashStr32))
+def test_validate_many_buffer(cls):
+    buffer = b"".join(i.to_bytes(cls.size, "big") for i in range(1, 4))
+    expected = validate_each(cls, [1, 2, 3])
+    assert cls.validate_many(buffer) == expected
+    assert cls.validate_many(memoryview(buffer)) == expected
+
+
+def test_validate_many_buffer_wrong_size():
+    with pytest.raises(ValueError):
+        Address.validate_many(b"\x00" * 30)
+
+
+def test_validate_many_raises():
+    with pytest.raises(ValidationError) as err:
+        Address.validate_many([CHECKSUM_ADDRESS, "foo", -35])
+
+    assert [e["loc"] for e in err.value.errors()] == [(1,), (2,)]
+
+
+def test_validate_many_report():
+    result = Address.validate_many([CHECKSUM_ADDRESS, "foo"], errors="report")
+    assert not result.ok
+    assert result.values == [CHECKSUM_ADDRESS, None]
+    assert list(result.errors) == [1]
+
+
+@pytest.mark.parametrize("cls", (Address, HashBytes32))
+def test_validate_many_codes(cls):
+    result = cls.validate_many(["foo", 1, 2**300, "0xzz"], errors="codes")
+    assert result.values[0] is None and result.values[1] is not None
+    assert result.errors == {0: "HexValueError", 2: "SizeError", 3: "HexValueError"}
+    assert not result.truncated
+
+
+@pytest.mark.parametrize("errors", ("report", "codes"))
+def test_validate_many_max_errors(errors):
+    result = Address.validate_many([CHECKSUM_ADDRESS, "foo", "bar", 1], errors=errors, max_errors=2)
+    assert result.truncated
+    assert result.values == [CHECKSUM_ADDRESS, None, None]
+    assert list(result.errors) == [1, 2]
+
+
+def test_validate_many_fail_fast():
+    with pytest.raises(ValidationError) as err:
+        Address.validate_many(["foo", "bar"], max_errors=1)
+
+    assert [e["loc"] for e in err.value.errors()] == [(0,)]
+
+
+@pytest.mark.parametrize("cls", (Address, HashBytes20, HashStr32))
+@pytest.mark.parametrize("values", ([CHECKSUM_ADDRESS], bytes(64)))
+def test_validate_many_unknown_errors_mode(cls, values):
+    with pytest.raises(ValueError, match="Unknown errors mode"):
+        cls.validate_many(values, errors="repot")
+
+
+def test_validate_many_nested_errors():
+    pattern = "^0x[a-f]{40}$"
+
+    class Item(BaseModel):
+        value: Annotated[str, StringConstraints(pattern=pattern)]
+
+    with pytest.raises(ValidationError) as err:
+        validate_many(Item.model_validate, [{"value": "0x01"}, {"value": "0x02"}])
+
+    # The nested errors keep their type, context and (brace-containing) message.
+    details = err.value.errors()
+    assert [detail["loc"] for detail in details] == [(0, "value"), (1, "value")]
+    assert details[0]["type"] == "string_pattern_mismatch"
+    assert details[0]["ctx"] == {"pattern": pattern}
+    assert details[0]["msg"] == f"String should match pattern '{pattern}'"
+
+
+def test_validate_many_nested_custom_errors():
+    adapter = TypeAdapter(HashBytes32)
+    with pytest.raises(ValidationError) as err:
+        validate_many(adapter.validate_python, ["0xzz"])
+
+    detail = err.value.errors()[0]
+    assert detail["type"] == "HexValueError"
+    assert detail["msg"] == "Invalid hex value"
+    assert detail["ctx"]["value"] == "0xzz"
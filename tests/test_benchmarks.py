@@ -0,0 +1,29 @@
+import json
+
+from benchmarks.run import compare, iter_benchmarks, main, measure
+
+
+def test_benchmarks_run():
+    # Only make sure every benchmark still works; timing is not checked here.
+    for name, setup in iter_benchmarks():
+        result = measure(setup, repeat=1, number=1)
+        assert result["ns_per_op"] > 0, name
+
+
+def test_compare():
+    baseline = {"results": {"a": {"ns_per_op": 100}, "b": {"ns_per_op": 100}}}
+    results = {"results": {"a": {"ns_per_op": 105}, "b": {"ns_per_op": 150}, "c": {}}}
+    assert compare(results, baseline, threshold=0.1) == [("b", 0.5)]
+
+
+def test_main(tmp_path):
+    output = tmp_path / "results.json"
+    assert main(["--filter", "serialize_hex", "--repeat", "1", "--output", str(output)]) == 0
+    results = json.loads(output.read_text())
+    assert list(results["results"]) == ["serialize_hex/32"]
+    assert "package_version" in results["meta"]
+
+    # Pretend the baseline was much faster.
+    results["results"]["serialize_hex/32"]["ns_per_op"] /= 100
+    output.write_text(json.dumps(results))
+    assert main(["--filter", "serialize_hex", "--repeat", "1", "--compare", str(output)]) == 1
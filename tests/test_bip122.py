@@ -1,7 +1,7 @@
 import pytest
 from pydantic import BaseModel, ValidationError
 
-from eth_pydantic_types.bip122 import Bip122Uri, Bip122UriType
+from eth_pydantic_types.bip122 import Bip122Uri, Bip122UriType, StructuredBip122Uri
 
 GENESIS_HASH = "d4e56740f876aef8c010b86a40d5f56745a118d0906a34e69aec8c0db1cb8fa3"
 BLOCK_HASH = "752820c0ad7abc1200f9ad42c4adc6fbb4bd44b5bed4667990e64565102c1ba6"
@@ -42,4 +42,58 @@ def test_schema():
     assert prop["type"] == "string"
     assert prop["title"] == "Uri"
     assert prop["examples"] == [EXAMPLE]
-    assert prop["pattern"] == "^blockchain://[0-9a-f]{64}/block/[0-9a-f]{64}$"
+    assert prop["pattern"] == (
+        "^blockchain://[0-9a-f]{64}/(tx/[0-9a-f]{64}|block/[0-9a-f]{64}|address/[0-9a-f]{40})$"
+    )
+
+
+class StructuredModel(BaseModel):
+    uri: StructuredBip122Uri
+
+
+@pytest.mark.parametrize("uri_type", ("block", "tx"))
+def test_structured(uri_type):
+    value = f"blockchain://0x{GENESIS_HASH.upper()}/{uri_type.upper()}/{BLOCK_HASH}"
+    uri = StructuredModel(uri=value).uri
+    assert uri.genesis_hash == bytes.fromhex(GENESIS_HASH)
+    assert uri.uri_type == Bip122UriType(uri_type)
+    assert uri.hash == bytes.fromhex(BLOCK_HASH)
+    assert str(uri) == f"blockchain://{GENESIS_HASH}/{uri_type}/{BLOCK_HASH}"
+
+    # Round-trips through JSON.
+    model = StructuredModel(uri=value)
+    assert model.model_dump() == {"uri": str(uri)}
+    assert StructuredModel.model_validate_json(model.model_dump_json()) == model
+
+
+def test_structured_from_parts():
+    genesis_hash = bytes.fromhex(GENESIS_HASH)
+    uri = StructuredBip122Uri.from_parts(genesis_hash, "address", b"\x01" * 20)
+    assert uri == StructuredBip122Uri(f"blockchain://{GENESIS_HASH}/address/{'01' * 20}")
+    assert uri != StructuredBip122Uri.from_parts(genesis_hash, "address", b"\x02" * 20)
+    assert len({uri, StructuredBip122Uri(str(uri))}) == 1
+    assert StructuredModel(uri=uri).uri is uri
+    with pytest.raises(AttributeError):
+        uri.hash = b""
+
+
+@pytest.mark.parametrize(
+    "uri",
+    (
+        EXAMPLE.replace(BLOCK_HASH, BLOCK_HASH[:40]),
+        f"blockchain://{GENESIS_HASH}/address/{BLOCK_HASH}",
+        f"blockchain://{GENESIS_HASH[:32]}/block/{BLOCK_HASH}",
+        f"blockchain://{GENESIS_HASH}/foo/{BLOCK_HASH}",
+        123,
+    ),
+)
+def test_structured_invalid(uri):
+    with pytest.raises(ValidationError):
+        StructuredModel(uri=uri)
+
+
+def test_structured_schema():
+    prop = StructuredModel.model_json_schema()["properties"]["uri"]
+    assert prop["type"] == "string"
+    assert prop["examples"] == [EXAMPLE]
+    assert prop["pattern"] == Model.model_json_schema()["properties"]["uri"]["pattern"]
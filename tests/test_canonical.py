@@ -0,0 +1,76 @@
+from typing import Annotated
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from eth_pydantic_types import Address, HashStr32, HexBytes, HexStr, StrictCanonical
+
+CHECKSUM_ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+HASH = "0x9b70bd98ccb5b6434c2ead14d68d15f392435a06ff469f8d1f8cf38b2ae0b0e2"
+
+
+class Model(BaseModel):
+    address: Annotated[Address, StrictCanonical]
+    hash: Annotated[HashStr32, StrictCanonical]
+    data: Annotated[HexStr, StrictCanonical]
+
+
+class RegularModel(BaseModel):
+    address: Address
+    hash: HashStr32
+    data: HexStr
+
+
+@pytest.mark.parametrize(
+    "address,hash,data",
+    (
+        (CHECKSUM_ADDRESS, HASH, "0x0a"),
+        (CHECKSUM_ADDRESS.lower(), f"0x{HASH[2:].upper()}", "0xa"),
+        (int(CHECKSUM_ADDRESS, 16), 5, 10),
+        (HexBytes(CHECKSUM_ADDRESS), HexBytes(HASH), b"\n"),
+    ),
+)
+def test_strict_canonical_matches_regular(address, hash, data):
+    actual = Model(address=address, hash=hash, data=data)
+    expected = RegularModel(address=address, hash=hash, data=data)
+    assert actual.model_dump() == expected.model_dump()
+
+
+@pytest.mark.parametrize("value", ("foo", -35, "0x" + ("F" * 100)))
+def test_strict_canonical_invalid(value):
+    with pytest.raises(ValidationError):
+        Model(address=value, hash=value, data=value)
+
+
+def test_strict_canonical_schema():
+    assert Model.model_json_schema()["properties"] == {
+        **RegularModel.model_json_schema()["properties"],
+    }
+
+
+def test_strict_canonical_unsupported_type():
+    with pytest.raises(TypeError):
+
+        class BadModel(BaseModel):
+            value: Annotated[int, StrictCanonical]
+
+
+def test_strict_canonical_bytes_match_regular():
+    class DataModel(BaseModel):
+        data: Annotated[HexStr, StrictCanonical]
+
+    class RegularDataModel(BaseModel):
+        data: HexStr
+
+    assert DataModel(data=b"0x12").data == RegularDataModel(data=b"0x12").data == "0x30783132"
+
+
+@pytest.mark.parametrize("field,value", (("address", CHECKSUM_ADDRESS), ("hash", HASH)))
+def test_strict_canonical_does_not_decode_bytes(field, value):
+    # The UTF-8 bytes of the hex string are too long for the type, as in the regular model.
+    values = {"address": CHECKSUM_ADDRESS, "hash": HASH, "data": "0x0a", field: value.encode()}
+    with pytest.raises(ValidationError):
+        RegularModel(**values)
+
+    with pytest.raises(ValidationError):
+        Model(**values)
@@ -0,0 +1,109 @@
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from eth_pydantic_types.address import Address, AddressType
+from eth_pydantic_types.columnar import BinaryColumn, FixedSizeBinaryColumn, to_arrow, to_columns
+from eth_pydantic_types.hash import HashBytes32, HashStr20
+from eth_pydantic_types.hex import HexBytes, HexStr
+
+ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+
+
+class Log(BaseModel):
+    address: Address
+    topic: HashBytes32
+    data: HexBytes
+    block_number: int
+    sender: Optional[AddressType] = None
+    note: Optional[HexStr] = None
+    hash_str: Optional[HashStr20] = None
+
+
+@pytest.fixture
+def logs():
+    return [
+        Log(address=ADDRESS, topic=index, data=b"\x01" * index, block_number=index)
+        for index in range(3)
+    ]
+
+
+def test_to_columns(logs):
+    columns = to_columns(logs)
+    assert columns["address"] == FixedSizeBinaryColumn(20, 3, bytes.fromhex(ADDRESS[2:]) * 3)
+    assert columns["topic"] == FixedSizeBinaryColumn(
+        32, 3, b"".join(logs[i].topic for i in range(3))
+    )
+    data = columns["data"]
+    assert isinstance(data, BinaryColumn)
+    assert data.offsets.tolist() == [0, 0, 1, 3]
+    assert data.data == b"\x01" * 3
+    assert data.validity is None
+    assert columns["block_number"] == [0, 1, 2]
+
+
+def test_to_columns_nulls(logs):
+    logs[1].sender = ADDRESS
+    logs[2].note = "0xabcd"
+    logs[0].hash_str = f"0x{'ab' * 20}"
+    columns = to_columns(logs, fields=("sender", "note", "hash_str"))
+    assert list(columns) == ["sender", "note", "hash_str"]
+
+    sender = columns["sender"]
+    assert isinstance(sender, FixedSizeBinaryColumn)
+    assert sender.validity == bytearray([0b010])
+    assert sender.data == bytes(20) + bytes.fromhex(ADDRESS[2:]) + bytes(20)
+
+    note = columns["note"]
+    assert isinstance(note, BinaryColumn)
+    assert note.validity == bytearray([0b100])
+    assert note.offsets.tolist() == [0, 0, 0, 2]
+    assert note.data == b"\xab\xcd"
+
+    hash_str = columns["hash_str"]
+    assert isinstance(hash_str, FixedSizeBinaryColumn)
+    assert hash_str.data == b"\xab" * 20 + bytes(40)
+
+
+def test_to_columns_generic_fields():
+    class Block(BaseModel):
+        hash: HashBytes32
+        numbers: list[int]
+        hashes: Optional[list[HashBytes32]] = None
+
+    blocks = [Block(hash=index, numbers=[index]) for index in range(2)]
+    columns = to_columns(blocks)
+    assert isinstance(columns["hash"], FixedSizeBinaryColumn)
+    assert columns["numbers"] == [[0], [1]]
+    assert columns["hashes"] == [None, None]
+
+
+def test_to_columns_empty():
+    assert to_columns([]) == {}
+    columns = to_columns([], model_type=Log)
+    assert columns["topic"] == FixedSizeBinaryColumn(32, 0, b"")
+    data = columns["data"]
+    assert isinstance(data, BinaryColumn)
+    assert data.offsets.tolist() == [0]
+
+
+def test_to_arrow(logs):
+    pyarrow = pytest.importorskip("pyarrow")
+    logs[1].sender = ADDRESS
+    table = to_arrow(logs)
+    assert table.schema.field("address").type == pyarrow.binary(20)
+    assert table.schema.field("topic").type == pyarrow.binary(32)
+    assert table.schema.field("data").type == pyarrow.binary()
+    assert table.column("data").to_pylist() == [b"", b"\x01", b"\x01\x01"]
+    assert table.column("sender").to_pylist() == [None, bytes.fromhex(ADDRESS[2:]), None]
+    assert table.column("topic").to_pylist() == [bytes(logs[i].topic) for i in range(3)]
+    assert table.column("block_number").to_pylist() == [0, 1, 2]
+
+
+def test_to_arrow_requires_pyarrow(monkeypatch, logs):
+    import eth_pydantic_types.columnar as columnar
+
+    monkeypatch.setattr(columnar, "_get_pyarrow", lambda: None)
+    with pytest.raises(ImportError, match="pyarrow"):
+        to_arrow(logs)
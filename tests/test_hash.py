@@ -1,16 +1,29 @@
+import mmap
+from typing import Annotated
+
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import PydanticCustomError
 
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.cache import InternPool
+from eth_pydantic_types.canonical import StrictCanonical
 from eth_pydantic_types.hash import (
+    MAX_HASH_SIZE,
+    HashBytes,
     HashBytes8,
     HashBytes16,
     HashBytes20,
     HashBytes32,
     HashBytes64,
+    HashKey,
+    HashStr,
     HashStr8,
     HashStr16,
     HashStr32,
     HashStr64,
+    HashView,
+    hash_type,
 )
 from eth_pydantic_types.hex import HexBytes
 
@@ -133,3 +146,234 @@ def test_model_dump(bytes32str):
         "valuestr64": "0x00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000005",  # noqa: E501
     }
     assert actual == expected
+
+
+def test_hash_type_is_memoized():
+    from eth_pydantic_types import HashBytes32 as Bytes32FromPackage
+    from eth_pydantic_types import hash as hash_module
+
+    assert hash_type(32) is HashBytes32
+    assert hash_type(32, bytes) is Bytes32FromPackage
+    assert hash_type(32, "str") is HashStr32
+    assert hash_module.HashStr32 is HashStr32
+    assert hash_type(32, str) is not hash_type(32, bytes)
+    assert isinstance(Bytes32FromPackage(b"\x00" * 32), HashBytes32)
+
+
+def test_hash_type_is_memoized_across_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import Barrier
+
+    barrier = Barrier(8)
+
+    def get_cls(_):
+        barrier.wait()
+        return hash_type(97)
+
+    with ThreadPoolExecutor(8) as executor:
+        classes = set(executor.map(get_cls, range(8)))
+
+    assert len(classes) == 1
+
+
+@pytest.mark.parametrize("size", (0, -1, MAX_HASH_SIZE + 1))
+def test_hash_type_invalid_size(size):
+    with pytest.raises(ValueError):
+        hash_type(size)
+
+
+def test_hash_type_invalid_kind():
+    with pytest.raises(TypeError):
+        hash_type(32, int)
+
+
+def test_hash_type_attribute_out_of_range():
+    import eth_pydantic_types.hash as hash_module
+
+    with pytest.raises(AttributeError):
+        getattr(hash_module, f"HashBytes{MAX_HASH_SIZE + 1}")
+
+
+def test_core_schema_is_shared():
+    class OtherModel(BaseModel):
+        value: HashBytes32
+
+    first = HashBytes32.__get_pydantic_core_schema__(HashBytes32)
+    second = HashBytes32.__get_pydantic_core_schema__(HashBytes32)
+    assert first == second
+    assert first is not second  # Copies, so models cannot mutate the shared schema.
+    assert OtherModel(value=5).value == Model.from_single(5).valuebytes32
+
+
+@pytest.mark.parametrize("wrap", (bytes, bytearray, memoryview, HexBytes))
+def test_hashbytes_from_buffer(wrap):
+    data = bytes(range(32))
+    actual = HashBytes32.__eth_pydantic_validate__(wrap(data))
+    assert type(actual) is HashBytes32
+    assert actual == data
+
+
+def test_hashbytes_from_mmap():
+    with mmap.mmap(-1, 64) as buffer:
+        buffer.write(bytes(range(64)))
+        actual = HashBytes32.__eth_pydantic_validate__(memoryview(buffer)[32:])
+        assert actual == bytes(range(32, 64))
+
+
+def test_hash_view():
+    buffer = bytearray(range(64))
+    view = HashView(buffer, offset=32)
+    assert len(view) == view.size == 32
+    assert view == bytes(range(32, 64))
+    assert hash(view) == hash(bytes(range(32, 64)))
+    assert view.to_0x_hex() == HexBytes(bytes(range(32, 64))).to_0x_hex()
+
+    # Views do not copy, so they see changes to the buffer.
+    buffer[32] = 255
+    assert view[0] == 255
+
+    hash_bytes = view.to_hash_bytes()
+    assert type(hash_bytes) is HashBytes32
+    assert hash_bytes == bytes(view)
+    assert TypeAdapter(HashBytes32).validate_python(view) == hash_bytes
+
+
+def test_hash_view_out_of_range():
+    with pytest.raises(ValueError):
+        HashView(b"\x00" * 40, offset=10)
+
+
+@pytest.fixture
+def intern_pool(monkeypatch):
+    pool = InternPool(maxsize=2)
+    monkeypatch.setattr(HashBytes32, "intern_pool", pool)
+    return pool
+
+
+def test_intern_pool(intern_pool):
+    adapter = TypeAdapter(HashBytes32)
+    value = adapter.validate_python(f"0x{'01' * 32}")
+    assert adapter.validate_python(b"\x01" * 32) is value
+    assert all(item is value for item in HashBytes32.validate_many([value, int(value.hex(), 16)]))
+    assert all(item is value for item in HashBytes32.validate_many(b"\x01" * 64))
+
+    info = intern_pool.info()
+    assert info.misses == 1
+    assert info.hits == 5
+    assert info.currsize == 1
+
+
+def test_intern_pool_evicts(intern_pool):
+    values = [HashBytes32.__eth_pydantic_validate__(index) for index in range(3)]
+    assert intern_pool.info().evictions == 1
+    assert HashBytes32.__eth_pydantic_validate__(2) is values[2]
+    assert HashBytes32.__eth_pydantic_validate__(0) is not values[0]
+
+
+def test_intern_pool_disabled():
+    assert not HashBytes32.intern_pool.enabled
+    assert HashBytes32.__eth_pydantic_validate__(1) is not HashBytes32.__eth_pydantic_validate__(1)
+
+    # Every size and kind has its own pool.
+    pools = {id(cls.intern_pool) for cls in (HashBytes20, HashBytes32, HashStr32, Address)}
+    assert len(pools) == 4
+
+
+def test_intern_pool_hash_str(monkeypatch):
+    monkeypatch.setattr(HashStr32, "intern_pool", InternPool(maxsize=10))
+    value = HashStr32.__eth_pydantic_validate__(f"0x{'AB' * 32}")
+    assert HashStr32.__eth_pydantic_validate__(b"\xab" * 32) is value
+    assert HashStr32.validate_many([value[2:].upper()])[0] is value
+
+
+def test_intern_pool_hash_str_fields(monkeypatch):
+    monkeypatch.setattr(HashStr32, "intern_pool", InternPool(maxsize=10))
+
+    class Model(BaseModel):
+        value: HashStr32
+        canonical: Annotated[HashStr32, StrictCanonical]
+
+    first = Model(value=f"0x{'AB' * 32}", canonical=f"0x{'ab' * 32}")
+    second = Model(value=b"\xab" * 32, canonical=f"0x{'AB' * 32}")
+    assert first.value is second.value is first.canonical is second.canonical
+    assert TypeAdapter(HashStr32).validate_python(f"0x{'ab' * 32}") is first.value
+    assert HashStr32.__eth_pydantic_validate__(f"0x{'ab' * 32}") is first.value
+    assert first.model_dump() == {"value": f"0x{'ab' * 32}", "canonical": f"0x{'ab' * 32}"}
+
+
+def test_hash_str_field_uses_validate_override():
+    class NonZeroHashStr32(HashStr32):
+        @classmethod
+        def __eth_pydantic_validate__(cls, value, info=None):
+            value = super().__eth_pydantic_validate__(value, info)
+            if int(value, 16) == 0:
+                raise ValueError("Zero hash")
+
+            return value
+
+    class Model(BaseModel):
+        value: NonZeroHashStr32
+
+    assert Model(value=1).value == f"0x{'00' * 31}01"
+    with pytest.raises(ValidationError, match="Zero hash"):
+        Model(value=0)
+
+
+def test_size_specialized_validators():
+    # Every size has its own fast path, with the size baked in.
+    assert HashBytes32._validate_canonical is not HashBytes20._validate_canonical
+    assert HashBytes32._validate_canonical(b"\x01" * 32) == b"\x01" * 32
+    assert HashBytes32._validate_canonical(f"0x{'AB' * 32}") == b"\xab" * 32
+    assert HashBytes32._validate_canonical(b"\x01" * 20) is None
+    assert HashStr32._validate_canonical(b"\xab" * 32) == f"0x{'ab' * 32}"
+    assert HashStr32._validate_canonical(f"0x{'AB' * 32}") == f"0x{'ab' * 32}"
+    assert HashStr32._validate_canonical("0x01") is None
+
+    # Other values still take the generic path.
+    assert HashBytes32.__eth_pydantic_validate__("0x01") == b"\x00" * 31 + b"\x01"
+    assert HashStr32.__eth_pydantic_validate__("0x01") == f"0x{'00' * 31}01"
+
+
+@pytest.mark.parametrize("cls", (HexBytes, HashBytes, HashBytes20, HashBytes32))
+def test_native_hash_and_eq(cls):
+    # Keys hash and compare in C, like `bytes`; no Python-level overrides.
+    assert cls.__hash__ is bytes.__hash__
+    assert cls.__eq__ is bytes.__eq__
+
+
+@pytest.mark.parametrize("cls", (HashStr, HashStr32, Address))
+def test_native_hash_and_eq_str(cls):
+    assert cls.__hash__ is str.__hash__
+    assert cls.__eq__ is str.__eq__
+
+
+def test_to_key():
+    value = HashBytes32.__eth_pydantic_validate__(1)
+    key = value.to_key()
+    assert type(key) is HashKey is bytes
+    assert key == value
+    assert hash(key) == hash(value)
+    assert {value: 1}[key] == 1
+
+    hex_str = HashStr32.__eth_pydantic_validate__(1)
+    assert type(hex_str.to_key()) is str
+    assert hex_str.to_key() == hex_str
+
+
+@pytest.mark.parametrize(
+    "values", (bytes(range(64)), bytearray(range(64)), memoryview(bytes(range(64))))
+)
+def test_to_keys(values):
+    keys = HashBytes32.to_keys(values)
+    assert keys == [bytes(range(32)), bytes(range(32, 64))]
+    assert all(type(key) is bytes for key in keys)
+
+
+def test_to_keys_values():
+    values = [HashBytes32.__eth_pydantic_validate__(index) for index in range(3)]
+    keys = HashBytes32.to_keys([*values, HashView(values[0])])
+    assert keys == [*values, values[0]]
+    assert all(type(key) is bytes for key in keys)
+
+    with pytest.raises(PydanticCustomError):
+        HashBytes32.to_keys(bytes(33))
@@ -4,7 +4,7 @@ from hexbytes import HexBytes as BaseHexBytes
 from pydantic import BaseModel, ValidationError
 
 from eth_pydantic_types import HashStr20
-from eth_pydantic_types.hex import HexBytes, HexStr
+from eth_pydantic_types.hex import HexBytes, HexStr, validate_hex_bytes, validate_hex_str
 
 
 class BytesModel(BaseModel):
@@ -26,9 +26,13 @@ def test_hexbytes(value):
     assert isinstance(actual.value, BaseHexBytes)
 
 
-def test_invalid_hexbytes():
-    with pytest.raises(ValidationError):
-        BytesModel(value="foo")
+@pytest.mark.parametrize("value", ("foo", "0xzz", "0x 1"))
+def test_invalid_hexbytes(value):
+    with pytest.raises(ValidationError) as err:
+        BytesModel(value=value)
+
+    # Same error as the other hex types, rather than `hexbytes`' `value_error`.
+    assert err.value.errors()[0]["type"] == "HexValueError"
 
 
 def test_hexbytes_fromhex(bytes32str):
@@ -130,3 +134,56 @@ def test_hex_removes_leading_zeroes_if_needed():
         model = MyModel(my_address=addr)
         assert len(model.my_address) == 42
         assert model.my_address == "0xcafac3dd18ac6c6e92c921884f9e4176737c052c"
+
+
+def test_schemas_cached_per_class():
+    class MyHexBytes(HexBytes):
+        schema_pattern = "^0x[0-9a-f]{4}$"
+
+        @classmethod
+        def __eth_pydantic_validate__(cls, value, info=None):
+            return super().__eth_pydantic_validate__(value)[:2]
+
+    # Build the parent's schemas first; the subclass must not re-use them.
+    assert BytesModel.model_json_schema()["properties"]["value"]["pattern"] != "^0x[0-9a-f]{4}$"
+
+    class MyModel(BaseModel):
+        value: MyHexBytes
+
+    assert MyModel(value="0x010203").value == b"\x01\x02"
+    assert MyModel.model_json_schema()["properties"]["value"]["pattern"] == "^0x[0-9a-f]{4}$"
+    assert HexBytes.__get_pydantic_core_schema__(HexBytes) is not vars(HexBytes)["_core_schema"]
+
+    # Mutating one JSON schema does not affect the next one.
+    schema = BytesModel.model_json_schema()
+    schema["properties"]["value"]["examples"].clear()
+    assert BytesModel.model_json_schema()["properties"]["value"]["examples"]
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("0x", "0x"),
+        ("", "0x"),
+        ("0xab", "0xab"),
+        ("0xAb", "0xab"),
+        ("AB", "0xab"),
+        ("0x1", "0x01"),
+        ("abc", "0x0abc"),
+    ],
+)
+def test_validate_hex_str(value, expected):
+    assert validate_hex_str(value) == expected
+    assert validate_hex_bytes(value) == bytes.fromhex(expected[2:])
+
+
+@pytest.mark.parametrize("value", ("0xzz", "0x0g", "ab cd", " ab", "0X12", "0x-1"))
+def test_validate_hex_str_invalid(value):
+    with pytest.raises(ValueError):
+        validate_hex_str(value)
+
+
+def test_validate_hex_bytes_invalid():
+    assert validate_hex_bytes("0XAB") == b"\xab"
+    with pytest.raises(ValueError):
+        validate_hex_bytes("ab cd")
@@ -0,0 +1,66 @@
+import subprocess
+import sys
+
+import pytest
+
+import eth_pydantic_types
+from eth_pydantic_types._main import __all__ as public_names
+
+# Generous enough for slow CI machines, but far below importing the dependencies.
+IMPORT_TIME_BUDGET_US = 50_000
+
+HEAVY_MODULES = ("cchecksum", "eth_typing", "hexbytes", "pydantic", "pydantic_core")
+
+
+def get_import_times(code: str) -> dict[str, int]:
+    """
+    Run the code in a fresh interpreter and get the cumulative
+    import time (in microseconds) of every imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def test_import_package():
+    times = get_import_times("import eth_pydantic_types")
+    assert times["eth_pydantic_types"] < IMPORT_TIME_BUDGET_US
+    assert not set(times) & set(HEAVY_MODULES)
+
+
+@pytest.mark.parametrize(
+    "name,unused",
+    [
+        ("HexBytes", ("cchecksum", "eth_typing", "pydantic_core")),
+        ("HashStr32", ("cchecksum", "eth_typing", "pydantic_core")),
+        ("Address", ("cchecksum", "eth_typing", "pydantic_core")),
+        ("Bip122Uri", ("cchecksum", "eth_typing", "pydantic_core")),
+    ],
+)
+def test_import_name(name, unused):
+    times = get_import_times(f"from eth_pydantic_types import {name}")
+    assert not set(times) & set(unused)
+
+
+@pytest.mark.parametrize("name", public_names)
+def test_public_names(name):
+    value = getattr(eth_pydantic_types, name)
+    assert value is getattr(eth_pydantic_types._main, name)
+    assert name in dir(eth_pydantic_types)
+
+
+def test_unknown_name():
+    with pytest.raises(AttributeError):
+        _ = eth_pydantic_types.Foo
@@ -0,0 +1,164 @@
+import pytest
+from pydantic_core import PydanticCustomError
+
+from eth_pydantic_types.address import Address
+from eth_pydantic_types.hash import HashBytes20, HashBytes32, HashStr20
+from eth_pydantic_types.index import HEADER_SIZE, HashIndex
+
+ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+
+
+def word(value: int) -> bytes:
+    return value.to_bytes(32, "big")
+
+
+@pytest.fixture
+def index(tmp_path):
+    values = [word(value) for value in range(100, 0, -1)]
+    with HashIndex.build(tmp_path / "hashes.idx", values + values[:5], HashBytes32) as index:
+        yield index
+
+
+def test_build(index):
+    assert len(index) == 100
+    assert index.value_type is HashBytes32
+    assert index.size == 32
+    assert index.path.stat().st_size > HEADER_SIZE + 100 * 32
+
+
+def test_contains(index):
+    assert word(1) in index
+    assert 100 in index
+    assert "0x05" in index
+    assert HashBytes32.__eth_pydantic_validate__(50) in index
+    assert word(101) not in index
+    assert 0 not in index
+    assert "not a hash" not in index
+    assert index.contains_many([1, 101, 2]) == [True, False, True]
+
+
+def test_might_contain(index):
+    assert all(index.might_contain(value) for value in range(1, 101))
+    false_positives = sum(index.might_contain(value) for value in range(1000, 3000))
+    assert false_positives < 100
+
+
+def test_iter_is_sorted_and_typed(index):
+    values = list(index)
+    assert values == [word(value) for value in range(1, 101)]
+    assert all(type(value) is HashBytes32 for value in values)
+    assert index[0] == word(1)
+    assert index[-1] == word(100)
+    with pytest.raises(IndexError):
+        _ = index[100]
+
+
+def test_build_in_chunks(tmp_path):
+    values = [word(value) for value in range(1000, 0, -1)]
+    with HashIndex.build(tmp_path / "hashes.idx", values * 2, HashBytes32, chunk_size=64) as index:
+        assert len(index) == 1000
+        assert list(index) == sorted(values)
+
+
+def test_build_from_buffer(tmp_path):
+    with HashIndex.build(tmp_path / "hashes.idx", bytes(range(40)) * 3, HashBytes20) as index:
+        assert list(index) == [bytes(range(20)), bytes(range(20, 40))]
+
+    with pytest.raises(PydanticCustomError):
+        HashIndex.build(tmp_path / "invalid.idx", bytes(21), HashBytes20)
+
+
+def test_build_invalid(tmp_path):
+    with pytest.raises(PydanticCustomError):
+        HashIndex.build(tmp_path / "hashes.idx", ["0xzz"], HashBytes32)
+
+    with pytest.raises(TypeError):
+        HashIndex.build(tmp_path / "hashes.idx", [], bytes)
+
+    # No temporary files are left behind.
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_addresses(tmp_path):
+    with HashIndex.build(tmp_path / "addresses.idx", [ADDRESS.lower()], Address) as index:
+        assert index.value_type is Address
+        assert list(index) == [ADDRESS]
+        assert ADDRESS in index
+        assert bytes.fromhex(ADDRESS[2:]) in index
+
+    with HashIndex(tmp_path / "addresses.idx") as index:
+        assert index.value_type is Address
+
+
+def test_hash_str(tmp_path):
+    values = [f"0x{'AB' * 20}", f"0x{'01' * 20}"]
+    with HashIndex.build(tmp_path / "hashes.idx", values, HashStr20) as index:
+        assert list(index) == [f"0x{'01' * 20}", f"0x{'ab' * 20}"]
+        assert all(type(value) is HashStr20 for value in index)
+
+
+def test_append(tmp_path, index):
+    assert index.append([word(101), word(1)]) is index
+    assert len(index) == 101
+    assert word(101) in index
+    with HashIndex(index.path) as reopened:
+        assert reopened[-1] == word(101)
+
+    assert list(tmp_path.iterdir()) == [index.path]
+
+
+def test_merge(tmp_path, index):
+    with HashIndex.build(tmp_path / "other.idx", [word(200), word(1)], HashBytes32) as other:
+        paths = [index, tmp_path / "other.idx"]
+        with HashIndex.merge(tmp_path / "merged.idx", paths) as merged:
+            assert len(merged) == 101
+            assert word(200) in merged
+            assert list(merged) == sorted({*index, *other})
+
+
+def test_merge_in_place(tmp_path, index):
+    with HashIndex.build(tmp_path / "other.idx", [word(200)], HashBytes32) as other:
+        with HashIndex.merge(index.path, [index, other]) as merged:
+            assert len(merged) == 101
+
+    # The merged index is reopened on the new file.
+    assert len(index) == 101
+    assert word(200) in index
+    assert sorted(tmp_path.iterdir()) == [index.path, other.path]
+
+
+def test_merge_different_types(tmp_path, index):
+    with HashIndex.build(tmp_path / "addresses.idx", [ADDRESS], Address):
+        with pytest.raises(ValueError, match="different value types"):
+            HashIndex.merge(tmp_path / "merged.idx", [index, tmp_path / "addresses.idx"])
+
+
+def test_empty(tmp_path):
+    with HashIndex.build(tmp_path / "empty.idx", [], HashBytes32) as index:
+        assert len(index) == 0
+        assert list(index) == []
+        assert word(1) not in index
+
+
+def test_not_an_index(tmp_path):
+    path = tmp_path / "junk.idx"
+    path.write_bytes(bytes(100))
+    with pytest.raises(ValueError, match="hash index"):
+        HashIndex(path)
+
+    path.write_bytes(b"")
+    with pytest.raises(ValueError, match="hash index"):
+        HashIndex(path)
+
+
+def test_truncated(index):
+    data = index.path.read_bytes()
+    path = index.path.with_name("truncated.idx")
+    path.write_bytes(data[:-1])
+    with pytest.raises(ValueError, match="truncated or corrupt"):
+        HashIndex(path)
+
+    # A header whose value type does not match its size.
+    path.write_bytes(data[:10] + (20).to_bytes(2, "little") + data[12:])
+    with pytest.raises(ValueError, match="truncated or corrupt"):
+        HashIndex(path)
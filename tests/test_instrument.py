@@ -0,0 +1,95 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated
+
+import pytest
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from eth_pydantic_types import Address, CompactHex, HashBytes32, HashStr32, HexBytes, HexStr
+from eth_pydantic_types.instrument import Instrumentation, instrumentation
+
+CHECKSUM_ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield instrumentation
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_by_default():
+    assert not Instrumentation().enabled
+    assert not hasattr(HexBytes.__eth_pydantic_validate__, "__wrapped__")
+
+
+def test_validate(enabled):
+    class Model(BaseModel):
+        address: Address
+        topic: HashBytes32
+        topic_str: HashStr32
+
+    Model(address=CHECKSUM_ADDRESS, topic=1, topic_str=1)
+    with pytest.raises(ValidationError):
+        Model(address="0xzz", topic=b"\x01", topic_str=b"\x01")
+
+    data = enabled.as_dict()
+    assert data["validate"]["Address"]["calls"] == 2
+    assert data["validate"]["Address"]["inputs"] == {"str": 2}
+    assert data["validate"]["Address"]["failures"] == {"HexValueError": 1}
+    assert data["validate"]["HashBytes32"]["inputs"] == {"int": 1, "bytes": 1}
+    assert data["validate"]["HashBytes32"]["seconds"] > 0
+    assert data["coercions"]["bytes_size"] == 2
+    assert data["validate"]["HashStr32"]["calls"] == 2
+    assert data["validate"]["HashStr32"]["inputs"] == {"int": 1, "bytes": 1}
+
+    # Validating through `HexBytes` is only counted as a `HashBytes32` call.
+    assert "HexBytes" not in data["validate"]
+
+
+def test_validate_threads(enabled):
+    adapter = TypeAdapter(HexStr)
+
+    def validate(_):
+        for _ in range(200):
+            adapter.validate_python("0x12")
+
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(validate, range(4)))
+
+    assert enabled.as_dict()["validate"]["HexStr"]["calls"] == 800
+
+
+def test_coercions_and_serialize(enabled):
+    adapter = TypeAdapter(HexStr)
+    assert adapter.dump_json(adapter.validate_python("0x123")) == b'"0x0123"'
+    TypeAdapter(HexBytes).dump_json(b"\x01")
+
+    class Model(BaseModel):
+        value: Annotated[HexStr, CompactHex]
+
+    Model(value="0x01").model_dump()
+
+    data = enabled.as_dict()
+    assert data["coercions"] == {"odd_length": 1}
+    assert data["serialize"]["serialize_hex"]["calls"] == 1
+    assert data["serialize"]["serialize_compact_hex_str"]["calls"] == 1
+
+    # Plain `str` values are serialized without calling Python.
+    assert len(data["serialize"]) == 2
+
+
+def test_export(enabled):
+    TypeAdapter(HexStr).validate_python("0x12")
+    metrics = []
+    enabled.export(lambda *metric: metrics.append(metric), prefix="eth")
+    assert ("eth_validate_calls", 1, {"type": "HexStr"}) in metrics
+    assert ("eth_validate_inputs", 1, {"type": "HexStr", "input_type": "str"}) in metrics
+
+
+def test_disable(enabled):
+    enabled.disable()
+    assert not enabled.enabled
+    TypeAdapter(HexStr).validate_python("0x123")
+    assert enabled.as_dict() == {"validate": {}, "serialize": {}, "coercions": {}}
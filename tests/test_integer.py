@@ -0,0 +1,129 @@
+import pytest
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import PydanticCustomError
+
+from eth_pydantic_types import Address, HashBytes32
+from eth_pydantic_types.integer import Int8, Int256, UInt8, UInt160, UInt256, int_type
+
+CHECKSUM_ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+
+
+class Balance(UInt256):
+    json_format = "decimal"
+
+
+class Model(BaseModel):
+    value: UInt256
+    delta: Int256
+    balance: Balance
+
+
+@pytest.mark.parametrize("value", (255, "0xff", "0xFF", "255", b"\xff", b"\x00" * 31 + b"\xff"))
+def test_validate(value):
+    actual = TypeAdapter(UInt256).validate_python(value)
+    assert actual == 255
+    assert type(actual) is UInt256
+
+
+@pytest.mark.parametrize(
+    "tp,value,expected",
+    [
+        (Int8, "-0x80", -128),
+        (Int8, b"\x80", -128),
+        (Int8, "127", 127),
+        (UInt8, b"\x80", 128),
+        (Int256, b"\xff" * 32, -1),
+        (Int256, b"\xff" * 31, 2**248 - 1),
+    ],
+)
+def test_validate_signed(tp, value, expected):
+    assert tp.__eth_pydantic_validate__(value) == expected
+
+
+@pytest.mark.parametrize(
+    "tp,value",
+    [
+        (UInt256, -1),
+        (UInt256, "-1"),
+        (UInt256, 2**256),
+        (UInt8, 256),
+        (Int8, -129),
+        (Int8, "0x80"),
+        (UInt256, b"\x01" * 33),
+        (UInt256, "0x"),
+        (UInt256, "1_000"),
+        (UInt256, " 1"),
+        (UInt256, "+1"),
+        (UInt256, 1.0),
+        (UInt256, True),
+    ],
+)
+def test_validate_invalid(tp, value):
+    with pytest.raises(ValidationError):
+        TypeAdapter(tp).validate_python(value)
+
+
+def test_model_dump():
+    model = Model(value="0x1f", delta=-1, balance=10**18)
+    assert model.model_dump() == {"value": 31, "delta": -1, "balance": 10**18}
+    assert model.model_dump_json() == f'{{"value":"0x1f","delta":"-0x1","balance":{10**18}}}'
+    assert Model.model_validate_json(model.model_dump_json()) == model
+
+
+def test_schema():
+    properties = Model.model_json_schema()["properties"]
+    assert properties["value"]["type"] == "string"
+    assert properties["value"]["pattern"] == "^0x[0-9a-fA-F]{1,64}$"
+    assert properties["delta"]["pattern"] == "^-?0x[0-9a-fA-F]{1,64}$"
+    assert properties["balance"] == {
+        "type": "integer",
+        "minimum": 0,
+        "maximum": 2**256 - 1,
+        "title": "Balance",
+    }
+
+
+def test_invalid_json_format():
+    class Bad(UInt256):
+        json_format = "octal"
+
+    with pytest.raises(ValueError, match="Unknown json_format"):
+        TypeAdapter(Bad)
+
+
+def test_hash_bytes_conversions():
+    value = Int256(-2)
+    hash_bytes = value.to_hash_bytes()
+    assert type(hash_bytes) is HashBytes32
+    assert hash_bytes == b"\xff" * 31 + b"\xfe"
+    assert Int256.from_hash_bytes(hash_bytes) == -2
+    assert UInt256.from_hash_bytes(hash_bytes) == 2**256 - 2
+
+
+def test_address_conversions():
+    value = UInt160.from_address(Address(CHECKSUM_ADDRESS))
+    assert value == int(CHECKSUM_ADDRESS, 16)
+    assert value.to_address() == CHECKSUM_ADDRESS
+    assert UInt160.from_address(bytes.fromhex(CHECKSUM_ADDRESS[2:])) == value
+    with pytest.raises(ValueError):
+        UInt8.from_address(CHECKSUM_ADDRESS)
+
+
+@pytest.mark.parametrize("value", (Int8(-1), UInt256(2**160)))
+def test_to_address_out_of_range(value):
+    with pytest.raises(PydanticCustomError) as err:
+        value.to_address()
+
+    assert err.value.type == "IntRangeError"
+
+
+def test_int_type():
+    assert int_type(256) is UInt256
+    assert int_type(256, signed=True) is Int256
+    assert int_type(64).__name__ == "UInt64"
+    assert int_type(8, signed=True).min_value == -128
+    with pytest.raises(ValueError):
+        int_type(12)
+
+    with pytest.raises(TypeError):
+        int_type("256")  # type: ignore[arg-type]
@@ -0,0 +1,99 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pydantic import BaseModel, ValidationError, field_validator
+
+from eth_pydantic_types import Address, BatchResult, HashBytes32, HashStr32
+from eth_pydantic_types.parallel import _validate_items, parallel_validate
+from eth_pydantic_types.stream import _get_adapter
+
+CHECKSUM_ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+
+
+class Log(BaseModel):
+    address: Address
+    topic: HashBytes32
+
+
+class Item(BaseModel):
+    value: int
+
+    @field_validator("value")
+    @classmethod
+    def check_value(cls, value: int) -> int:
+        if value < 0:
+            raise ValueError("expected {value} >= 0")
+
+        return value
+
+
+@pytest.mark.parametrize("cls", (Address, HashBytes32, HashStr32))
+def test_parallel_validate(cls):
+    items = [CHECKSUM_ADDRESS.lower(), 1, 2, b"\x03", "0x04"] * 3
+    actual = parallel_validate(cls, items, workers=2, chunk_size=4)
+    assert actual == cls.validate_many(items)
+    assert all(type(a) is type(e) for a, e in zip(actual, cls.validate_many(items)))
+
+
+def test_parallel_validate_executor():
+    items = list(range(10))
+    with ThreadPoolExecutor(2) as executor:
+        actual = parallel_validate(HashBytes32, items, chunk_size=3, executor=executor)
+
+    assert actual == HashBytes32.validate_many(items)
+
+
+def test_parallel_validate_model():
+    items = [{"address": CHECKSUM_ADDRESS.lower(), "topic": idx} for idx in range(5)]
+    actual = parallel_validate(Log, items, workers=2, chunk_size=2)
+    assert actual == [Log.model_validate(item) for item in items]
+
+
+def test_validate_items_reuses_adapter():
+    items = [{"address": CHECKSUM_ADDRESS, "topic": idx} for idx in range(2)]
+    _validate_items(Log, items)
+    misses = _get_adapter.cache_info().misses
+    _validate_items(Log, items)
+    assert _get_adapter.cache_info().misses == misses
+
+
+def test_parallel_validate_errors():
+    items = [1, "foo", 2, "bar"]
+    result = parallel_validate(HashBytes32, items, workers=2, chunk_size=2, errors="report")
+    assert isinstance(result, BatchResult)
+    assert list(result.errors) == [1, 3]
+    assert result.values[2] == HashBytes32.validate_many([2])[0]
+
+    with pytest.raises(ValidationError) as err:
+        parallel_validate(HashBytes32, items, workers=2, chunk_size=2)
+
+    assert [e["loc"] for e in err.value.errors()] == [(1,), (3,)]
+
+
+def test_parallel_validate_model_errors():
+    items = [{"address": CHECKSUM_ADDRESS, "topic": 1}, {"address": "foo", "topic": 1}]
+    with pytest.raises(ValidationError) as err:
+        parallel_validate(Log, items, workers=2)
+
+    assert err.value.errors()[0]["loc"] == (1, "address")
+
+
+def test_parallel_validate_model_error_details():
+    items = [{"value": 1}, {"value": -1}, {"value": "foo"}]
+    with pytest.raises(ValidationError) as err:
+        parallel_validate(Item, items, workers=2)
+
+    # The messages are kept as-is, with their type and context.
+    details = err.value.errors()
+    assert details[0]["type"] == "value_error"
+    assert details[0]["msg"] == "Value error, expected {value} >= 0"
+    assert str(details[0]["ctx"]["error"]) == "expected {value} >= 0"
+    assert details[1]["type"] == "int_parsing"
+
+
+def test_parallel_validate_generic_alias():
+    items = [[1, 2], [3]]
+    with ThreadPoolExecutor(2) as executor:
+        actual = parallel_validate(list[int], items, chunk_size=1, executor=executor)
+
+    assert actual == items
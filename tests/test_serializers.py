@@ -0,0 +1,133 @@
+from typing import Annotated
+
+import pytest
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import PydanticSerializationError
+
+from eth_pydantic_types import (
+    Address,
+    CompactHex,
+    HashBytes32,
+    HashStr32,
+    HexBytes,
+    HexStr,
+    StrictCanonical,
+)
+from eth_pydantic_types.serializers import (
+    serialize_compact_hex,
+    serialize_compact_hex_str,
+    serialize_hex,
+)
+
+CHECKSUM_ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+HASH = bytes(range(32))
+
+
+class Log(BaseModel):
+    address: Annotated[Address, CompactHex]
+    canonical_address: Annotated[Address, StrictCanonical, CompactHex]
+    topic: Annotated[HashBytes32, CompactHex]
+    topic_str: Annotated[HashStr32, CompactHex]
+    data: Annotated[HexBytes, CompactHex]
+    value: Annotated[HexStr, CompactHex]
+
+
+class PlainLog(BaseModel):
+    address: Address
+    topic: HashBytes32
+    topic_str: HashStr32
+
+
+@pytest.fixture
+def log():
+    return Log(
+        address=CHECKSUM_ADDRESS,
+        canonical_address=CHECKSUM_ADDRESS,
+        topic=HASH,
+        topic_str=HASH,
+        data=b"\x12\x34",
+        value="0x1234",
+    )
+
+
+def test_serialize_hex():
+    assert serialize_hex(b"\x12\x34") == "0x1234"
+    assert serialize_hex(HexBytes("0x1234")) == "0x1234"
+
+
+def test_default_format(log):
+    assert log.model_dump() == log.model_dump(context={"hex_format": "hex"})
+    assert log.model_dump()["topic"] == f"0x{HASH.hex()}"
+
+
+@pytest.mark.parametrize("cls", (Address, HashStr32, HexStr))
+def test_default_str_schema_has_no_serializer(cls):
+    # Plain `str` fields are serialized entirely in pydantic-core.
+    assert "serialization" not in TypeAdapter(cls).core_schema
+
+
+def test_default_schema_ignores_context():
+    log = PlainLog(address=CHECKSUM_ADDRESS, topic=HASH, topic_str=HASH)
+    assert log.model_dump(context={"hex_format": "bytes"}) == {
+        "address": CHECKSUM_ADDRESS,
+        "topic": f"0x{HASH.hex()}",
+        "topic_str": f"0x{HASH.hex()}",
+    }
+
+
+def test_compact_hex_unsupported_type():
+    with pytest.raises(TypeError, match="does not support CompactHex"):
+
+        class Model(BaseModel):
+            value: Annotated[int, CompactHex]
+
+
+def test_bytes_format(log):
+    data = log.model_dump(context={"hex_format": "bytes"})
+    assert data == {
+        "address": bytes.fromhex(CHECKSUM_ADDRESS[2:]),
+        "canonical_address": bytes.fromhex(CHECKSUM_ADDRESS[2:]),
+        "topic": HASH,
+        "topic_str": HASH,
+        "data": b"\x12\x34",
+        "value": b"\x12\x34",
+    }
+    assert all(type(value) is bytes for value in data.values())
+    assert Log.model_validate(data) == log
+
+
+def test_bytes_format_json(log):
+    with pytest.raises(PydanticSerializationError, match="cannot be serialized to JSON"):
+        log.model_dump_json(context={"hex_format": "bytes"})
+
+    with pytest.raises(PydanticSerializationError, match="cannot be serialized to JSON"):
+        log.model_dump(mode="json", context={"hex_format": "bytes"})
+
+
+def test_serialize_without_context():
+    # e.g. the `SerializationInfo` of pydantic < 2.7, which has no `context`.
+    assert serialize_compact_hex(b"\x12\x34", object()) == "0x1234"
+    assert serialize_compact_hex_str("0x1234", object()) == "0x1234"
+
+
+def test_base64_format(log):
+    data = log.model_dump_json(context={"hex_format": "base64"})
+    assert len(data) < len(log.model_dump_json())
+    assert '"data":"EjQ="' in data
+    assert Log.model_validate_json(data, context={"hex_format": "base64"}) == log
+
+    # Base64 is only decoded when asked for.
+    with pytest.raises(ValidationError):
+        Log.model_validate_json(data)
+
+
+def test_invalid_base64(log):
+    data = log.model_dump(context={"hex_format": "base64"})
+    data["data"] = "not base64!"
+    with pytest.raises(ValidationError, match="HexValueError"):
+        Log.model_validate(data, context={"hex_format": "base64"})
+
+
+def test_unknown_format(log):
+    with pytest.raises(PydanticSerializationError, match="Unknown hex_format"):
+        log.model_dump(context={"hex_format": "octal"})
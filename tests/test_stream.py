@@ -0,0 +1,107 @@
+import json
+from collections.abc import Generator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from io import BytesIO
+from typing import cast
+
+import pytest
+from pydantic import BaseModel
+
+from eth_pydantic_types import Address, HashBytes32, HexBytes
+from eth_pydantic_types.stream import ErrorRecord, StreamStats, validate_jsonl
+
+CHECKSUM_ADDRESS = "0x0837207e343277CBd6c114a45EC0e9Ec56a1AD84"
+
+
+class Log(BaseModel):
+    address: Address
+    topic: HashBytes32
+    data: HexBytes
+
+
+def make_lines(count: int, invalid: tuple[int, ...] = ()) -> bytes:
+    lines = []
+    for index in range(count):
+        address = "foo" if index in invalid else CHECKSUM_ADDRESS.lower()
+        lines.append(json.dumps({"address": address, "topic": hex(index), "data": "0x01"}))
+
+    return "\n".join(lines).encode()
+
+
+@pytest.mark.parametrize("chunk_size", (1, 7, 1 << 20))
+def test_validate_jsonl(chunk_size):
+    stats = StreamStats()
+    results = list(validate_jsonl(BytesIO(make_lines(5)), Log, chunk_size=chunk_size, stats=stats))
+    assert [int.from_bytes(r.topic, "big") for r in results] == list(range(5))
+    assert all(r.address == CHECKSUM_ADDRESS for r in results)
+    assert stats.lines == stats.valid == 5
+    assert stats.bytes_read == len(make_lines(5))
+    assert stats.lines_per_second > 0
+
+
+def test_validate_jsonl_path(tmp_path):
+    path = tmp_path / "logs.jsonl"
+    path.write_bytes(make_lines(3) + b"\n\n")
+    assert len(list(validate_jsonl(path, Log))) == 3
+    assert len(list(validate_jsonl(str(path), Log))) == 3
+
+
+def test_validate_jsonl_errors():
+    stats = StreamStats()
+    results = list(validate_jsonl(BytesIO(make_lines(4, invalid=(2,))), Log, stats=stats))
+    error = results[2]
+    assert isinstance(error, ErrorRecord)
+    assert error.line_number == 3
+    assert error.errors[0]["loc"] == ("address",)
+    assert stats.invalid == 1
+    assert stats.valid == 3
+
+
+def test_validate_jsonl_executor():
+    data = make_lines(50, invalid=(10, 40))
+    expected = list(validate_jsonl(BytesIO(data), Log))
+    with ThreadPoolExecutor(2) as executor:
+        actual = list(validate_jsonl(BytesIO(data), Log, executor=executor, batch_size=3))
+        bounded = list(
+            validate_jsonl(BytesIO(data), Log, executor=executor, batch_size=3, max_pending=1)
+        )
+
+    assert actual == bounded == expected
+
+
+def test_validate_jsonl_executor_close():
+    class LazyExecutor(Executor):
+        # Only runs the first batch; the others stay pending.
+        def __init__(self):
+            self.futures: list[Future] = []
+
+        def submit(self, fn, /, *args, **kwargs):
+            future: Future = Future()
+            if not self.futures:
+                future.set_result(fn(*args, **kwargs))
+
+            self.futures.append(future)
+            return future
+
+    executor = LazyExecutor()
+    data = BytesIO(make_lines(10))
+    results = cast(
+        Generator, validate_jsonl(data, Log, executor=executor, batch_size=1, max_pending=4)
+    )
+    assert next(results).address == CHECKSUM_ADDRESS
+    results.close()
+    assert len(executor.futures) == 4
+    assert all(future.cancelled() for future in executor.futures[1:])
+
+
+@pytest.mark.parametrize("chunk_size", (1, 3, 64))
+def test_validate_jsonl_long_lines(chunk_size):
+    # A blank line, a line spanning many chunks, another blank line and a short line.
+    data = b'\n"0x' + b"ab" * 100 + b'"\n\n"0x"\n'
+    results = list(validate_jsonl(BytesIO(data), HexBytes, chunk_size=chunk_size))
+    assert results == [b"\xab" * 100, b""]
+
+    results = list(validate_jsonl(BytesIO(data + b"foo"), HexBytes, chunk_size=chunk_size))
+    assert isinstance(results[-1], ErrorRecord)
+    assert results[-1].line_number == 5
+    assert results[-1].line == b"foo"